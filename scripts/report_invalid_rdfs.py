@@ -4,7 +4,7 @@ from typing import Literal
 
 from typing_extensions import assert_never
 
-from bioimageio.spec import load_description_and_validate_format_only
+from bioimageio.spec import validate_many
 
 # from tests.test_bioimageio_collection import (
 #     KNOWN_INVALID,
@@ -231,8 +231,8 @@ def main(output: Path, limit: int, version: Literal["discover", "latest"]):
 
     invalid = [RDF_BASE_URL + k for k in sorted(invalid)[:limit]]
 
-    summaries = [load_description_and_validate_format_only(rdf) for rdf in invalid]
-    formatted = [s.format() for s in summaries]
+    summaries = dict(validate_many(invalid, format_version=version))
+    formatted = [summaries[rdf].format() for rdf in invalid]
     out = "\n\n".join(formatted)
     _ = output.write_text(out, encoding="utf-8")
     print(out)
@@ -17,6 +17,7 @@ logger.disable("bioimageio.spec")
 
 from . import _version
 from . import application as application
+from . import cache as cache
 from . import common as common
 from . import conda_env as conda_env
 from . import dataset as dataset
@@ -28,21 +29,29 @@ from . import utils as utils
 from ._description import LatestResourceDescr as LatestResourceDescr
 from ._description import ResourceDescr as ResourceDescr
 from ._description import SpecificResourceDescr as SpecificResourceDescr
+from ._description import abuild_description as abuild_description
 from ._description import build_description as build_description
 from ._description import dump_description as dump_description
+from ._description import peek_content as peek_content
 from ._description import validate_format as validate_format
 from ._get_conda_env import get_conda_env as get_conda_env
 from ._internal import common_nodes, validation_context
 from ._internal import settings as settings
+from ._io import aload_dataset_description as aload_dataset_description
+from ._io import aload_description as aload_description
+from ._io import aload_model_description as aload_model_description
 from ._io import load_dataset_description as load_dataset_description
 from ._io import load_description as load_description
 from ._io import (
     load_description_and_validate_format_only as load_description_and_validate_format_only,
 )
 from ._io import load_model_description as load_model_description
+from ._io import peek_description as peek_description
 from ._io import save_bioimageio_yaml_only as save_bioimageio_yaml_only
 from ._io import update_format as update_format
 from ._io import update_hashes as update_hashes
+from ._mirror import mirror_collection as mirror_collection
+from ._package import asave_bioimageio_package as asave_bioimageio_package
 from ._package import get_resource_package_content as get_resource_package_content
 from ._package import save_bioimageio_package as save_bioimageio_package
 from ._package import (
@@ -55,6 +64,7 @@ from ._pretty_validation_errors import (
     PRETTY_VALIDATION_ERRORS_IN_IPYNB_ENABLED as PRETTY_VALIDATION_ERRORS_IN_IPYNB_ENABLED,
 )
 from ._upload import upload as upload
+from ._validate_many import validate_many as validate_many
 
 __version__ = _version.VERSION
 
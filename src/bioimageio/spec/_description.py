@@ -1,15 +1,36 @@
 from types import MappingProxyType
-from typing import Any, Literal, Optional, TypeVar, Union, overload
+from typing import (
+    Any,
+    Callable,
+    Dict,
+    Literal,
+    Optional,
+    Sequence,
+    Tuple,
+    Type,
+    TypeVar,
+    Union,
+    overload,
+)
 
-from pydantic import Discriminator
+from exceptiongroup import ExceptionGroup
+from loguru import logger
+from pydantic import BaseModel, ConfigDict, Discriminator, create_model
 from typing_extensions import Annotated
 
 from bioimageio.spec._internal.validation_context import ValidationContext
 
 from ._description_impl import DISCOVER, build_description_impl, get_rd_class_impl
-from ._internal.common_nodes import InvalidDescr
-from ._internal.io import BioimageioYamlContent, BioimageioYamlContentView
+from ._internal.common_nodes import InvalidDescr, ResourceDescrBase
+from ._internal.io import (
+    BioimageioYamlContent,
+    BioimageioYamlContentView,
+    apopulate_cache,
+    deepcopy_yaml_value,
+    extract_file_descrs,
+)
 from ._internal.types import FormatVersionPlaceholder
+from ._internal.utils import cache, to_thread
 from ._internal.validation_context import get_validation_context
 from .application import (
     AnyApplicationDescr,
@@ -208,6 +229,132 @@ def build_description(
     )
 
 
+@overload
+async def abuild_description(
+    content: BioimageioYamlContentView,
+    /,
+    *,
+    context: Optional[ValidationContext] = None,
+    format_version: Literal["latest"],
+) -> Union[LatestResourceDescr, InvalidDescr]: ...
+
+
+@overload
+async def abuild_description(
+    content: BioimageioYamlContentView,
+    /,
+    *,
+    context: Optional[ValidationContext] = None,
+    format_version: Union[FormatVersionPlaceholder, str] = DISCOVER,
+) -> Union[ResourceDescr, InvalidDescr]: ...
+
+
+async def abuild_description(
+    content: BioimageioYamlContentView,
+    /,
+    *,
+    context: Optional[ValidationContext] = None,
+    format_version: Union[FormatVersionPlaceholder, str] = DISCOVER,
+) -> Union[ResourceDescr, InvalidDescr]:
+    """Async counterpart of `build_description`.
+
+    Referenced files are downloaded concurrently without blocking the event loop.
+    The validation itself runs in a worker thread.
+    """
+    context = context or get_validation_context()
+    if context.perform_io_checks:
+        with context:
+            file_descrs = extract_file_descrs({k: v for k, v in content.items()})
+            try:
+                await apopulate_cache(file_descrs)
+            except ExceptionGroup as e:
+                # failing files are reported by the validation itself
+                logger.warning("{}", e)
+
+    return await to_thread(
+        build_description, content, context=context, format_version=format_version
+    )
+
+
+@cache
+def _get_before_model_validators(
+    rd_class: Type[ResourceDescrBase],
+) -> Tuple[Callable[[Any], Any], ...]:
+    """model validators with mode 'before' of **rd_class** in order of execution"""
+    return tuple(
+        d.func
+        for d in reversed(
+            list(rd_class.__pydantic_decorators__.model_validators.values())
+        )
+        if d.info.mode == "before"
+    )
+
+
+@cache
+def _get_fields_model(
+    rd_class: Type[ResourceDescrBase], fields: Tuple[str, ...]
+) -> Type[BaseModel]:
+    for name in fields:
+        if name not in rd_class.model_fields:
+            raise ValueError(f"'{name}' is not a field of {rd_class.__name__}")
+
+    field_definitions: Dict[str, Any] = {
+        name: (rd_class.model_fields[name].annotation, rd_class.model_fields[name])
+        for name in fields
+    }
+    return create_model(
+        f"{rd_class.__name__}Fields",
+        __config__=ConfigDict(rd_class.model_config, extra="ignore"),
+        **field_definitions,
+    )
+
+
+def peek_content(
+    content: BioimageioYamlContentView,
+    /,
+    fields: Sequence[str],
+    *,
+    context: Optional[ValidationContext] = None,
+) -> Dict[str, Any]:
+    """Validate only the requested **fields** of an RDF's content.
+
+    Unlike `build_description` this does not validate the whole description.
+    Use `peek_description` to peek at a rdf.yaml file or bioimage.io zip-package.
+
+    The requested fields are validated as specified by the description class
+    of the RDF's type and major.minor format version (without conversion
+    to another major.minor format version).
+    File io checks are not performed.
+
+    Args:
+        content: loaded rdf.yaml file (loaded with YAML, not bioimageio.spec)
+        fields: names of the fields to validate, e.g. ["name", "tags"]
+        context: validation context to use during validation
+
+    Returns:
+        The validated values of the requested **fields**.
+
+    Raises:
+        ValueError: if a requested field does not exist for the RDF's type and
+            format version
+        pydantic.ValidationError: if any requested field is invalid
+    """
+    context = context or get_validation_context()
+    with context.replace(perform_io_checks=False, log_warnings=False):
+        rd_class = _get_rd_class(
+            content.get("type"), content.get("format_version"), True
+        )
+        fields_model = _get_fields_model(rd_class, tuple(fields))
+        # apply model level preprocessing, e.g. updating an older patch version
+        data: Any = deepcopy_yaml_value(content)
+        for preprocess in _get_before_model_validators(rd_class):
+            data = preprocess(data)
+
+        peeked = fields_model.model_validate(data)
+
+    return {name: getattr(peeked, name) for name in fields}
+
+
 def validate_format(
     data: BioimageioYamlContent,
     /,
@@ -1,15 +1,31 @@
+import asyncio
 import os
 from functools import cached_property
 from pathlib import Path
-from typing import Optional, Union
+from typing import (
+    Any,
+    AsyncGenerator,
+    Callable,
+    Dict,
+    Literal,
+    Optional,
+    Tuple,
+    Union,
+    cast,
+)
+from urllib.parse import urlsplit
+from urllib.request import url2pathname
+from weakref import WeakKeyDictionary
 
+import httpx
 import platformdirs
 from genericache import DiskCache
 from genericache.digest import UrlDigest
-from pydantic import Field, field_validator
+from pydantic import Field, PrivateAttr, field_validator
 from pydantic_settings import BaseSettings, SettingsConfigDict
 from typing_extensions import Annotated
 
+from .http_transport import AsyncHostLimitedTransport, HostLimitedTransport
 from .root_url import RootHttpUrl
 
 
@@ -22,6 +38,14 @@ class Settings(
         env_prefix="BIOIMAGEIO_", env_file=".env", env_file_encoding="utf-8"
     )
 
+    _async_http_clients: "WeakKeyDictionary[asyncio.AbstractEventLoop, Tuple[httpx.AsyncClient, AsyncGenerator[None, None]]]" = PrivateAttr(
+        default_factory=cast(
+            "Callable[[], WeakKeyDictionary[asyncio.AbstractEventLoop, Tuple[httpx.AsyncClient, AsyncGenerator[None, None]]]]",
+            WeakKeyDictionary,
+        )
+    )
+    """async http clients (and their closing async generators) by event loop"""
+
     allow_pickle: bool = False
     """Sets the `allow_pickle` argument for `numpy.load()`"""
 
@@ -33,6 +57,27 @@ class Settings(
     def _expand_user(cls, value: Path):
         return Path(os.path.expanduser(str(value)))
 
+    cache_eviction_policy: Literal["lru", "lfu"] = "lru"
+    """Order in which downloaded files are evicted from `cache_path`
+    to meet `cache_max_bytes`:
+    - "lru": least recently used files first
+    - "lfu": least frequently used files first
+    """
+
+    cache_max_age: Optional[Annotated[float, Field(gt=0)]] = None
+    """Time in seconds after which downloaded files that have not been accessed
+    are evicted from `cache_path` (checked whenever a file is downloaded).
+
+    See also `bioimageio.spec.cache.prune`."""
+
+    cache_max_bytes: Optional[Annotated[int, Field(ge=0)]] = None
+    """Maximal total size of downloaded files in `cache_path` in bytes.
+    Exceeding downloaded files are evicted following `cache_eviction_policy`
+    whenever a file is downloaded.
+    Files in use (see `bioimageio.spec.cache.pin`) are not evicted.
+
+    See also `bioimageio.spec.cache.prune`."""
+
     CI: Annotated[Union[bool, str], Field(alias="CI")] = False
     """Wether or not the execution happens in a continuous integration (CI) environment."""
 
@@ -47,12 +92,45 @@ class Settings(
     - If this endpoints fails, we fall back to `id_map`.
     """
 
+    download_retries: Annotated[int, Field(ge=0)] = 5
+    """Number of times an interrupted download is resumed with a range request
+    (if supported by the server).
+
+    Partially downloaded files are kept in `cache_path`,
+    such that downloads may also be resumed by a later process."""
+
+    download_segments: Annotated[int, Field(ge=1)] = 1
+    """Maximum number of byte ranges (segments) a large file is downloaded in parallel
+    (if supported by the server)."""
+
+    file_hash_index: bool = False
+    """Keep an index of SHA256 values of local files in `cache_path`
+    to avoid rehashing unchanged files.
+
+    Files are considered unchanged if their absolute path, size,
+    modification time and inode did not change."""
+
     github_username: Optional[str] = None
     """GitHub username for API requests"""
 
     github_token: Optional[str] = None
     """GitHub token for API requests"""
 
+    github_user_negative_ttl: Annotated[float, Field(ge=0)] = 24 * 60 * 60
+    """Time in seconds for which an invalid GitHub user is cached in `cache_path`."""
+
+    github_user_ttl: Annotated[float, Field(ge=0)] = 30 * 24 * 60 * 60
+    """Time in seconds for which a verified GitHub user is cached in `cache_path`."""
+
+    http2: bool = False
+    """Use HTTP/2 for http requests (requires the `h2` package)."""
+
+    http_max_connections: Annotated[int, Field(ge=1)] = 100
+    """Maximum number of pooled http connections."""
+
+    http_max_connections_per_host: Annotated[int, Field(ge=1)] = 6
+    """Maximum number of concurrent http requests to the same host."""
+
     http_timeout: float = 10.0
     """Timeout in seconds for http requests."""
 
@@ -97,6 +175,41 @@ class Settings(
     log_warnings: bool = True
     """Log validation warnings to console."""
 
+    max_concurrent_downloads: Annotated[int, Field(ge=1)] = 8
+    """Maximum number of files downloaded concurrently,
+    e.g. when prefetching all files referenced by a resource description."""
+
+    max_concurrent_downloads_per_host: Annotated[int, Field(ge=1)] = 4
+    """Maximum number of concurrent downloads from the same host."""
+
+    mirror: Optional[Path] = None
+    """Local directory (or 'file://' URL) mirroring remote files,
+    e.g. for compute nodes without internet access.
+
+    Remote files are read from '<mirror>/<host>/<path>' if they exist there
+    (see also `mirror_rules`); this includes bioimageio.yaml files resolved with
+    `collection_http_pattern` or `huggingface_http_pattern` and the `id_map`.
+    Mirrored URLs are considered valid without checking them online.
+    Use `bioimageio.spec.mirror_collection` to populate a mirror."""
+
+    @field_validator("mirror", mode="before")
+    @classmethod
+    def _file_url_to_path(cls, value: Any):
+        if isinstance(value, str) and value.startswith("file://"):
+            return url2pathname(urlsplit(value).path)
+
+        return value
+
+    mirror_rules: Dict[str, str] = {}
+    """Rules to map URL prefixes to local directories (or 'file://' URLs),
+    e.g. `{"https://zenodo.org/records/": "/data/zenodo"}`.
+    Relative directories are resolved against `mirror`.
+    The longest matching prefix takes precedence over the default mirror layout."""
+
+    package_compression_workers: Optional[Annotated[int, Field(ge=1)]] = None
+    """Number of threads compressing members of zip packages concurrently
+    (defaults to the number of CPUs)."""
+
     perform_io_checks: bool = True
     """Wether or not to perform validation that requires file io,
     e.g. downloading a remote files.
@@ -112,9 +225,38 @@ class Settings(
     Set this flag to False to avoid this potential security risk
     and disallow loading draft versions."""
 
+    url_check_negative_ttl: Annotated[float, Field(ge=0)] = 60 * 60
+    """Time in seconds for which a failed URL check is cached in `cache_path`."""
+
+    url_check_ttl: Annotated[float, Field(ge=0)] = 7 * 24 * 60 * 60
+    """Time in seconds for which a successful URL check is cached in `cache_path`.
+
+    Expired entries are revalidated with conditional requests if possible."""
+
     user_agent: Optional[str] = None
     """user agent for http requests"""
 
+    validation_cache: bool = False
+    """Cache validation results of loaded resource descriptions in `cache_path`.
+
+    Cached results are reused for identical bioimageio.yaml content, referenced files,
+    bioimageio.spec version, validation context and settings affecting validation
+    (e.g. `id_map` and `allow_pickle`).
+    Note:
+    - Cached descriptions are stored as JSON and revalidated without io checks.
+    - Availability of URLs is not rechecked for cached results.
+    """
+
+    yaml_loader: Literal["auto", "ruyaml"] = "auto"
+    """How to load YAML files, e.g. bioimageio.yaml files:
+    - "auto": Load JSON content with `json`
+      and parse other content with libyaml (if PyYAML with libyaml is installed).
+      Falls back to "ruyaml".
+    - "ruyaml": Use the pure Python `ruyaml` YAML loader.
+
+    All loaders yield the same content (following YAML 1.2).
+    """
+
     @cached_property
     def disk_cache(self):
         cache = DiskCache[RootHttpUrl].create(
@@ -124,6 +266,64 @@ class Settings(
         )
         return cache
 
+    @property
+    def http_headers(self) -> Dict[str, str]:
+        """default headers for http requests"""
+        headers: Dict[str, str] = {}
+        if self.user_agent is not None:
+            headers["User-Agent"] = self.user_agent
+        elif self.CI:
+            headers["User-Agent"] = "ci"
+
+        return headers
+
+    @cached_property
+    def http_client(self) -> httpx.Client:
+        """Shared http client with connection pooling.
+
+        Note:
+            Created on first use with the http settings at that time.
+        """
+        return httpx.Client(
+            headers=self.http_headers,
+            timeout=self.http_timeout,
+            follow_redirects=True,
+            transport=HostLimitedTransport(
+                httpx.HTTPTransport(
+                    http2=self.http2,
+                    limits=httpx.Limits(max_connections=self.http_max_connections),
+                ),
+                max_per_host=self.http_max_connections_per_host,
+            ),
+        )
+
+    def get_async_http_client(self) -> httpx.AsyncClient:
+        """Shared async http client with connection pooling for the running event loop.
+
+        Note:
+            Created on first use (per event loop) with the http settings at that time.
+            Closed when the event loop shuts down its async generators,
+            e.g. at the end of `asyncio.run`.
+        """
+        loop = asyncio.get_running_loop()
+        client, _ = self._async_http_clients.get(loop, (None, None))
+        if client is None or client.is_closed:
+            client = httpx.AsyncClient(
+                headers=self.http_headers,
+                timeout=self.http_timeout,
+                follow_redirects=True,
+                transport=AsyncHostLimitedTransport(
+                    httpx.AsyncHTTPTransport(
+                        http2=self.http2,
+                        limits=httpx.Limits(max_connections=self.http_max_connections),
+                    ),
+                    max_per_host=self.http_max_connections_per_host,
+                ),
+            )
+            self._async_http_clients[loop] = (client, _close_on_shutdown(client))
+
+        return client
+
     @property
     def github_auth(self):
         if self.github_username is None or self.github_token is None:
@@ -132,5 +332,32 @@ class Settings(
             return (self.github_username, self.github_token)
 
 
+async def _aclose_when_finalized(
+    client: httpx.AsyncClient,
+) -> AsyncGenerator[None, None]:
+    try:
+        yield
+    finally:
+        await client.aclose()
+
+
+def _close_on_shutdown(client: httpx.AsyncClient) -> AsyncGenerator[None, None]:
+    """close **client** when the running event loop shuts down its async generators
+    (see `asyncio.AbstractEventLoop.shutdown_asyncgens`)
+
+    Returns:
+        An async generator to keep alive until the event loop shuts down.
+    """
+    closer = _aclose_when_finalized(client)
+    # advance the generator to its `yield` (without awaiting anything),
+    # which registers it with the running event loop
+    try:
+        _ = closer.asend(None).send(None)
+    except StopIteration:
+        pass
+
+    return closer
+
+
 settings = Settings()
 """parsed environment variables for bioimageio.spec"""
@@ -16,14 +16,17 @@ from typing import (
     Mapping,
     Optional,
     Protocol,
+    Set,
     Tuple,
     Union,
 )
 from zipfile import ZipFile
 
 import pydantic
+from exceptiongroup import ExceptionGroup
+from loguru import logger
 from pydantic import DirectoryPath, PrivateAttr, model_validator
-from pydantic_core import PydanticUndefined
+from pydantic_core import InitErrorDetails, PydanticCustomError, PydanticUndefined
 from typing_extensions import Self
 
 from ..summary import (
@@ -33,7 +36,7 @@ from ..summary import (
     ValidationSummary,
     WarningEntry,
 )
-from .field_warning import issue_warning
+from .field_warning import CollectedWarning, Loc, collect_warnings, issue_warning
 from .io import (
     BioimageioYamlContent,
     BioimageioYamlContentView,
@@ -41,6 +44,7 @@ from .io import (
     deepcopy_yaml_value,
     extract_file_descrs,
     populate_cache,
+    populate_known_files,
 )
 from .io_basics import BIOIMAGEIO_YAML, FileName
 from .io_utils import write_content_to_zip
@@ -50,7 +54,7 @@ from .root_url import RootHttpUrl
 from .type_guards import is_dict
 from .utils import get_format_version_tuple
 from .validation_context import ValidationContext, get_validation_context
-from .warning_levels import ALERT, ERROR, INFO
+from .warning_levels import ALERT, ERROR, INFO, WarningSeverity
 
 
 class NodeWithExplicitlySetFields(Node):
@@ -220,19 +224,19 @@ class ResourceDescrBase(
         context = context or get_validation_context()
         if context.perform_io_checks:
             file_descrs = extract_file_descrs({k: v for k, v in data.items()})
-            populate_cache(file_descrs)  # TODO: add progress bar
+            try:
+                with context:
+                    populate_cache(file_descrs)
+            except ExceptionGroup as e:
+                # failing files are reported by the validation itself
+                logger.warning("{}", e)
+
+            with context:
+                populate_known_files(file_descrs)
 
         with context.replace(log_warnings=context.warning_level <= INFO):
             rd, errors, val_warnings = cls._load_impl(deepcopy_yaml_value(data))
 
-        if context.warning_level > INFO:
-            all_warnings_context = context.replace(
-                warning_level=INFO, log_warnings=False, raise_errors=False
-            )
-            # raise all validation warnings by reloading
-            with all_warnings_context:
-                _, _, val_warnings = cls._load_impl(deepcopy_yaml_value(data))
-
         format_status = "failed" if errors else "passed"
         rd.validation_summary.add_detail(
             ValidationDetail(
@@ -280,8 +284,12 @@ class ResourceDescrBase(
         val_warnings: List[WarningEntry] = []
 
         context = get_validation_context()
+        collected: List[CollectedWarning] = []
         try:
-            rd = cls.model_validate(data)
+            # validate in a single pass: warnings are recorded instead of raised
+            # and checked against the requested warning level afterwards
+            with context.replace(warning_level=ERROR), collect_warnings() as collected:
+                rd = cls.model_validate(data)
         except pydantic.ValidationError as e:
             for ee in e.errors(include_url=False):
                 if (severity := ee.get("ctx", {}).get("severity", ERROR)) < ERROR:
@@ -305,8 +313,8 @@ class ResourceDescrBase(
                     ErrorEntry(
                         loc=(),
                         msg=(
-                            f"Encountered {len(val_warnings)} more severe than warning"
-                            " level "
+                            f"Encountered {len(val_warnings)} warnings more severe than"
+                            " warning level "
                             f"'{WARNING_LEVEL_TO_NAME[context.warning_level]}'"
                         ),
                         type="severe_warnings",
@@ -330,6 +338,49 @@ class ResourceDescrBase(
                 )
             )
 
+        seen: Set[Tuple[Loc, str, WarningSeverity]] = set()
+        severe: List[CollectedWarning] = []
+        for w in collected:
+            if (key := (w.loc, w.msg, w.severity)) in seen:
+                continue  # e.g. issued for multiple union members
+
+            seen.add(key)
+            val_warnings.append(
+                WarningEntry(loc=w.loc, msg=w.msg, type="warning", severity=w.severity)
+            )
+            if w.severity >= context.warning_level:
+                severe.append(w)
+
+        if severe and rd is not None:
+            if context.raise_errors:
+                raise pydantic.ValidationError.from_exception_data(
+                    cls.__name__,
+                    [
+                        InitErrorDetails(
+                            type=PydanticCustomError(
+                                "warning",
+                                "{msg}",
+                                {"msg": w.msg, "severity": w.severity},
+                            ),
+                            loc=w.loc,
+                            input=w.value,
+                        )
+                        for w in severe
+                    ],
+                )
+
+            val_errors.append(
+                ErrorEntry(
+                    loc=(),
+                    msg=(
+                        f"Encountered {len(severe)} warnings more severe than warning"
+                        f" level '{WARNING_LEVEL_TO_NAME[context.warning_level]}'"
+                    ),
+                    type="severe_warnings",
+                )
+            )
+            rd = None
+
         if rd is None:
             try:
                 rd = InvalidDescr.model_validate(data)
@@ -371,7 +422,7 @@ class ResourceDescrBase(
             )
 
         content = self.get_package_content()
-        write_content_to_zip(content, zip)
+        _ = write_content_to_zip(content, zip)
         return zip
 
     def get_package_content(
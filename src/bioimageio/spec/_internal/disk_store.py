@@ -0,0 +1,65 @@
+import hashlib
+import os
+from pathlib import Path
+from tempfile import NamedTemporaryFile
+from typing import Collection, Generic, Optional, Type, TypeVar
+
+from loguru import logger
+from pydantic import TypeAdapter
+
+T = TypeVar("T")
+
+
+class DiskStore(Generic[T]):
+    """A persistent key-value store with one JSON file per key.
+
+    Writes are atomic, such that the store may be shared between processes.
+    """
+
+    def __init__(self, path: Path, value_type: Type[T]):
+        super().__init__()
+        self.path = path
+        self._adapter = TypeAdapter(value_type)
+
+    def _get_file_path(self, key: str) -> Path:
+        return self.path / f"{hashlib.sha256(key.encode('utf-8')).hexdigest()}.json"
+
+    def get(self, key: str) -> Optional[T]:
+        """get the value stored for **key** (None if not found or unreadable)"""
+        try:
+            data = self._get_file_path(key).read_bytes()
+        except FileNotFoundError:
+            return None
+
+        try:
+            return self._adapter.validate_json(data)
+        except Exception as e:
+            logger.debug("ignoring invalid entry for '{}' in {}: {}", key, self.path, e)
+            return None
+
+    def set(self, key: str, value: T):
+        """store **value** for **key**"""
+        self.path.mkdir(parents=True, exist_ok=True)
+        with NamedTemporaryFile(
+            "wb", dir=self.path, prefix=".", suffix=".tmp", delete=False
+        ) as f:
+            _ = f.write(self._adapter.dump_json(value))
+
+        os.replace(f.name, self._get_file_path(key))
+
+    def delete(self, key: str):
+        """remove the value stored for **key** (if any)"""
+        try:
+            self._get_file_path(key).unlink()
+        except FileNotFoundError:
+            pass
+
+    def retain(self, keys: Collection[str]):
+        """remove all values except those stored for **keys**"""
+        if not self.path.exists():
+            return
+
+        keep = {self._get_file_path(k).name for k in keys}
+        for file_path in self.path.glob("*.json"):
+            if file_path.name not in keep:
+                file_path.unlink(missing_ok=True)
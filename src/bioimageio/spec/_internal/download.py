@@ -0,0 +1,599 @@
+"""Resumable downloads and random access to remote files using http range requests"""
+
+import hashlib
+import io
+import os
+import shutil
+import tempfile
+import threading
+from concurrent.futures import Future, ThreadPoolExecutor
+from contextvars import copy_context
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Callable, Dict, Iterator, List, Optional, Tuple, Union
+
+import httpx
+from loguru import logger
+
+from ._settings import settings
+from .disk_store import DiskStore
+from .utils import SLOTS, cache
+
+CHUNK_SIZE = 64 * 1024
+"""size of chunks streamed from http responses"""
+
+MIN_SEGMENT_SIZE = 16 * 1024 * 1024
+"""minimal size of a segment when downloading a file in parallel segments"""
+
+REMOTE_FILE_TAIL_SIZE = 64 * 1024
+"""number of bytes requested from the end of a `RemoteFile` when opening it
+(e.g. to cover the central directory of a zip file)"""
+
+REMOTE_FILE_MIN_READAHEAD = 256 * 1024
+"""minimal number of bytes requested when reading from a `RemoteFile`"""
+
+REMOTE_FILE_MAX_READAHEAD = 64 * 1024 * 1024
+"""maximal number of bytes requested when reading sequentially from a `RemoteFile`"""
+
+
+@dataclass(frozen=True, **SLOTS)
+class PartialDownload:
+    """Metadata of a partially downloaded file in `settings.cache_path`"""
+
+    validator: str
+    """strong ETag or Last-Modified date of the downloaded resource (for `If-Range`)"""
+
+    size: int
+    """total size of the resource in bytes"""
+
+    segments: int
+    """number of segments the resource is downloaded in"""
+
+
+class IncompleteDownload(httpx.TransportError):
+    """A download could not be completed (and could not be resumed)"""
+
+
+@cache
+def _get_partial_download_store(cache_path: Path) -> DiskStore[PartialDownload]:
+    return DiskStore(cache_path / "partial_downloads", PartialDownload)
+
+
+def _get_part_paths(part_dir: Path, url: str, segments: int) -> List[Path]:
+    key = hashlib.sha256(url.encode("utf-8")).hexdigest()
+    return [part_dir / f"{key}.{i}.part" for i in range(segments)]
+
+
+def _get_segment_bounds(size: int, segments: int) -> List[Tuple[int, int]]:
+    step = -(-size // segments)
+    return [(start, min(start + step, size)) for start in range(0, size, step)]
+
+
+def _get_validator(r: httpx.Response) -> Optional[str]:
+    """get a validator for `If-Range` headers (weak ETags are not allowed)"""
+    etag = r.headers.get("etag")
+    if etag is not None and not etag.startswith("W/"):
+        return etag
+
+    return r.headers.get("last-modified")
+
+
+def _get_size(r: httpx.Response) -> Optional[int]:
+    """get the total size of the (possibly partial) response's resource"""
+    if r.status_code == 206:
+        content_range = _parse_content_range(r)
+        return None if content_range is None else content_range[1]
+
+    if r.headers.get("content-encoding", "identity") != "identity":
+        return None
+
+    try:
+        return int(r.headers["content-length"])
+    except (KeyError, ValueError):
+        return None
+
+
+def _parse_content_range(r: httpx.Response) -> Optional[Tuple[int, Optional[int]]]:
+    """parse 'Content-Range: bytes <start>-<end>/<size>' as (start, size)"""
+    value = r.headers.get("content-range", "")
+    unit, _, byte_range = value.partition(" ")
+    first_last, _, size = byte_range.partition("/")
+    first, _, _ = first_last.partition("-")
+    if unit != "bytes" or not first.isdigit():
+        return None
+
+    return int(first), int(size) if size.isdigit() else None
+
+
+def _request(url: str, headers: Dict[str, str]) -> httpx.Response:
+    client = settings.http_client
+    r = client.send(
+        client.build_request(
+            "GET",
+            url,
+            # byte ranges refer to the encoded content
+            headers={"Accept-Encoding": "identity", **headers},
+        ),
+        stream=True,
+    )
+    try:
+        _ = r.raise_for_status()
+    except Exception:
+        r.close()
+        raise
+
+    return r
+
+
+def _request_range(
+    url: str, start: int, end: Optional[int], validator: Optional[str]
+) -> Optional[httpx.Response]:
+    """request bytes [**start**, **end**) of **url**
+
+    Returns:
+        None if the server does not respond with the requested byte range,
+        e.g. if the server does not support range requests or the resource changed.
+    """
+    headers = {"Range": f"bytes={start}-{'' if end is None else end - 1}"}
+    if validator is not None:
+        headers["If-Range"] = validator
+
+    try:
+        r = _request(url, headers)
+    except httpx.HTTPStatusError as e:
+        if e.response.status_code == 416:  # range not satisfiable
+            return None
+
+        raise
+
+    content_range = _parse_content_range(r)
+    if r.status_code != 206 or content_range is None or content_range[0] != start:
+        r.close()
+        return None
+
+    return r
+
+
+def _iter_segment(
+    url: str,
+    start: int,
+    end: Optional[int],
+    *,
+    response: Optional[httpx.Response],
+    validator: Optional[str],
+    progress: Callable[[int], None],
+) -> Iterator[bytes]:
+    """Yield bytes [**start**, **end**) of **url**.
+
+    Interrupted transfers are resumed with range requests
+    up to `settings.download_retries` times.
+    """
+    pos = start
+    retries = settings.download_retries
+    while end is None or pos < end:
+        if response is None:
+            response = _request_range(url, pos, end, validator)
+            if response is None:
+                raise IncompleteDownload(
+                    f"Failed to resume download of {url} at byte {pos}"
+                    + " (the server did not respond with the requested byte range)."
+                )
+
+        # byte positions of encoded (e.g. gzip compressed) content are unknown
+        resumable = response.headers.get("content-encoding", "identity") == "identity"
+        try:
+            for chunk in response.iter_bytes(CHUNK_SIZE):
+                if resumable and end is not None and pos + len(chunk) > end:
+                    chunk = chunk[: end - pos]  # ignore surplus bytes
+
+                pos += len(chunk)
+                progress(len(chunk))
+                yield chunk
+                if end is not None and pos >= end:
+                    break
+        except httpx.TransportError as e:
+            if retries <= 0 or not resumable:
+                raise
+
+            logger.warning(
+                "Download of {} interrupted at byte {} ({}). Resuming...", url, pos, e
+            )
+        else:
+            if end is None or pos >= end or not resumable:
+                break
+
+            if retries <= 0:
+                raise IncompleteDownload(
+                    f"Download of {url} ended at byte {pos} (expected {end} bytes)."
+                )
+
+            logger.warning(
+                "Download of {} ended early at byte {}. Resuming...", url, pos
+            )
+        finally:
+            response.close()
+
+        response = None
+        retries -= 1
+
+
+def _download_part(
+    part: Path,
+    url: str,
+    start: int,
+    end: int,
+    *,
+    response: Optional[httpx.Response],
+    validator: Optional[str],
+    progress: Callable[[int], None],
+) -> Iterator[bytes]:
+    """Download bytes [**start**, **end**) of **url** appending them to **part**
+    (yielding only the newly downloaded bytes)."""
+    with part.open("ab") as f:
+        for chunk in _iter_segment(
+            url,
+            start + f.tell(),
+            end,
+            response=response,
+            validator=validator,
+            progress=progress,
+        ):
+            _ = f.write(chunk)
+            yield chunk
+
+
+def _read_part(part: Path) -> Iterator[bytes]:
+    with part.open("rb") as f:
+        while chunk := f.read(CHUNK_SIZE):
+            yield chunk
+
+
+def _write_content(dst: Path, content: Iterator[bytes]) -> Iterator[bytes]:
+    with dst.open("wb") as f:
+        for chunk in content:
+            _ = f.write(chunk)
+            yield chunk
+
+
+def _append_part(dst: Path, part: Path) -> Iterator[bytes]:
+    with dst.open("ab") as f:
+        for chunk in _read_part(part):
+            _ = f.write(chunk)
+            yield chunk
+
+
+def _get_segments(r: httpx.Response, size: Optional[int]) -> int:
+    """number of segments to download the resource of (initial) response **r** in"""
+    if (
+        size is None
+        or settings.download_segments == 1
+        or r.headers.get("accept-ranges") != "bytes"
+    ):
+        return 1
+
+    return max(1, min(settings.download_segments, size // MIN_SEGMENT_SIZE))
+
+
+def _resume(
+    url: str, store: DiskStore[PartialDownload]
+) -> Tuple[Optional[httpx.Response], Optional[PartialDownload]]:
+    """request the first missing byte range of a partial download of **url** (if any)
+
+    Returns:
+        The response to continue the download with and its partial download metadata.
+        If there is no valid partial download the metadata is None
+        and the response is either a full response or None.
+    """
+    partial = store.get(url)
+    if partial is None:
+        return None, None
+
+    part = _get_part_paths(store.path, url, partial.segments)[0]
+    start, end = _get_segment_bounds(partial.size, partial.segments)[0]
+    if part.exists():
+        start += part.stat().st_size
+
+    if start >= end:
+        # (re)download the last byte of a complete first segment,
+        # such that we can continue with a validated response
+        start = end - 1
+        with part.open("r+b") as f:
+            _ = f.truncate(start)
+
+    r = _request(
+        url, {"Range": f"bytes={start}-{end - 1}", "If-Range": partial.validator}
+    )
+    if r.status_code == 206 and _parse_content_range(r) == (start, partial.size):
+        logger.info("Resuming download of {} at byte {}", url, start)
+        return r, partial
+
+    # resource changed (or range requests are no longer supported)
+    _discard_partial(url, store, partial.segments)
+    if r.status_code == 200:
+        return r, None  # start over with the full response
+    else:
+        r.close()
+        return None, None
+
+
+def _discard_partial(url: str, store: DiskStore[PartialDownload], segments: int):
+    store.delete(url)
+    for part in _get_part_paths(store.path, url, segments):
+        part.unlink(missing_ok=True)
+
+
+def open_download(
+    url: str,
+    *,
+    keep_partial: bool,
+    progress: Callable[[int], None],
+    dst: Optional[Path] = None,
+) -> Tuple[Optional[int], Iterator[bytes]]:
+    """Request **url** and return its size (if known) and an iterator over its content.
+
+    Interrupted transfers are resumed with range requests (if the server supports them).
+    If **keep_partial** is set, downloaded bytes are kept in `settings.cache_path`
+    until the download completes, such that a later call can resume the download,
+    e.g. after the process was killed.
+    Large files are downloaded in parallel segments if `settings.download_segments` > 1.
+
+    Args:
+        url: URL to download
+        keep_partial: Keep partially downloaded content in `settings.cache_path`.
+        progress: Called with the number of newly downloaded bytes
+            (from any thread if the file is downloaded in segments).
+        dst: Write the content to **dst** while iterating over it.
+            Downloaded parts are moved to **dst** (instead of being written again),
+            so **dst** should be on the same file system as `settings.cache_path`.
+    """
+    lock = threading.Lock()
+
+    def locked_progress(n: int):
+        with lock:
+            progress(n)
+
+    store = _get_partial_download_store(settings.cache_path)
+    if keep_partial:
+        r, partial = _resume(url, store)
+    else:
+        r, partial = None, None
+
+    if r is None:
+        r = _request(url, {})
+
+    if partial is None:
+        size = _get_size(r)
+        validator = _get_validator(r)
+        segments = _get_segments(r, size)
+        if keep_partial and size and validator is not None:
+            partial = PartialDownload(validator=validator, size=size, segments=segments)
+            store.set(url, partial)
+    else:
+        size = partial.size
+        validator = partial.validator
+        segments = partial.segments
+
+    if not size or (partial is None and segments == 1):
+        # plain (in-process resumable) download
+        content = _iter_segment(
+            url,
+            0,
+            size,
+            response=r,
+            validator=validator,
+            progress=locked_progress,
+        )
+        return size, content if dst is None else _write_content(dst, content)
+
+    def iter_content() -> Iterator[bytes]:
+        if partial is None:
+            tmp_dir = Path(tempfile.mkdtemp(prefix="bioimageio_download_"))
+            parts = _get_part_paths(tmp_dir, url, segments)
+        else:
+            tmp_dir = None
+            store.path.mkdir(parents=True, exist_ok=True)
+            parts = _get_part_paths(store.path, url, segments)
+
+        bounds = _get_segment_bounds(size, segments)
+        for part in parts:
+            if part.exists():
+                locked_progress(part.stat().st_size)
+
+        executor = ThreadPoolExecutor(
+            max_workers=max(1, segments - 1),
+            thread_name_prefix="bioimageio_download_segment",
+        )
+        futures: List[Future[None]] = []
+
+        def download_segment(i: int):
+            for _ in _download_part(
+                parts[i],
+                url,
+                *bounds[i],
+                response=None,
+                validator=validator,
+                progress=locked_progress,
+            ):
+                pass
+
+        try:
+            futures.extend(
+                executor.submit(copy_context().run, download_segment, i)
+                for i in range(1, segments)
+            )
+            # stream the first segment while the others are downloaded in parallel
+            if parts[0].exists():
+                yield from _read_part(parts[0])
+
+            yield from _download_part(
+                parts[0],
+                url,
+                *bounds[0],
+                response=r,
+                validator=validator,
+                progress=locked_progress,
+            )
+            for part, future in zip(parts[1:], futures):
+                future.result()
+                if dst is None:
+                    yield from _read_part(part)
+                else:
+                    yield from _append_part(parts[0], part)
+
+            if dst is not None:
+                _ = shutil.move(parts[0], dst)
+        finally:
+            for future in futures:
+                _ = future.cancel()
+
+            executor.shutdown(wait=False)
+            r.close()
+            if tmp_dir is not None:
+                shutil.rmtree(tmp_dir, ignore_errors=True)
+
+        if partial is not None:
+            _discard_partial(url, store, segments)
+
+    return size, iter_content()
+
+
+class RemoteFile(io.RawIOBase):
+    """A seekable, read-only file object for a remote resource
+    that requests bytes on demand with http range requests.
+
+    Use `RemoteFile.open` to create a remote file.
+    The last `REMOTE_FILE_TAIL_SIZE` bytes (e.g. the central directory of a zip file)
+    and the most recently requested byte range are kept in memory.
+    The number of bytes requested at once grows
+    (up to `REMOTE_FILE_MAX_READAHEAD`) while reading sequentially.
+    """
+
+    def __init__(self, url: str, *, size: int, validator: Optional[str], tail: bytes):
+        super().__init__()
+        self.url = url
+        self.size = size
+        self._validator = validator
+        self._tail = (size - len(tail), tail)
+        self._block = self._tail
+        self._readahead = REMOTE_FILE_MIN_READAHEAD
+        self._pos = 0
+        self._lock = threading.Lock()
+
+    @classmethod
+    def open(cls, url: str) -> "Optional[RemoteFile]":
+        """Open **url** as a remote file.
+
+        Returns:
+            None if the server does not support range requests for **url**.
+        """
+        r = _request(url, {"Range": f"bytes=-{REMOTE_FILE_TAIL_SIZE}"})
+        try:
+            content_range = _parse_content_range(r)
+            if (
+                r.status_code != 206
+                or r.headers.get("content-encoding", "identity") != "identity"
+                or content_range is None
+            ):
+                return None
+
+            tail = r.read()
+        finally:
+            r.close()
+
+        start, size = content_range
+        if size is None or start + len(tail) != size:
+            return None
+
+        return cls(url, size=size, validator=_get_validator(r), tail=tail)
+
+    def readable(self) -> bool:
+        return True
+
+    def seekable(self) -> bool:
+        return True
+
+    def tell(self) -> int:
+        return self._pos
+
+    def seek(self, offset: int, whence: int = os.SEEK_SET, /) -> int:
+        if whence == os.SEEK_SET:
+            pos = offset
+        elif whence == os.SEEK_CUR:
+            pos = self._pos + offset
+        elif whence == os.SEEK_END:
+            pos = self.size + offset
+        else:
+            raise ValueError(f"invalid whence ({whence})")
+
+        if pos < 0:
+            raise ValueError(f"negative seek position {pos}")
+
+        self._pos = pos
+        return pos
+
+    def _get_cached(self, pos: int, n: int) -> Optional[bytes]:
+        """get up to **n** cached bytes starting at **pos** (if any)"""
+        for start, data in (self._block, self._tail):
+            if start <= pos < start + len(data):
+                # copy only the requested bytes of the (potentially large) block
+                return data[pos - start : pos - start + n]
+
+        return None
+
+    def _fetch(self, pos: int, n: int) -> bytes:
+        """request at least **n** bytes starting at **pos** (limited by readahead)"""
+        block_start, block_data = self._block
+        if pos == block_start + len(block_data):
+            # sequential read
+            self._readahead = min(2 * self._readahead, REMOTE_FILE_MAX_READAHEAD)
+        else:
+            self._readahead = REMOTE_FILE_MIN_READAHEAD
+
+        end = min(self.size, pos + max(n, self._readahead))
+        r = _request_range(self.url, pos, end, self._validator)
+        if r is None:
+            raise IncompleteDownload(
+                f"Failed to read bytes {pos}-{end - 1} of {self.url}"
+                + " (the server did not respond with the requested byte range)."
+            )
+
+        try:
+            data = r.read()
+        finally:
+            r.close()
+
+        if len(data) < end - pos:
+            raise IncompleteDownload(
+                f"Failed to read bytes {pos}-{end - 1} of {self.url}"
+                + f" (received {len(data)} bytes)."
+            )
+
+        data = data[: end - pos]
+        self._block = (pos, data)
+        return data
+
+    def read(self, size: Optional[int] = -1, /) -> bytes:
+        with self._lock:
+            end = self.size if size is None or size < 0 else self._pos + size
+            end = min(end, self.size)
+            chunks: List[bytes] = []
+            while self._pos < end:
+                n = end - self._pos
+                chunk = self._get_cached(self._pos, n)
+                if chunk is None:
+                    chunk = self._fetch(self._pos, n)[:n]
+
+                chunks.append(chunk)
+                self._pos += len(chunk)
+
+            return b"".join(chunks)
+
+    def readall(self) -> bytes:
+        return self.read(-1)
+
+    def readinto(  # pyright: ignore[reportIncompatibleMethodOverride]
+        self, buffer: Union[bytearray, memoryview]
+    ) -> int:
+        data = self.read(len(buffer))
+        buffer[: len(data)] = data
+        return len(data)
@@ -0,0 +1,592 @@
+"""Management of the download cache in `settings.cache_path`
+
+Downloaded files are stored by `genericache.DiskCache` with file names encoding
+the SHA256 values of their URL and content.
+We additionally record their usage (for eviction policies and statistics),
+allow to pin files that are in use and coordinate concurrent downloads.
+"""
+
+import asyncio
+import hashlib
+import itertools
+import os
+import sys
+import threading
+import time
+from contextlib import ExitStack, contextmanager
+from dataclasses import dataclass, replace
+from datetime import datetime
+from pathlib import Path
+from typing import ClassVar, Collection, Dict, Iterator, List, Optional, Set, Tuple
+from weakref import WeakKeyDictionary
+
+from filelock import FileLock, Timeout
+from genericache import CacheEntry
+from genericache.digest import ContentDigest, UrlDigest
+from loguru import logger
+from typing_extensions import Literal
+
+from ._settings import settings
+from .disk_store import DiskStore
+from .io_basics import get_sha256
+from .utils import SLOTS, cache
+
+ENTRY_PREFIX = "entry__url_"
+"""file name prefix of entries written by `genericache.DiskCache`"""
+
+ENTRY_INFIX = "_contents_"
+"""separates URL and content digests in file names of `genericache.DiskCache` entries"""
+
+
+@dataclass(frozen=True, **SLOTS)
+class CacheUsage:
+    """Recorded usage of a downloaded file"""
+
+    last_access: float
+    """time of the last access in seconds since the epoch"""
+
+    hits: int = 0
+    """number of times the file was served from the cache"""
+
+    downloads: int = 0
+    """number of times the file was downloaded"""
+
+
+@dataclass(frozen=True, **SLOTS)
+class CachedFile:
+    """A downloaded file in the cache"""
+
+    path: Path
+    url_digest: str
+    """SHA256 of the URL the file was downloaded from"""
+
+    content_digest: str
+    """SHA256 of the file content"""
+
+    size: int
+    """file size in bytes"""
+
+    created: float
+    """time of the download in seconds since the epoch"""
+
+    last_access: float
+    """time of the last (recorded) access in seconds since the epoch"""
+
+    hits: int
+    """number of times the file was served from the cache"""
+
+    downloads: int
+    """number of times the file was downloaded"""
+
+    pinned: bool
+    """The file is in use and must not be evicted."""
+
+
+@dataclass(frozen=True, **SLOTS)
+class CacheStats:
+    """Statistics of the download cache"""
+
+    path: Path
+    """cache location"""
+
+    files: List[CachedFile]
+    """downloaded files"""
+
+    total_bytes: int
+    """total size of all downloaded files in bytes"""
+
+    footprint: int
+    """total size of all files in the cache location in bytes
+    (including other cached data, e.g. URL checks)"""
+
+    hits: int
+    """number of downloads avoided by the cache"""
+
+    downloads: int
+    """number of downloads into the cache"""
+
+    @property
+    def hit_rate(self) -> Optional[float]:
+        """fraction of requests served from the cache"""
+        requests = self.hits + self.downloads
+        return None if requests == 0 else self.hits / requests
+
+
+@cache
+def _get_usage_store(cache_path: Path) -> DiskStore[CacheUsage]:
+    return DiskStore(cache_path / "download_usage", CacheUsage)
+
+
+def _get_pin_dir(cache_path: Path) -> Path:
+    return cache_path / "pinned"
+
+
+def _get_lock_dir(cache_path: Path) -> Path:
+    return cache_path / "download_locks"
+
+
+_LOCK_POLL_INTERVAL = 0.05
+"""seconds between attempts to acquire a `DownloadLock` held elsewhere"""
+
+
+def _get_entry_name(url_digest: str, content_digest: str) -> str:
+    return f"{ENTRY_PREFIX}{url_digest}{ENTRY_INFIX}{content_digest}"
+
+
+def add_entry(
+    cache_dir: Path, url_digest: UrlDigest, content_digest: ContentDigest, path: Path
+) -> CacheEntry:
+    """Move the downloaded file at **path** into the download cache at **cache_dir**
+    (as if it was downloaded by `genericache.DiskCache`).
+
+    **path** should be located on the same file system as **cache_dir**,
+    such that it is renamed instead of copied.
+    """
+    entry_path = cache_dir / _get_entry_name(str(url_digest), str(content_digest))
+    os.replace(path, entry_path)
+    return CacheEntry(
+        url_digest=url_digest,
+        content_digest=content_digest,
+        reader=entry_path.open("rb"),
+        timestamp=datetime.fromtimestamp(entry_path.stat().st_mtime),
+    )
+
+
+def record_usage(entry: CacheEntry, *, downloaded: bool):
+    """record an access of a download cache **entry** and enforce the cache limits
+
+    (see `settings.cache_max_bytes` and `settings.cache_max_age`)
+    """
+    name = _get_entry_name(str(entry.url_digest), str(entry.content_digest))
+    store = _get_usage_store(settings.cache_path)
+    usage = store.get(name) or CacheUsage(last_access=time.time())
+    store.set(
+        name,
+        replace(
+            usage,
+            last_access=time.time(),
+            hits=usage.hits + int(not downloaded),
+            downloads=usage.downloads + int(downloaded),
+        ),
+    )
+    if downloaded and (
+        settings.cache_max_bytes is not None or settings.cache_max_age is not None
+    ):
+        _ = prune(keep={str(entry.url_digest)})
+
+
+def _pid_exists(pid: int) -> bool:
+    if pid == os.getpid() or sys.platform == "win32":
+        return True  # (on Windows we cannot check without additional dependencies)
+
+    try:
+        os.kill(pid, 0)
+    except ProcessLookupError:
+        return False
+    except PermissionError:
+        return True  # process exists, but belongs to another user
+    else:
+        return True
+
+
+_CONTENT_PIN_PREFIX = "contents_"
+"""prefix of pins by content digest (instead of URL digest)"""
+
+
+def _get_pinned(cache_path: Path) -> Set[str]:
+    """get URL digests and (prefixed) content digests of pinned files
+    (removing pins of terminated processes)"""
+    pinned: Set[str] = set()
+    pin_dir = _get_pin_dir(cache_path)
+    if not pin_dir.exists():
+        return pinned
+
+    for pin in pin_dir.iterdir():
+        # pin file names: [contents_]<digest>.<counter>.<process id>
+        digest = pin.name.partition(".")[0]
+        pid = pin.suffix[1:]
+        if pid.isdigit() and not _pid_exists(int(pid)):
+            pin.unlink(missing_ok=True)
+        else:
+            pinned.add(digest)
+
+    return pinned
+
+
+_pin_counter = itertools.count()
+
+
+@contextmanager
+def pin(url: str, *, sha256: Optional[str] = None) -> Iterator[None]:
+    """Pin the cached download of **url** to protect it from eviction.
+
+    Pins are visible to other processes using the same cache location.
+
+    Args:
+        url: URL of the downloaded file
+        sha256: SHA256 value of the downloaded file.
+            A file requested with its SHA256 value may be served from a file
+            downloaded from another URL (e.g. a mirror).
+            Specify **sha256** to pin any cached file with this content.
+
+    Example:
+        >>> with pin("https://example.com/weights.pt"):
+        ...     pass  # use the downloaded weights
+    """
+    digests = [hashlib.sha256(url.encode("utf-8")).hexdigest()]
+    if sha256 is not None:
+        digests.append(f"{_CONTENT_PIN_PREFIX}{sha256.lower()}")
+
+    pin_dir = _get_pin_dir(settings.cache_path)
+    pin_dir.mkdir(parents=True, exist_ok=True)
+    pin_files = [
+        pin_dir / f"{digest}.{next(_pin_counter)}.{os.getpid()}" for digest in digests
+    ]
+    try:
+        for pin_file in pin_files:
+            pin_file.touch()
+
+        yield
+    finally:
+        for pin_file in pin_files:
+            pin_file.unlink(missing_ok=True)
+
+
+def _iter_cached_files(cache_path: Path) -> Iterator[CachedFile]:
+    if not cache_path.exists():
+        return
+
+    store = _get_usage_store(cache_path)
+    pinned = _get_pinned(cache_path)
+    for path in cache_path.iterdir():
+        name = path.name
+        if not name.startswith(ENTRY_PREFIX) or ENTRY_INFIX not in name:
+            continue
+
+        url_digest, content_digest = name[len(ENTRY_PREFIX) :].split(ENTRY_INFIX, 1)
+        try:
+            stat = path.stat()
+        except FileNotFoundError:
+            continue  # removed concurrently
+
+        usage = store.get(name) or CacheUsage(last_access=stat.st_mtime, downloads=1)
+        yield CachedFile(
+            path=path,
+            url_digest=url_digest,
+            content_digest=content_digest,
+            size=stat.st_size,
+            created=stat.st_mtime,
+            last_access=max(usage.last_access, stat.st_mtime),
+            hits=usage.hits,
+            downloads=usage.downloads,
+            pinned=url_digest in pinned
+            or f"{_CONTENT_PIN_PREFIX}{content_digest}" in pinned,
+        )
+
+
+def _get_footprint(path: Path) -> int:
+    footprint = 0
+    for root, _, file_names in os.walk(path):
+        for file_name in file_names:
+            try:
+                footprint += os.stat(os.path.join(root, file_name)).st_size
+            except OSError:
+                pass  # removed concurrently
+
+    return footprint
+
+
+def stats() -> CacheStats:
+    """Get statistics of the download cache in `settings.cache_path`."""
+    files = list(_iter_cached_files(settings.cache_path))
+    return CacheStats(
+        path=settings.cache_path,
+        files=files,
+        total_bytes=sum(f.size for f in files),
+        footprint=_get_footprint(settings.cache_path),
+        hits=sum(f.hits for f in files),
+        downloads=sum(f.downloads for f in files),
+    )
+
+
+def _remove(file: CachedFile) -> bool:
+    try:
+        file.path.unlink()
+    except FileNotFoundError:
+        pass
+    except OSError as e:  # e.g. file in use on Windows
+        logger.warning("Failed to remove {} from cache: {}", file.path, e)
+        return False
+
+    _get_usage_store(file.path.parent).delete(file.path.name)
+    return True
+
+
+def prune(
+    *,
+    max_bytes: Optional[int] = None,
+    max_age: Optional[float] = None,
+    policy: Optional[Literal["lru", "lfu"]] = None,
+    keep: Collection[str] = (),
+) -> List[CachedFile]:
+    """Evict downloaded files from the cache.
+
+    Pinned files are never evicted.
+
+    Args:
+        max_bytes: Evict files until the cache holds at most this many bytes.
+            Defaults to `settings.cache_max_bytes`.
+        max_age: Evict files that have not been accessed for this many seconds.
+            Defaults to `settings.cache_max_age`.
+        policy: Order in which files are evicted to meet **max_bytes**:
+            "lru" (least recently used first) or
+            "lfu" (least frequently used first).
+            Defaults to `settings.cache_eviction_policy`.
+        keep: URL digests of files not to evict (in addition to pinned files).
+
+    Returns:
+        The evicted files.
+    """
+    max_bytes = settings.cache_max_bytes if max_bytes is None else max_bytes
+    max_age = settings.cache_max_age if max_age is None else max_age
+    policy = settings.cache_eviction_policy if policy is None else policy
+
+    files = list(_iter_cached_files(settings.cache_path))
+    total_bytes = sum(f.size for f in files)
+    candidates = [f for f in files if not f.pinned and f.url_digest not in keep]
+    if policy == "lru":
+        candidates.sort(key=lambda f: f.last_access)
+    elif policy == "lfu":
+        candidates.sort(key=lambda f: (f.hits + f.downloads, f.last_access))
+    else:
+        raise ValueError(f"Unknown eviction policy '{policy}'")
+
+    now = time.time()
+    evicted: List[CachedFile] = []
+    for f in candidates:
+        if (max_age is None or now - f.last_access <= max_age) and (
+            max_bytes is None or total_bytes <= max_bytes
+        ):
+            continue
+
+        if _remove(f):
+            evicted.append(f)
+            total_bytes -= f.size
+
+    if evicted:
+        logger.info(
+            "Evicted {} file(s) ({} bytes) from {}",
+            len(evicted),
+            sum(f.size for f in evicted),
+            settings.cache_path,
+        )
+
+    # remove usage records of files that were removed otherwise
+    evicted_names = {f.path.name for f in evicted}
+    _get_usage_store(settings.cache_path).retain(
+        {f.path.name for f in files if f.path.name not in evicted_names}
+    )
+    _remove_unused_locks(settings.cache_path)
+
+    return evicted
+
+
+def _remove_unused_locks(cache_path: Path):
+    """remove lock files of `DownloadLock`s that are not held"""
+    lock_dir = _get_lock_dir(cache_path)
+    if not lock_dir.exists():
+        return
+
+    for path in lock_dir.glob("*.lock"):
+        lock = FileLock(path, thread_local=False)
+        try:
+            lock.acquire(timeout=0)  # pyright: ignore[reportUnusedCallResult]
+        except Timeout:
+            continue  # in use
+
+        try:
+            # removed while held, such that `DownloadLock`s that opened it
+            # in the meantime notice its removal after acquiring it
+            path.unlink()
+        except OSError:
+            pass  # e.g. removed concurrently or (on Windows) opened elsewhere
+        finally:
+            lock.release()
+
+
+def verify(*, remove: bool = True) -> List[CachedFile]:
+    """Verify the content of all downloaded files against their SHA256 value.
+
+    Args:
+        remove: Remove corrupted files from the cache (unless they are pinned).
+
+    Returns:
+        The corrupted files.
+    """
+    corrupted: List[CachedFile] = []
+    for f in _iter_cached_files(settings.cache_path):
+        try:
+            actual = get_sha256(f.path)
+        except FileNotFoundError:
+            continue  # removed concurrently
+
+        if actual == f.content_digest:
+            continue
+
+        logger.warning("Corrupted file in cache: {}", f.path)
+        corrupted.append(f)
+        if remove and not f.pinned:
+            _ = _remove(f)
+
+    return corrupted
+
+
+_AsyncLockUsers = Tuple[asyncio.Lock, int]
+
+
+class DownloadLock:
+    """A lock to download a file (identified by **key**) only once at a time
+    across threads, async tasks and (if **across_processes**) processes
+    sharing `settings.cache_path`.
+
+    Late arrivals wait for the download in flight
+    (and should check the cache for its result after acquiring the lock).
+    """
+
+    _thread_locks: ClassVar[Dict[str, Tuple[threading.Lock, int]]] = {}
+    """in-process locks and their number of users by key"""
+
+    _async_locks: ClassVar[
+        "WeakKeyDictionary[asyncio.AbstractEventLoop, Dict[str, _AsyncLockUsers]]"
+    ] = WeakKeyDictionary()
+    """per event loop locks and their number of users by key"""
+
+    _thread_locks_lock: ClassVar[threading.Lock] = threading.Lock()
+
+    def __init__(self, key: str, *, across_processes: bool = True):
+        super().__init__()
+        self.key = key
+        self._async_lock: Optional[asyncio.Lock] = None
+        if across_processes:
+            lock_dir = _get_lock_dir(settings.cache_path)
+            lock_dir.mkdir(parents=True, exist_ok=True)
+            # not thread local, such that it may be released from another thread
+            self._file_lock: Optional[FileLock] = FileLock(
+                lock_dir / f"{key}.lock", thread_local=False
+            )
+        else:
+            self._file_lock = None
+
+    def _get_thread_lock(self, users_delta: int) -> threading.Lock:
+        with self._thread_locks_lock:
+            lock, users = self._thread_locks.get(self.key, (threading.Lock(), 0))
+            users += users_delta
+            if users > 0:
+                self._thread_locks[self.key] = (lock, users)
+            else:
+                del self._thread_locks[self.key]
+
+        return lock
+
+    def _get_async_lock(self, users_delta: int) -> asyncio.Lock:
+        loop = asyncio.get_running_loop()
+        with self._thread_locks_lock:
+            locks = self._async_locks.setdefault(loop, {})
+            lock, users = locks.get(self.key) or (asyncio.Lock(), 0)
+            users += users_delta
+            if users > 0:
+                locks[self.key] = (lock, users)
+            else:
+                del locks[self.key]
+
+        return lock
+
+    def _try_acquire_file_lock(self) -> bool:
+        if self._file_lock is None:
+            return True
+
+        try:
+            self._file_lock.acquire(  # pyright: ignore[reportUnusedCallResult]
+                timeout=0
+            )
+        except Timeout:
+            return False
+
+        if not os.path.exists(self._file_lock.lock_file):
+            # lock file was removed by `prune` while we were acquiring it
+            self._file_lock.release()
+            return False
+
+        return True
+
+    def acquire(self) -> bool:
+        """acquire the lock (blocking)
+
+        Returns:
+            True if the lock was held by another thread or process
+            (that may have completed the download in the meantime).
+        """
+        thread_lock = self._get_thread_lock(+1)
+        contended = not thread_lock.acquire(blocking=False)
+        if contended:
+            _ = thread_lock.acquire()
+
+        try:
+            while not self._try_acquire_file_lock():
+                contended = True
+                time.sleep(_LOCK_POLL_INTERVAL)
+        except BaseException:
+            self._release_thread_lock()
+            raise
+
+        return contended
+
+    async def aacquire(self) -> bool:
+        """acquire the lock without blocking the event loop (or a worker thread)
+
+        Returns:
+            True if the lock was held by another task, thread or process
+            (that may have completed the download in the meantime).
+        """
+        with ExitStack() as rollback:
+            async_lock = self._get_async_lock(+1)
+            _ = rollback.callback(self._get_async_lock, -1)
+            contended = async_lock.locked()
+            _ = await async_lock.acquire()
+            _ = rollback.callback(async_lock.release)
+
+            # threads and processes are polled,
+            # as waiting for them would block (a thread of) the event loop
+            thread_lock = self._get_thread_lock(+1)
+            _ = rollback.callback(self._get_thread_lock, -1)
+            while not thread_lock.acquire(blocking=False):
+                contended = True
+                await asyncio.sleep(_LOCK_POLL_INTERVAL)
+
+            _ = rollback.callback(thread_lock.release)
+            while not self._try_acquire_file_lock():
+                contended = True
+                await asyncio.sleep(_LOCK_POLL_INTERVAL)
+
+            _ = rollback.pop_all()
+
+        self._async_lock = async_lock
+        return contended
+
+    def release(self):
+        """release the lock
+
+        (A lock acquired with `aacquire` needs to be released in its event loop.)
+        """
+        try:
+            if self._file_lock is not None:
+                self._file_lock.release()
+        finally:
+            self._release_thread_lock()
+            if self._async_lock is not None:
+                self._async_lock.release()
+                self._async_lock = None
+                _ = self._get_async_lock(-1)
+
+    def _release_thread_lock(self):
+        self._get_thread_lock(-1).release()
@@ -11,9 +11,13 @@ from typing import (
 
 import httpx
 
-from ._settings import settings
-from .constants import KNOWN_GITHUB_USERS, KNOWN_INVALID_GITHUB_USERS
 from .field_warning import issue_warning
+from .github_users import (
+    get_known_github_user,
+    is_rate_limited,
+    record_github_user,
+    request_github_user,
+)
 from .type_guards import is_mapping, is_sequence, is_tuple
 from .validation_context import get_validation_context
 
@@ -57,43 +61,52 @@ def validate_unique_entries(seq: Sequence[Hashable]):
     return seq
 
 
+def hotfix_github_user(username: str) -> str:
+    """replace known erroneous GitHub user names"""
+    if username == "Constantin Pape":
+        return "constantinpape"
+
+    return username
+
+
 def validate_github_user(
     username: str, hotfix_known_errorenous_names: bool = True
 ) -> str:
     if hotfix_known_errorenous_names:
-        if username == "Constantin Pape":
-            return "constantinpape"
+        username = hotfix_github_user(username)
 
-    if (
-        username.lower() in KNOWN_GITHUB_USERS
-        or not get_validation_context().perform_io_checks
-    ):
+    if not get_validation_context().perform_io_checks:
         return username
 
-    if username.lower() in KNOWN_INVALID_GITHUB_USERS:
+    known = get_known_github_user(username)
+    if known is True:
+        return username
+    elif known is False:
         raise ValueError(f"Known invalid GitHub user '{username}'")
 
     try:
-        r = httpx.get(
-            f"https://api.github.com/users/{username}",
-            auth=settings.github_auth,
-            timeout=settings.http_timeout,
-        )
+        r = request_github_user(username)
     except httpx.TimeoutException:
         issue_warning(
             "Could not verify GitHub user '{value}' due to connection timeout",
             value=username,
         )
     else:
-        if r.status_code == 403 and r.reason_phrase == "rate limit exceeded":
+        if is_rate_limited(r):
             issue_warning(
                 "Could not verify GitHub user '{value}' due to GitHub API rate limit",
                 value=username,
             )
-        elif r.status_code != 200:
-            KNOWN_INVALID_GITHUB_USERS.add(username.lower())
+        elif r.status_code == 404:
+            record_github_user(username, exists=False)
             raise ValueError(f"Could not find GitHub user '{username}'")
-
-        KNOWN_GITHUB_USERS.add(username.lower())
+        elif r.status_code != 200:
+            issue_warning(
+                "Could not verify GitHub user '{value}' (HTTP status {status_code})",
+                value=username,
+                msg_context={"status_code": r.status_code},
+            )
+        else:
+            record_github_user(username, exists=True)
 
     return username
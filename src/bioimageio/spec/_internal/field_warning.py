@@ -1,11 +1,25 @@
+import collections.abc
 import dataclasses
 import inspect
-from typing import TYPE_CHECKING, Any, Dict, Literal, Optional, Union, get_args
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    Dict,
+    Iterator,
+    List,
+    Literal,
+    Optional,
+    Tuple,
+    Union,
+    get_args,
+)
 
 import pydantic.functional_validators
 from annotated_types import BaseMetadata, GroupedMetadata
 from loguru import logger
-from pydantic import TypeAdapter
+from pydantic import BaseModel, TypeAdapter
 from pydantic_core import PydanticCustomError
 from pydantic_core.core_schema import (
     NoInfoValidatorFunction,
@@ -26,6 +40,122 @@ ValidatorFunction = Union[NoInfoValidatorFunction, WithInfoValidatorFunction]
 
 AnnotationMetaData = Union[BaseMetadata, GroupedMetadata]
 
+Loc = Tuple[Union[int, str], ...]
+"""location of a warning in a nested data structure"""
+
+
+@dataclasses.dataclass(**SLOTS)
+class CollectedWarning:
+    """A validation warning recorded within `collect_warnings()`"""
+
+    loc: Loc
+    msg: str
+    severity: WarningSeverity
+    value: Any
+    rejected: bool = False
+    """issued while validating a node that failed validation"""
+
+
+_collected_warnings: ContextVar[Optional[List[CollectedWarning]]] = ContextVar(
+    "collected_warnings", default=None
+)
+_validating_nodes: ContextVar[Tuple[Any, ...]] = ContextVar(
+    "validating_nodes", default=()
+)
+
+
+@contextmanager
+def collect_warnings() -> Iterator[List[CollectedWarning]]:
+    """Record all warnings issued (but not raised) within this context.
+
+    Warnings issued while validating a node that failed validation
+    are discarded if the enclosing node is valid nonetheless,
+    e.g. because another member of a union type validated successfully.
+    """
+    collected: List[CollectedWarning] = []
+    token = _collected_warnings.set(collected)
+    try:
+        yield collected
+    finally:
+        _collected_warnings.reset(token)
+
+
+def is_collecting_warnings() -> bool:
+    """Whether warnings are recorded, see `collect_warnings()`"""
+    return _collected_warnings.get() is not None
+
+
+@contextmanager
+def validating_node(data: Any) -> Iterator[None]:
+    """keep track of the (raw) node **data** being validated to locate and
+    discard issued warnings"""
+    collected = _collected_warnings.get()
+    n = 0 if collected is None else len(collected)
+    token = _validating_nodes.set(_validating_nodes.get() + (data,))
+    try:
+        yield
+    except Exception:
+        if collected is not None:
+            for w in collected[n:]:
+                w.rejected = True
+
+        raise
+    finally:
+        _validating_nodes.reset(token)
+
+    if collected is not None and any(w.rejected for w in collected[n:]):
+        collected[n:] = [w for w in collected[n:] if not w.rejected]
+
+
+def _find_key(parent: Any, node: Any) -> Loc:
+    """find the location of **node** within the data of its **parent** node"""
+    if isinstance(parent, collections.abc.Mapping):
+        items = list(parent.items())  # pyright: ignore[reportUnknownArgumentType, reportUnknownVariableType]
+    elif isinstance(parent, BaseModel):
+        items = list(vars(parent).items())
+    else:
+        return ()
+
+    for key, value in items:  # pyright: ignore[reportUnknownVariableType]
+        if not isinstance(key, str):
+            continue
+        elif value is node:
+            return (key,)
+        elif isinstance(value, (list, tuple)):
+            for idx, v in enumerate(value):  # pyright: ignore[reportUnknownVariableType, reportUnknownArgumentType]
+                if v is node:
+                    return (key, idx)
+        elif isinstance(value, collections.abc.Mapping):
+            for k, v in value.items():  # pyright: ignore[reportUnknownVariableType]
+                if v is node and isinstance(k, (int, str)):
+                    return (key, k)
+
+    # not found, e.g. if **node** was created by a 'before' validator
+    return ()
+
+
+def get_node_loc() -> Loc:
+    """location of the node currently being validated
+
+    Note:
+        This is a best effort location for warnings, e.g. 'after' model validators
+        of a node are called after the node itself is considered validated.
+    """
+    nodes = _validating_nodes.get()
+    return tuple(
+        k
+        for parent, node in zip(nodes[:-1], nodes[1:])
+        for k in _find_key(parent, node)
+    )
+
+
+def _format_msg(msg: str, msg_context: Dict[str, Any]) -> str:
+    # same formatting as `PydanticCustomError.message()`
+    for key, value in msg_context.items():
+        msg = msg.replace(f"{{{key}}}", str(value))
+
+    return msg
+
 
 def warn(
     typ: Union[AnnotationMetaData, Any],
@@ -157,8 +287,7 @@ class BeforeWarner(pydantic.functional_validators.BeforeValidator):
         )
 
 
-# TODO: add `loc: Loc` to `issue_warning()`
-#   and use a loguru handler to format warnings accordingly
+# TODO: use a loguru handler to format warnings
 def issue_warning(
     msg: LiteralString,
     *,
@@ -166,12 +295,41 @@ def issue_warning(
     severity: WarningSeverity = WARNING,
     msg_context: Optional[Dict[str, Any]] = None,
     field: Optional[str] = None,
+    loc: Optional[Loc] = None,
     log_depth: int = 1,
 ):
+    """Issue a validation warning.
+
+    Depending on the warning level of the current validation context the warning is
+    raised (as a validation error), or logged and recorded (see `collect_warnings()`).
+
+    Args:
+        msg: warning message; may reference `value`, `severity`
+             and any **msg_context** keys, e.g. "'{value}' is deprecated"
+        value: value causing the warning
+        severity: warning severity
+        msg_context: additional message context
+        field: name of the field (of the node currently being validated)
+               causing the warning
+        loc: location of the warning
+             (defaults to the location of the node currently being validated
+             extended by **field**)
+        log_depth: logging depth
+    """
     msg_context = {"value": value, "severity": severity, **(msg_context or {})}
 
     if severity >= (ctxt := get_validation_context()).warning_level:
         raise PydanticCustomError("warning", msg, msg_context)
-    elif ctxt.log_warnings:
-        log_msg = (field + ": " if field else "") + (msg.format(**msg_context))
+
+    if loc is None:
+        loc = get_node_loc() + (() if field is None else (field,))
+
+    formatted_msg = _format_msg(msg, msg_context)
+    if (collected := _collected_warnings.get()) is not None:
+        collected.append(
+            CollectedWarning(loc=loc, msg=formatted_msg, severity=severity, value=value)
+        )
+
+    if ctxt.log_warnings:
+        log_msg = (".".join(map(str, loc)) + ": " if loc else "") + formatted_msg
         logger.opt(depth=log_depth).log(severity, log_msg)
@@ -0,0 +1,88 @@
+"""Persistent index of SHA256 values of local files (see `settings.file_hash_index`)"""
+
+import os
+import time
+from dataclasses import dataclass
+from io import TextIOWrapper
+from pathlib import Path
+from typing import Optional, Union
+
+from ._settings import settings
+from .disk_store import DiskStore
+from .io_basics import Sha256, ZipPath, get_sha256
+from .utils import SLOTS, cache
+
+RACY_INTERVAL_NS = 2_000_000_000
+"""Files modified less than this many nanoseconds ago are not indexed,
+as they may be modified again without changing their size and mtime."""
+
+
+@dataclass(frozen=True, **SLOTS)
+class IndexedFileHash:
+    """SHA256 value of a local file and the file's stat metadata when it was hashed"""
+
+    size: int
+    mtime_ns: int
+    inode: int
+    sha256: Sha256
+
+
+@cache
+def _get_file_hash_store(cache_path: Path) -> DiskStore[IndexedFileHash]:
+    return DiskStore(cache_path / "file_hashes", IndexedFileHash)
+
+
+def _hash(source: Union[Path, ZipPath]) -> Sha256:
+    if isinstance(source, Path):
+        return get_sha256(source)
+
+    with source.open("rb") as f:
+        assert not isinstance(f, TextIOWrapper)
+        return get_sha256(f)
+
+
+def _matches(indexed: IndexedFileHash, stat: os.stat_result) -> bool:
+    return (
+        indexed.size == stat.st_size
+        and indexed.mtime_ns == stat.st_mtime_ns
+        and indexed.inode == stat.st_ino
+    )
+
+
+def get_file_sha256(source: Union[Path, ZipPath]) -> Sha256:
+    """Get the SHA256 value of a local file or zip member.
+
+    If `settings.file_hash_index` is enabled, the value is looked up in (or added to)
+    a persistent index in `settings.cache_path` keyed by absolute path, size,
+    mtime and inode of the file (for zip members: of the zip file and the member name).
+    """
+    file: Optional[Path]
+    if isinstance(source, ZipPath):
+        file = None if source.root.filename is None else Path(source.root.filename)
+        member = source.at
+    else:
+        file = source
+        member = ""
+
+    if not settings.file_hash_index or file is None:
+        return _hash(source)
+
+    file = file.absolute()
+    key = f"{file}::{member}" if member else str(file)
+    store = _get_file_hash_store(settings.cache_path)
+    stat = file.stat()
+    indexed = store.get(key)
+    if indexed is not None and _matches(indexed, stat):
+        return indexed.sha256
+
+    sha = _hash(source)
+    indexed = IndexedFileHash(
+        size=stat.st_size, mtime_ns=stat.st_mtime_ns, inode=stat.st_ino, sha256=sha
+    )
+    if (
+        time.time_ns() - stat.st_mtime_ns > RACY_INTERVAL_NS
+        and _matches(indexed, file.stat())  # file did not change while hashing
+    ):
+        store.set(key, indexed)
+
+    return sha
@@ -0,0 +1,210 @@
+"""Verification of GitHub user names (cached on disk and resolved in bulk)"""
+
+import json
+import time
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any, Dict, Iterable, List, Optional, Sequence, Set
+
+import httpx
+from loguru import logger
+
+from ._settings import settings
+from .constants import KNOWN_GITHUB_USERS, KNOWN_INVALID_GITHUB_USERS
+from .disk_store import DiskStore
+from .utils import SLOTS, cache
+from .validation_context import get_validation_context
+
+GITHUB_GRAPHQL_BATCH_SIZE = 100
+"""maximum number of users to resolve in one GraphQL query"""
+
+
+@dataclass(frozen=True, **SLOTS)
+class GitHubUserCheck:
+    """Result of verifying a GitHub user name"""
+
+    exists: bool
+
+    timestamp: float
+    """time of the check in seconds since the epoch"""
+
+    @property
+    def ttl(self) -> float:
+        """time in seconds for which this check result may be reused"""
+        return (
+            settings.github_user_ttl
+            if self.exists
+            else settings.github_user_negative_ttl
+        )
+
+
+@cache
+def _get_github_user_store(cache_path: Path) -> DiskStore[GitHubUserCheck]:
+    return DiskStore(cache_path / "github_users", GitHubUserCheck)
+
+
+def get_known_github_user(username: str) -> Optional[bool]:
+    """Whether **username** is a known valid (True) or invalid (False) GitHub user.
+
+    Returns None for unknown or expired users.
+    """
+    key = username.lower()
+    if key in KNOWN_GITHUB_USERS:
+        return True
+
+    if key in KNOWN_INVALID_GITHUB_USERS:
+        return False
+
+    if get_validation_context().disable_cache:
+        return None
+
+    check = _get_github_user_store(settings.cache_path).get(key)
+    if check is None or time.time() - check.timestamp >= check.ttl:
+        return None
+
+    (KNOWN_GITHUB_USERS if check.exists else KNOWN_INVALID_GITHUB_USERS).add(key)
+    return check.exists
+
+
+def record_github_user(username: str, exists: bool):
+    """remember if **username** is a valid GitHub user (in memory and on disk)"""
+    key = username.lower()
+    (KNOWN_GITHUB_USERS if exists else KNOWN_INVALID_GITHUB_USERS).add(key)
+    check = GitHubUserCheck(exists=exists, timestamp=time.time())
+    if not get_validation_context().disable_cache and check.ttl > 0:
+        _get_github_user_store(settings.cache_path).set(key, check)
+
+
+def request_github_user(username: str) -> httpx.Response:
+    """request **username** from the GitHub REST API"""
+    return settings.http_client.get(
+        f"https://api.github.com/users/{username}", auth=settings.github_auth
+    )
+
+
+def is_rate_limited(r: httpx.Response) -> bool:
+    return r.status_code == 429 or (
+        r.status_code == 403 and r.reason_phrase == "rate limit exceeded"
+    )
+
+
+def _query_github_users_rest(usernames: Sequence[str]) -> Dict[str, Optional[bool]]:
+    def query(username: str) -> Optional[bool]:
+        try:
+            r = request_github_user(username)
+        except httpx.HTTPError as e:
+            logger.debug("failed to verify GitHub user '{}': {}", username, e)
+            return None
+
+        if r.status_code == 200:
+            return True
+        elif r.status_code == 404:
+            return False
+        else:  # e.g. rate limited or a transient server error
+            logger.debug(
+                "failed to verify GitHub user '{}': HTTP status {}",
+                username,
+                r.status_code,
+            )
+            return None
+
+    with ThreadPoolExecutor(
+        max_workers=min(settings.http_max_connections_per_host, len(usernames))
+    ) as executor:
+        return dict(zip(usernames, executor.map(query, usernames)))
+
+
+def _query_github_users_graphql(
+    usernames: Sequence[str],
+) -> Dict[str, Optional[bool]]:
+    ret: Dict[str, Optional[bool]] = {}
+    for start in range(0, len(usernames), GITHUB_GRAPHQL_BATCH_SIZE):
+        batch = usernames[start : start + GITHUB_GRAPHQL_BATCH_SIZE]
+        # `repositoryOwner` resolves users and organizations like the REST API
+        query = "\n".join(
+            [
+                "query {",
+                *(
+                    f"u{i}: repositoryOwner(login: {json.dumps(name)}) {{ login }}"
+                    for i, name in enumerate(batch)
+                ),
+                "}",
+            ]
+        )
+        try:
+            r = settings.http_client.post(
+                "https://api.github.com/graphql",
+                json={"query": query},
+                headers={"Authorization": f"bearer {settings.github_token}"},
+            )
+            _ = r.raise_for_status()
+            ret.update(_parse_graphql_users(batch, r.json()))
+        except Exception as e:
+            logger.debug("GraphQL query for GitHub users failed: {}", e)
+            ret.update(_query_github_users_rest(batch))
+
+    return ret
+
+
+def _parse_graphql_users(
+    batch: Sequence[str], response: Any
+) -> Dict[str, Optional[bool]]:
+    """parse the response to a GraphQL query of **batch** users
+    (see `_query_github_users_graphql`)"""
+    data = response["data"]
+    if data is None:
+        raise ValueError(f"no data (errors: {response.get('errors')})")
+
+    # aliases that could not be resolved (None: all aliases)
+    failed: Set[Optional[str]] = set()
+    errors: List[Any] = response.get("errors") or []
+    for error in errors:
+        if error.get("type") != "NOT_FOUND":
+            path: List[Optional[str]] = error.get("path") or [None]
+            failed.add(path[0])
+
+    ret: Dict[str, Optional[bool]] = {}
+    for i, name in enumerate(batch):
+        alias = f"u{i}"
+        if data.get(alias) is not None:
+            ret[name] = True
+        elif alias in failed or None in failed:
+            ret[name] = None
+        else:
+            ret[name] = False
+
+    return ret
+
+
+def verify_github_users(usernames: Iterable[str]) -> Dict[str, Optional[bool]]:
+    """Verify GitHub user names in bulk.
+
+    Users that are not known (or cached, see `settings.github_user_ttl`) are resolved
+    with one GraphQL query per 100 users if `settings.github_token` is set,
+    or with parallel REST API requests otherwise.
+
+    Returns:
+        Mapping of user names to their existence (None if they could not be verified).
+    """
+    ret: Dict[str, Optional[bool]] = {}
+    unseen: List[str] = []
+    for username in dict.fromkeys(usernames):
+        ret[username] = known = get_known_github_user(username)
+        if known is None:
+            unseen.append(username)
+
+    if not unseen:
+        return ret
+
+    if settings.github_token is None:
+        resolved = _query_github_users_rest(unseen)
+    else:
+        resolved = _query_github_users_graphql(unseen)
+
+    for username, exists in resolved.items():
+        ret[username] = exists
+        if exists is not None:
+            record_github_user(username, exists)
+
+    return ret
@@ -0,0 +1,123 @@
+"""httpx transports limiting the number of concurrent requests per host"""
+
+import asyncio
+import threading
+from typing import AsyncIterator, Dict, Iterator, cast
+
+import httpx
+
+
+class _ReleasingByteStream(httpx.SyncByteStream):
+    def __init__(self, stream: httpx.SyncByteStream, limit: threading.Semaphore):
+        super().__init__()
+        self._stream = stream
+        self._limit = limit
+        self._released = False
+
+    def __iter__(self) -> Iterator[bytes]:
+        yield from self._stream
+
+    def close(self) -> None:
+        try:
+            self._stream.close()
+        finally:
+            if not self._released:
+                self._released = True
+                self._limit.release()
+
+
+class HostLimitedTransport(httpx.BaseTransport):
+    """Wraps **transport** to limit concurrent requests per host.
+
+    A request occupies its host's slot until its response is closed.
+    """
+
+    def __init__(self, transport: httpx.BaseTransport, *, max_per_host: int):
+        super().__init__()
+        self._transport = transport
+        self._max_per_host = max_per_host
+        self._lock = threading.Lock()
+        self._limits: Dict[str, threading.Semaphore] = {}
+
+    def _get_limit(self, host: str) -> threading.Semaphore:
+        with self._lock:
+            if host not in self._limits:
+                self._limits[host] = threading.BoundedSemaphore(self._max_per_host)
+
+            return self._limits[host]
+
+    def handle_request(self, request: httpx.Request) -> httpx.Response:
+        limit = self._get_limit(request.url.host)
+        _ = limit.acquire()
+        try:
+            response = self._transport.handle_request(request)
+        except BaseException:
+            limit.release()
+            raise
+
+        return httpx.Response(
+            status_code=response.status_code,
+            headers=response.headers,
+            stream=_ReleasingByteStream(
+                cast(httpx.SyncByteStream, response.stream), limit
+            ),
+            extensions=response.extensions,
+        )
+
+    def close(self) -> None:
+        self._transport.close()
+
+
+class _AsyncReleasingByteStream(httpx.AsyncByteStream):
+    def __init__(self, stream: httpx.AsyncByteStream, limit: asyncio.Semaphore):
+        super().__init__()
+        self._stream = stream
+        self._limit = limit
+        self._released = False
+
+    async def __aiter__(self) -> AsyncIterator[bytes]:
+        async for chunk in self._stream:
+            yield chunk
+
+    async def aclose(self) -> None:
+        try:
+            await self._stream.aclose()
+        finally:
+            if not self._released:
+                self._released = True
+                self._limit.release()
+
+
+class AsyncHostLimitedTransport(httpx.AsyncBaseTransport):
+    """Async counterpart of `HostLimitedTransport` (for use within one event loop)"""
+
+    def __init__(self, transport: httpx.AsyncBaseTransport, *, max_per_host: int):
+        super().__init__()
+        self._transport = transport
+        self._max_per_host = max_per_host
+        self._limits: Dict[str, asyncio.Semaphore] = {}
+
+    async def handle_async_request(self, request: httpx.Request) -> httpx.Response:
+        host = request.url.host
+        if host not in self._limits:
+            self._limits[host] = asyncio.BoundedSemaphore(self._max_per_host)
+
+        limit = self._limits[host]
+        _ = await limit.acquire()
+        try:
+            response = await self._transport.handle_async_request(request)
+        except BaseException:
+            limit.release()
+            raise
+
+        return httpx.Response(
+            status_code=response.status_code,
+            headers=response.headers,
+            stream=_AsyncReleasingByteStream(
+                cast(httpx.AsyncByteStream, response.stream), limit
+            ),
+            extensions=response.extensions,
+        )
+
+    async def aclose(self) -> None:
+        await self._transport.aclose()
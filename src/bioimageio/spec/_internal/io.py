@@ -1,31 +1,41 @@
 from __future__ import annotations
 
+import asyncio
 import collections.abc
 import hashlib
+import os
 import sys
+import time
+import uuid
 import warnings
 import zipfile
 from abc import abstractmethod
-from contextlib import nullcontext
+from collections import deque
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
+from contextlib import asynccontextmanager, contextmanager, nullcontext
+from contextvars import copy_context
 from dataclasses import dataclass, field
 from datetime import date as _date
 from datetime import datetime as _datetime
-from functools import partial
 from io import TextIOWrapper
 from pathlib import Path, PurePath, PurePosixPath
-from tempfile import mkdtemp
+from tempfile import TemporaryFile, mkdtemp
 from typing import (
     TYPE_CHECKING,
     Any,
+    AsyncIterator,
+    BinaryIO,
     Callable,
+    Deque,
     Dict,
     Generic,
     Iterable,
+    Iterator,
     List,
+    Literal,
     Mapping,
     Optional,
     Sequence,
-    Set,
     Tuple,
     Type,
     TypedDict,
@@ -38,7 +48,8 @@ from zipfile import ZipFile
 
 import httpx
 import pydantic
-from genericache import NoopCache
+from exceptiongroup import ExceptionGroup
+from genericache import Cache, CacheEntry, DigestMismatch, DiskCache, NoopCache
 from genericache.digest import ContentDigest, UrlDigest
 from pydantic import (
     AnyUrl,
@@ -65,6 +76,9 @@ from typing_extensions import (
 from typing_extensions import TypeAliasType as _TypeAliasType
 
 from ._settings import settings
+from .download import CHUNK_SIZE, open_download
+from .download_cache import DownloadLock, add_entry, record_usage
+from .file_hashes import get_file_sha256
 from .io_basics import (
     ALL_BIOIMAGEIO_YAML_NAMES,
     ALTERNATIVE_BIOIMAGEIO_YAML_NAMES,
@@ -78,12 +92,13 @@ from .io_basics import (
     ZipPath,
     get_sha256,
 )
+from .mirror import get_mirrored_file
 from .node import Node
-from .progress import Progressbar
+from .progress import CombinedProgress, Progressbar
 from .root_url import RootHttpUrl
 from .type_guards import is_dict, is_list, is_mapping, is_sequence
 from .url import HttpUrl
-from .utils import SLOTS
+from .utils import SLOTS, to_thread
 from .validation_context import get_validation_context
 
 AbsolutePathT = TypeVar(
@@ -635,13 +650,11 @@ def extract(
             return folder
 
 
-def get_reader(
+def _interprete_reader_source(
     source: Union[PermissiveFileSource, FileDescr, ZipPath],
-    /,
-    progressbar: Union[Progressbar, Callable[[], Progressbar], bool, None] = None,
-    **kwargs: Unpack[HashKwargs],
-) -> BytesReader:
-    """Open a file `source` (download if needed)"""
+    kwargs: HashKwargs,
+) -> Union[HttpUrl, ZipPath, Path]:
+    """resolve **source** for `get_reader` (sets `kwargs["sha256"]` for a `FileDescr`)"""
     if isinstance(source, FileDescr):
         if "sha256" not in kwargs:
             kwargs["sha256"] = source.sha256
@@ -656,6 +669,17 @@ def get_reader(
         with get_validation_context().replace(perform_io_checks=False):
             source = HttpUrl(source)
 
+    return source
+
+
+def get_reader(
+    source: Union[PermissiveFileSource, FileDescr, ZipPath],
+    /,
+    progressbar: Union[Progressbar, Callable[[], Progressbar], bool, None] = None,
+    **kwargs: Unpack[HashKwargs],
+) -> BytesReader:
+    """Open a file `source` (download if needed)"""
+    source = _interprete_reader_source(source, kwargs)
     if isinstance(source, HttpUrl):
         return _open_url(source, progressbar=progressbar, **kwargs)
 
@@ -682,8 +706,7 @@ def get_reader(
     if expected_sha is None:
         sha = None
     else:
-        sha = get_sha256(f)
-        _ = f.seek(0)
+        sha = get_file_sha256(source)
         if sha != expected_sha:
             raise ValueError(
                 f"SHA256 mismatch for {source}. Expected {expected_sha}, got {sha}."
@@ -702,30 +725,140 @@ def get_reader(
 download = get_reader
 
 
-def _open_url(
-    source: HttpUrl,
+async def aget_reader(
+    source: Union[PermissiveFileSource, FileDescr, ZipPath],
     /,
-    progressbar: Union[Progressbar, Callable[[], Progressbar], bool, None],
+    progressbar: Union[Progressbar, Callable[[], Progressbar], bool, None] = None,
     **kwargs: Unpack[HashKwargs],
 ) -> BytesReader:
-    cache = (
-        NoopCache[RootHttpUrl](url_hasher=UrlDigest.from_str)
-        if get_validation_context().disable_cache
-        else settings.disk_cache
+    """Open a file `source` (download if needed without blocking the event loop)
+
+    Async counterpart of `get_reader`.
+    """
+    source = _interprete_reader_source(source, kwargs)
+    if isinstance(source, HttpUrl):
+        return await _aopen_url(source, progressbar=progressbar, **kwargs)
+    else:
+        # local files may be hashed
+        return await to_thread(get_reader, source, progressbar=progressbar, **kwargs)
+
+
+def _get_download_cache():
+    if get_validation_context().disable_cache:
+        return NoopCache[RootHttpUrl](url_hasher=UrlDigest.from_str)
+    else:
+        return settings.disk_cache
+
+
+def _get_cached_content(
+    cache: Cache[RootHttpUrl], sha: Optional[Sha256]
+) -> Optional[CacheEntry]:
+    """get cached content with the expected SHA256 value (if any),
+    irrespective of the URL it was downloaded from,
+    e.g. the same file from a mirror or from an earlier version of a resource."""
+    if sha is None:
+        return None
+
+    try:
+        return cache.get(digest=ContentDigest.parse(hexdigest=sha))
+    except FileNotFoundError:
+        return None  # the cache directory does not exist (yet)
+
+
+def _get_download_key(source: HttpUrl, sha: Optional[Sha256]) -> str:
+    if sha is None:
+        return "url_" + hashlib.sha256(str(source).encode("utf-8")).hexdigest()
+    else:
+        return f"sha256_{sha}"
+
+
+def _get_concurrent_download(
+    cache: Cache[RootHttpUrl], source: HttpUrl, sha: Optional[Sha256], since: float
+) -> Optional[CacheEntry]:
+    """get the content of **source** if it was downloaded after **since**
+    (or any cached content with the expected SHA256 value)"""
+    if sha is not None:
+        return _get_cached_content(cache, sha)
+
+    try:
+        entry = cache.get_by_url(url=source)
+    except FileNotFoundError:
+        return None  # the cache directory does not exist (yet)
+
+    if entry is None or entry.timestamp.timestamp() < since:
+        return None
+
+    return entry
+
+
+def _get_download_lock(
+    cache: Cache[RootHttpUrl], source: HttpUrl, sha: Optional[Sha256]
+) -> DownloadLock:
+    # content of other caches is not shared with other processes
+    return DownloadLock(
+        _get_download_key(source, sha), across_processes=isinstance(cache, DiskCache)
     )
-    sha = kwargs.get("sha256")
-    force_refetch = True if sha is None else ContentDigest.parse(hexdigest=sha)
+
+
+@contextmanager
+def _single_flight(
+    cache: Cache[RootHttpUrl], source: HttpUrl, sha: Optional[Sha256]
+) -> Iterator[Optional[CacheEntry]]:
+    """Hold a `DownloadLock` while downloading **source**,
+    such that threads and processes do not download the same content concurrently.
+
+    Yields:
+        The content of **source** if another thread or process downloaded it
+        while waiting for the lock.
+    """
+    if isinstance(cache, NoopCache):
+        yield None  # downloads are not shared
+        return
+
+    lock = _get_download_lock(cache, source, sha)
+    since = time.time()
+    contended = lock.acquire()
+    try:
+        yield (
+            _get_concurrent_download(cache, source, sha, since) if contended else None
+        )
+    finally:
+        lock.release()
+
+
+@asynccontextmanager
+async def _asingle_flight(
+    cache: Cache[RootHttpUrl], source: HttpUrl, sha: Optional[Sha256]
+) -> AsyncIterator[Optional[CacheEntry]]:
+    """Async counterpart of `_single_flight`"""
+    if isinstance(cache, NoopCache):
+        yield None  # downloads are not shared
+        return
+
+    lock = _get_download_lock(cache, source, sha)
+    since = time.time()
+    contended = await lock.aacquire()
+    try:
+        yield (
+            _get_concurrent_download(cache, source, sha, since) if contended else None
+        )
+    finally:
+        lock.release()
+
+
+def _get_url_reader(
+    source: HttpUrl, reader: CacheEntry, sha: Optional[Sha256]
+) -> BytesReader:
     source_path = PurePosixPath(
         source.path
         or sha
         or hashlib.sha256(str(source).encode(encoding="utf-8")).hexdigest()
     )
+    if sha is None:
+        # the download cache hashes the content while it is streamed to disk,
+        # so we reuse its digest instead of reading the (potentially large) file again
+        sha = Sha256(str(reader.content_digest))
 
-    reader = cache.fetch(
-        source,
-        fetcher=partial(_fetch_url, progressbar=progressbar),
-        force_refetch=force_refetch,
-    )
     return BytesReader(
         reader,
         suffix=source_path.suffix,
@@ -736,14 +869,193 @@ def _open_url(
     )
 
 
-def _fetch_url(
-    source: RootHttpUrl,
+def _open_mirrored_url(
+    source: HttpUrl, mirrored: Path, sha: Optional[Sha256]
+) -> BytesReader:
+    """open the local copy **mirrored** of **source** (see `settings.mirror`)"""
+    if sha is not None and (actual := get_file_sha256(mirrored)) != sha:
+        raise ValueError(
+            f"SHA256 mismatch for {source} (mirrored at {mirrored})."
+            + f" Expected {sha}, got {actual}."
+        )
+
+    source_path = PurePosixPath(source.path or mirrored.name)
+    return BytesReader(
+        mirrored.open("rb"),
+        sha256=sha,
+        suffix=source_path.suffix,
+        original_file_name=source_path.name,
+        original_root=source.parent,
+        is_zipfile=None,
+    )
+
+
+def _open_url(
+    source: HttpUrl,
+    /,
+    progressbar: Union[Progressbar, Callable[[], Progressbar], bool, None],
+    **kwargs: Unpack[HashKwargs],
+) -> BytesReader:
+    sha = kwargs.get("sha256")
+    if (mirrored := get_mirrored_file(str(source))) is not None:
+        return _open_mirrored_url(source, mirrored, sha)
+
+    cache = _get_download_cache()
+    downloaded = False
+    reader = _get_cached_content(cache, sha)
+    if reader is None:
+        with _single_flight(cache, source, sha) as reader:
+            if reader is None and isinstance(cache, DiskCache):
+                reader = _download_to_cache(
+                    cache, source, progressbar=progressbar, sha=sha
+                )
+                downloaded = True
+            elif reader is None:
+                reader = cache.fetch(
+                    source,
+                    fetcher=lambda url: _fetch_url(url, progressbar=progressbar),
+                    force_refetch=(
+                        True if sha is None else ContentDigest.parse(hexdigest=sha)
+                    ),
+                )
+
+    if isinstance(cache, DiskCache):
+        record_usage(reader, downloaded=downloaded)
+
+    return _get_url_reader(source, reader, sha)
+
+
+async def _aopen_url(
+    source: HttpUrl,
+    /,
+    progressbar: Union[Progressbar, Callable[[], Progressbar], bool, None],
+    **kwargs: Unpack[HashKwargs],
+) -> BytesReader:
+    sha = kwargs.get("sha256")
+    if (mirrored := get_mirrored_file(str(source))) is not None:
+        return await to_thread(_open_mirrored_url, source, mirrored, sha)
+
+    cache = _get_download_cache()
+    reader = await to_thread(_get_cached_content, cache, sha)
+    downloaded = False
+    if reader is None:
+        async with _asingle_flight(cache, source, sha) as reader:
+            if reader is None and isinstance(cache, DiskCache):
+                reader = await _adownload_to_cache(
+                    cache, source, progressbar=progressbar, sha=sha
+                )
+                downloaded = True
+            elif reader is None:
+                reader = tmp = await _adownload(source, progressbar=progressbar)
+                if not isinstance(cache, NoopCache):
+                    reader = await to_thread(
+                        cache.fetch,
+                        source,
+                        fetcher=lambda _: _iter_file(tmp),
+                        force_refetch=(
+                            True if sha is None else ContentDigest.parse(hexdigest=sha)
+                        ),
+                    )
+
+    if isinstance(cache, DiskCache):
+        await to_thread(record_usage, reader, downloaded=downloaded)
+
+    return _get_url_reader(source, reader, sha)
+
+
+def _get_download_path(cache: DiskCache[RootHttpUrl]) -> Path:
+    """get a unique path in the download **cache** directory to download a file to"""
+    cache.dir_path.mkdir(parents=True, exist_ok=True)
+    return cache.dir_path / f".download_{uuid.uuid4().hex}.tmp"
+
+
+def _add_download_to_cache(
+    cache: DiskCache[RootHttpUrl],
+    source: HttpUrl,
+    downloaded: Path,
+    actual_sha: str,
+    sha: Optional[Sha256],
+) -> CacheEntry:
+    """move the **downloaded** content of **source** into the download **cache**"""
+    actual = ContentDigest.parse(hexdigest=actual_sha)
+    if sha is not None and actual != (expected := ContentDigest.parse(hexdigest=sha)):
+        raise DigestMismatch(
+            url=source, expected_content_digest=expected, actual_content_digest=actual
+        )
+
+    return add_entry(cache.dir_path, cache.url_hasher(source), actual, downloaded)
+
+
+def _download_to_cache(
+    cache: DiskCache[RootHttpUrl],
+    source: HttpUrl,
     *,
     progressbar: Union[Progressbar, Callable[[], Progressbar], bool, None],
-):
-    if source.scheme not in ("http", "https"):
-        raise NotImplementedError(source.scheme)
+    sha: Optional[Sha256],
+) -> CacheEntry:
+    """download **source** into the download **cache**
+
+    (the downloaded file is moved into the cache instead of being copied)
+    """
+    dst = _get_download_path(cache)
+    try:
+        actual = hashlib.sha256()
+        for chunk in _fetch_url(source, progressbar=progressbar, dst=dst):
+            actual.update(chunk)
 
+        return _add_download_to_cache(cache, source, dst, actual.hexdigest(), sha)
+    finally:
+        dst.unlink(missing_ok=True)
+
+
+async def _adownload_to_cache(
+    cache: DiskCache[RootHttpUrl],
+    source: HttpUrl,
+    *,
+    progressbar: Union[Progressbar, Callable[[], Progressbar], bool, None],
+    sha: Optional[Sha256],
+) -> CacheEntry:
+    """Async counterpart of `_download_to_cache`"""
+    dst = _get_download_path(cache)
+    try:
+        with dst.open("wb") as f:
+            actual = await _afetch_url(source, f, progressbar=progressbar)
+
+        return await to_thread(_add_download_to_cache, cache, source, dst, actual, sha)
+    finally:
+        await to_thread(dst.unlink, missing_ok=True)
+
+
+def _iter_file(f: CacheEntry) -> Iterator[bytes]:
+    while chunk := f.read(CHUNK_SIZE):
+        yield chunk
+
+
+async def _adownload(
+    source: HttpUrl,
+    *,
+    progressbar: Union[Progressbar, Callable[[], Progressbar], bool, None],
+) -> CacheEntry:
+    """download **source** to a temporary file (bypassing the download cache)"""
+    f = TemporaryFile()
+    try:
+        actual = await _afetch_url(source, f, progressbar=progressbar)
+        _ = f.seek(0)
+    except BaseException:
+        f.close()
+        raise
+
+    return CacheEntry(
+        url_digest=UrlDigest.from_str(str(source)),
+        content_digest=ContentDigest.parse(hexdigest=actual),
+        reader=f,
+        timestamp=_datetime.now(),
+    )
+
+
+def _resolve_progressbar(
+    progressbar: Union[Progressbar, Callable[[], Progressbar], bool, None],
+) -> Union[Progressbar, Literal[False]]:
     if progressbar is None:
         # chose progressbar option from validation context
         progressbar = get_validation_context().progressbar
@@ -764,24 +1076,10 @@ def _fetch_url(
             leave=True,
         )
 
-    if progressbar is not False:
-        progressbar.set_description(f"Downloading {extract_file_name(source)}")
-
-    headers: Dict[str, str] = {}
-    if settings.user_agent is not None:
-        headers["User-Agent"] = settings.user_agent
-    elif settings.CI:
-        headers["User-Agent"] = "ci"
+    return progressbar
 
-    r = httpx.get(
-        str(source),
-        follow_redirects=True,
-        headers=headers,
-        timeout=settings.http_timeout,
-    )
-    _ = r.raise_for_status()
 
-    # set progressbar.total
+def _get_content_length(r: httpx.Response) -> Optional[int]:
     total = r.headers.get("content-length")
     if total is not None and not isinstance(total, int):
         try:
@@ -789,33 +1087,115 @@ def _fetch_url(
         except Exception:
             total = None
 
+    return total
+
+
+def _finish_progressbar(
+    progressbar: Union[Progressbar, Literal[False]], total: Optional[int]
+):
+    # Make sure the progress bar gets filled even if the actual number
+    # is chunks is smaller than expected. This happens when streaming
+    # text files that are compressed by the server when sending (gzip).
+    # Binary files don't experience this.
+    # (adapted from pooch.HttpDownloader)
     if progressbar is not False:
-        if total is None:
-            progressbar.total = 0
-        else:
-            progressbar.total = total
+        progressbar.reset()
+        if total is not None:
+            _ = progressbar.update(total)
 
-    def iter_content():
-        for chunk in r.iter_bytes(chunk_size=4096):
-            yield chunk
-            if progressbar is not False:
-                _ = progressbar.update(len(chunk))
+        progressbar.close()
+
+
+def _fetch_url(
+    source: RootHttpUrl,
+    *,
+    progressbar: Union[Progressbar, Callable[[], Progressbar], bool, None],
+    dst: Optional[Path] = None,
+):
+    if source.scheme not in ("http", "https"):
+        raise NotImplementedError(source.scheme)
 
-        # Make sure the progress bar gets filled even if the actual number
-        # is chunks is smaller than expected. This happens when streaming
-        # text files that are compressed by the server when sending (gzip).
-        # Binary files don't experience this.
-        # (adapted from pooch.HttpDownloader)
+    progressbar = _resolve_progressbar(progressbar)
+    if progressbar is not False:
+        progressbar.set_description(f"Downloading {extract_file_name(source)}")
+
+    def update_progress(n: int):
         if progressbar is not False:
-            progressbar.reset()
-            if total is not None:
-                _ = progressbar.update(total)
+            _ = progressbar.update(n)
+
+    total, content = open_download(
+        str(source),
+        keep_partial=not get_validation_context().disable_cache,
+        progress=update_progress,
+        dst=dst,
+    )
+    if progressbar is not False:
+        progressbar.total = 0 if total is None else total
 
-            progressbar.close()
+    def iter_content() -> Iterator[bytes]:
+        yield from content
+        _finish_progressbar(progressbar, total)
 
     return iter_content()
 
 
+ASYNC_DOWNLOAD_BUFFER_SIZE = 1024 * 1024
+"""number of bytes an async download buffers in memory
+before writing (and hashing) them in a worker thread"""
+
+
+def _write_chunks(
+    f: BinaryIO, update_sha: Callable[[bytes], None], chunks: List[bytes]
+):
+    for chunk in chunks:
+        update_sha(chunk)
+        _ = f.write(chunk)
+
+
+async def _afetch_url(
+    source: RootHttpUrl,
+    f: BinaryIO,
+    *,
+    progressbar: Union[Progressbar, Callable[[], Progressbar], bool, None],
+) -> str:
+    """Download **source** to **f** without blocking the event loop.
+
+    Returns:
+        The SHA256 hexdigest of the downloaded content.
+    """
+    if source.scheme not in ("http", "https"):
+        raise NotImplementedError(source.scheme)
+
+    progressbar = _resolve_progressbar(progressbar)
+    if progressbar is not False:
+        progressbar.set_description(f"Downloading {extract_file_name(source)}")
+
+    sha = hashlib.sha256()
+    async with settings.get_async_http_client().stream("GET", str(source)) as r:
+        _ = r.raise_for_status()
+        total = _get_content_length(r)
+        if progressbar is not False:
+            progressbar.total = 0 if total is None else total
+
+        buffered: List[bytes] = []
+        n_buffered = 0
+        async for chunk in r.aiter_bytes(chunk_size=CHUNK_SIZE):
+            buffered.append(chunk)
+            n_buffered += len(chunk)
+            if progressbar is not False:
+                _ = progressbar.update(len(chunk))
+
+            if n_buffered >= ASYNC_DOWNLOAD_BUFFER_SIZE:
+                await to_thread(_write_chunks, f, sha.update, buffered)
+                buffered = []
+                n_buffered = 0
+
+        await to_thread(_write_chunks, f, sha.update, buffered)
+
+    _finish_progressbar(progressbar, total)
+    return sha.hexdigest()
+
+
 def extract_file_name(
     src: Union[
         pydantic.HttpUrl, RootHttpUrl, PurePath, RelativeFilePath, ZipPath, FileDescr
@@ -934,8 +1314,11 @@ def validate_suffix(
     return o_value
 
 
-def populate_cache(sources: Sequence[Union[FileDescr, LightHttpFileDescr]]):
-    unique: Set[str] = set()
+def _get_cacheable_sources(
+    sources: Sequence[Union[FileDescr, LightHttpFileDescr]],
+) -> Dict[str, Union[FileDescr, LightHttpFileDescr]]:
+    """map unique URLs of **sources** with known SHA256 to their file description"""
+    ret: Dict[str, Union[FileDescr, LightHttpFileDescr]] = {}
     for src in sources:
         if src.sha256 is None:
             continue  # not caching without known SHA
@@ -952,8 +1335,185 @@ def populate_cache(sources: Sequence[Union[FileDescr, LightHttpFileDescr]]):
         else:
             assert_never(src.source)
 
-        if url in unique:
-            continue  # skip duplicate URLs
+        # skip duplicate URLs
+        _ = ret.setdefault(url, src)
+
+    return ret
+
+
+def _get_combined_progress(
+    progressbar: Union[Progressbar, Callable[[], Progressbar], bool, None],
+    n_files: int,
+) -> Optional[CombinedProgress]:
+    pbar = _resolve_progressbar(progressbar)
+    if pbar is False:
+        return None
+    else:
+        return CombinedProgress(pbar, description=f"Downloading {n_files} file(s)")
+
 
-        unique.add(url)
-        _ = src.download()
+def populate_cache(
+    sources: Sequence[Union[FileDescr, LightHttpFileDescr]],
+    *,
+    progressbar: Union[Progressbar, Callable[[], Progressbar], bool, None] = None,
+):
+    """Download remote **sources** with known SHA256 concurrently into the cache.
+
+    Downloads run in a thread pool limited by `settings.max_concurrent_downloads`
+    and `settings.max_concurrent_downloads_per_host`.
+    Download progress is combined in a single progressbar.
+
+    Raises:
+        ExceptionGroup: if any download failed
+            (after all other downloads finished).
+    """
+    if get_validation_context().disable_cache:
+        return  # downloads would be discarded
+
+    to_download = _get_cacheable_sources(sources)
+    if not to_download:
+        return
+
+    combined = _get_combined_progress(progressbar, len(to_download))
+    # downloads are queued per host and submitted once their host has capacity,
+    # such that downloads from a busy host do not occupy all worker threads
+    host_queues: Dict[str, Deque[Tuple[str, Union[FileDescr, LightHttpFileDescr]]]] = {}
+    for url, src in to_download.items():
+        host_queues.setdefault(urlsplit(url).netloc, deque()).append((url, src))
+
+    max_workers = min(settings.max_concurrent_downloads, len(to_download))
+    running: Dict[Future[None], str] = {}  # download futures and their hosts
+    running_per_host: Dict[str, int] = {host: 0 for host in host_queues}
+
+    def download(src: Union[FileDescr, LightHttpFileDescr]):
+        _ = src.download(progressbar=combined or False)
+
+    errors: List[Exception] = []
+    with ThreadPoolExecutor(
+        max_workers=max_workers, thread_name_prefix="bioimageio_download"
+    ) as executor:
+
+        def submit_ready():
+            submitted = True
+            while submitted and len(running) < max_workers:
+                submitted = False
+                # one download per host at a time to alternate between hosts
+                for host, queue in host_queues.items():
+                    if (
+                        queue
+                        and len(running) < max_workers
+                        and running_per_host[host]
+                        < settings.max_concurrent_downloads_per_host
+                    ):
+                        _, src = queue.popleft()
+                        # each task runs in a copy of the current context
+                        # (incl. validation context)
+                        future = executor.submit(copy_context().run, download, src)
+                        running[future] = host
+                        running_per_host[host] += 1
+                        submitted = True
+
+        submit_ready()
+        while running:
+            done, _ = wait(running, return_when=FIRST_COMPLETED)
+            for future in done:
+                running_per_host[running.pop(future)] -= 1
+                error = future.exception()
+                if isinstance(error, Exception):
+                    errors.append(error)
+
+            submit_ready()
+
+    if combined is not None:
+        combined.close()
+
+    if errors:
+        raise ExceptionGroup(
+            f"Failed to download {len(errors)} of {len(to_download)} file(s)", errors
+        )
+
+
+def populate_known_files(sources: Sequence[FileDescr]):
+    """Hash local **sources** concurrently and record their SHA256 values
+    in `known_files` of the current validation context.
+
+    `FileDescr.validate_sha256` then compares against the recorded values
+    instead of hashing one file after another.
+    Unchanged files are not rehashed if `settings.file_hash_index` is enabled.
+    Remote files are verified by the download cache (see `populate_cache`).
+    Files that cannot be read are skipped (and reported by the validation itself).
+    """
+    context = get_validation_context()
+    to_hash: Dict[str, Union[Path, ZipPath]] = {}
+    for src in sources:
+        src_str = str(src.source)
+        if src_str in context.known_files or src_str in to_hash:
+            continue
+
+        source = src.source
+        if isinstance(source, RelativeFilePath):
+            source = source.absolute()
+
+        if isinstance(source, (Path, ZipPath)):
+            to_hash[src_str] = source
+
+    if not to_hash:
+        return
+
+    # hashlib releases the GIL while hashing, so threads hash in parallel
+    with ThreadPoolExecutor(
+        max_workers=min(len(to_hash), os.cpu_count() or 1),
+        thread_name_prefix="bioimageio_hash",
+    ) as executor:
+        futures = {
+            src_str: executor.submit(get_file_sha256, source)
+            for src_str, source in to_hash.items()
+        }
+
+    for src_str, future in futures.items():
+        if future.exception() is None:
+            context.known_files[src_str] = future.result()
+
+
+async def apopulate_cache(
+    sources: Sequence[Union[FileDescr, LightHttpFileDescr]],
+    *,
+    progressbar: Union[Progressbar, Callable[[], Progressbar], bool, None] = None,
+):
+    """Async counterpart of `populate_cache`"""
+    if get_validation_context().disable_cache:
+        return  # downloads would be discarded
+
+    to_download = _get_cacheable_sources(sources)
+    if not to_download:
+        return
+
+    combined = _get_combined_progress(progressbar, len(to_download))
+    limit = asyncio.Semaphore(settings.max_concurrent_downloads)
+    host_limits: Dict[str, asyncio.Semaphore] = {}
+    for url in to_download:
+        host = urlsplit(url).netloc
+        if host not in host_limits:
+            host_limits[host] = asyncio.Semaphore(
+                settings.max_concurrent_downloads_per_host
+            )
+
+    async def download(url: str, src: Union[FileDescr, LightHttpFileDescr]):
+        # wait for the host before taking one of the overall download slots
+        async with host_limits[urlsplit(url).netloc], limit:
+            _ = await aget_reader(
+                src.source, sha256=src.sha256, progressbar=combined or False
+            )
+
+    results = await asyncio.gather(
+        *(download(url, src) for url, src in to_download.items()),
+        return_exceptions=True,
+    )
+    if combined is not None:
+        combined.close()
+
+    errors = [r for r in results if isinstance(r, Exception)]
+    if errors:
+        raise ExceptionGroup(
+            f"Failed to download {len(errors)} of {len(to_download)} file(s)", errors
+        )
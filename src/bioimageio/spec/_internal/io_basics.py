@@ -11,7 +11,7 @@ import pydantic
 import zipp  # pyright: ignore[reportMissingTypeStubs]
 from annotated_types import Predicate
 from pydantic import RootModel, StringConstraints
-from typing_extensions import Annotated
+from typing_extensions import Annotated, Self
 
 from .root_url import RootHttpUrl
 from .validated_string import ValidatedString
@@ -145,6 +145,18 @@ class BytesReader(BytesReaderP):
     def closed(self) -> bool:
         return self._reader.closed
 
+    def close(self) -> None:
+        """close the underlying reader (if it can be closed)"""
+        close = getattr(self._reader, "close", None)
+        if close is not None:
+            close()
+
+    def __enter__(self) -> Self:
+        return self
+
+    def __exit__(self, *args: Any) -> None:
+        self.close()
+
 
 def get_sha256(source: Union[BytesReaderP, BytesReaderIntoP, Path]) -> Sha256:
     chunksize = 128 * 1024
@@ -1,23 +1,34 @@
 import collections.abc
+import hashlib
 import io
-import shutil
+import json
+import os
+import struct
+import tempfile
+import threading
+import time
 import zipfile
+import zlib
+from collections import deque
+from concurrent.futures import Future, ThreadPoolExecutor
 from contextlib import nullcontext
+from contextvars import copy_context
+from dataclasses import dataclass
 from difflib import get_close_matches
-from pathlib import Path
+from pathlib import Path, PurePosixPath
 from types import MappingProxyType
-from typing import IO, Any, Dict, Mapping, Union, cast
-from zipfile import ZipFile
+from typing import IO, Any, Callable, Deque, Dict, Mapping, Optional, Union, cast
+from zipfile import ZipFile, ZipInfo
 
-import httpx
 import numpy
 from loguru import logger
 from numpy.typing import NDArray
 from pydantic import BaseModel, FilePath, NewPath, RootModel
 from ruyaml import YAML
-from typing_extensions import Unpack
+from typing_extensions import TypeGuard, Unpack
 
 from ._settings import settings
+from .download import RemoteFile
 from .io import (
     BIOIMAGEIO_YAML,
     BioimageioYamlContent,
@@ -29,37 +40,49 @@ from .io import (
     OpenedBioimageioYaml,
     RelativeFilePath,
     YamlValue,
+    aget_reader,
     extract_file_name,
     find_bioimageio_yaml_file_name,
     get_reader,
     identify_bioimageio_yaml_file_name,
     interprete_file_source,
 )
-from .io_basics import AbsoluteDirectory, FileName, ZipPath
+from .io_basics import AbsoluteDirectory, BytesReaderP, FileName, Sha256, ZipPath
+from .mirror import get_mirrored_file
 from .types import FileSource, PermissiveFileSource
 from .url import HttpUrl, RootHttpUrl
-from .utils import cache
+from .utils import SLOTS, cache, to_thread
 from .validation_context import ValidationContext, get_validation_context
+from .yaml_loader import load_yaml
 
-_yaml_load = YAML(typ="safe")
+_yaml_instances = threading.local()
+"""thread local YAML dumpers (ruyaml's YAML instances are not thread-safe)"""
 
-_yaml_dump = YAML()
-_yaml_dump.version = (1, 2)  # pyright: ignore[reportAttributeAccessIssue]
-_yaml_dump.default_flow_style = False
-_yaml_dump.indent(mapping=2, sequence=4, offset=2)
-_yaml_dump.width = 88  # pyright: ignore[reportAttributeAccessIssue]
+
+def _get_yaml_dump() -> YAML:
+    if not hasattr(_yaml_instances, "dump"):
+        yaml_dump = YAML()
+        yaml_dump.version = (1, 2)  # pyright: ignore[reportAttributeAccessIssue]
+        yaml_dump.default_flow_style = False
+        yaml_dump.indent(mapping=2, sequence=4, offset=2)
+        yaml_dump.width = 88  # pyright: ignore[reportAttributeAccessIssue]
+        _yaml_instances.dump = yaml_dump
+
+    return _yaml_instances.dump
 
 
 def read_yaml(
     file: Union[FilePath, ZipPath, IO[str], IO[bytes], BytesReader, str],
 ) -> YamlValue:
+    data: Union[str, bytes]
     if isinstance(file, (ZipPath, Path)):
         data = file.read_text(encoding="utf-8")
-    else:
+    elif isinstance(file, str):
         data = file
+    else:
+        data = file.read()
 
-    content: YamlValue = _yaml_load.load(data)
-    return content
+    return load_yaml(data)
 
 
 def write_yaml(
@@ -76,7 +99,7 @@ def write_yaml(
         content = content.model_dump(mode="json")
 
     with cm as f:
-        _yaml_dump.dump(content, f)
+        _get_yaml_dump().dump(content, f)
 
 
 def _sanitize_bioimageio_yaml(content: YamlValue) -> BioimageioYamlContent:
@@ -131,11 +154,9 @@ def _open_bioimageio_zip(
     )
 
 
-def open_bioimageio_yaml(
+def _interprete_bioimageio_yaml_source(
     source: Union[PermissiveFileSource, ZipFile, ZipPath],
-    /,
-    **kwargs: Unpack[HashKwargs],
-) -> OpenedBioimageioYaml:
+) -> Union[PermissiveFileSource, ZipFile, ZipPath]:
     if (
         isinstance(source, str)
         and source.startswith("huggingface/")
@@ -163,75 +184,69 @@ def open_bioimageio_yaml(
     if isinstance(source, RelativeFilePath):
         source = source.absolute()
 
-    if isinstance(source, ZipFile):
-        return _open_bioimageio_zip(source, original_source_name=str(source))
-    elif isinstance(source, ZipPath):
-        return _open_bioimageio_rdf_in_zip(
-            source, original_root=source.root, original_source_name=str(source)
-        )
+    return source
 
-    try:
-        if isinstance(source, (Path, str)) and (source_dir := Path(source)).is_dir():
-            # open bioimageio yaml from a folder
-            src = source_dir / find_bioimageio_yaml_file_name(source_dir)
-        else:
-            src = interprete_file_source(source)
 
-        reader = get_reader(src, **kwargs)
+def _get_bioimageio_yaml_file_source(
+    source: PermissiveFileSource,
+) -> Union[FileSource, ZipPath]:
+    if isinstance(source, (Path, str)) and (source_dir := Path(source)).is_dir():
+        # open bioimageio yaml from a folder
+        return source_dir / find_bioimageio_yaml_file_name(source_dir)
+    else:
+        return interprete_file_source(source)
 
-    except Exception:
-        # check if `source` is a collection id
-        if (
-            not isinstance(source, str)
-            or not isinstance(settings.id_map, str)
-            or "/" not in settings.id_map
-        ):
-            raise
 
-        if settings.collection_http_pattern:
-            with ValidationContext(perform_io_checks=False):
-                url = HttpUrl(
-                    settings.collection_http_pattern.format(bioimageio_id=source)
-                )
+def _may_be_collection_id(source: PermissiveFileSource) -> TypeGuard[str]:
+    return (
+        isinstance(source, str)
+        and isinstance(settings.id_map, str)
+        and "/" in settings.id_map
+    )
 
-            try:
-                r = httpx.get(url, follow_redirects=True)
-                _ = r.raise_for_status()
-                unparsed_content = r.content.decode(encoding="utf-8")
-                content = _sanitize_bioimageio_yaml(read_yaml(unparsed_content))
-            except Exception as e:
-                logger.warning("Failed to get bioimageio.yaml from {}: {}", url, e)
-            else:
-                original_file_name = (
-                    "rdf.yaml" if url.path is None else url.path.split("/")[-1]
-                )
-                return OpenedBioimageioYaml(
-                    content=content,
-                    original_root=url.parent,
-                    original_file_name=original_file_name,
-                    original_source_name=source,
-                    unparsed_content=unparsed_content,
-                )
 
-        id_map = get_id_map()
-        if id_map and source not in id_map:
-            close_matches = get_close_matches(source, id_map)
-            if len(close_matches) == 0:
-                raise
+def _get_collection_url(source: str) -> HttpUrl:
+    with ValidationContext(perform_io_checks=False):
+        return HttpUrl(settings.collection_http_pattern.format(bioimageio_id=source))
 
-            if len(close_matches) == 1:
-                did_you_mean = f" Did you mean '{close_matches[0]}'?"
-            else:
-                did_you_mean = f" Did you mean any of {close_matches}?"
 
-            raise FileNotFoundError(f"'{source}' not found.{did_you_mean}")
+def _open_collection_bioimageio_yaml(
+    unparsed_content: str, *, url: HttpUrl, source: str
+) -> OpenedBioimageioYaml:
+    content = _sanitize_bioimageio_yaml(read_yaml(unparsed_content))
+    original_file_name = "rdf.yaml" if url.path is None else url.path.split("/")[-1]
+    return OpenedBioimageioYaml(
+        content=content,
+        original_root=url.parent,
+        original_file_name=original_file_name,
+        original_source_name=source,
+        unparsed_content=unparsed_content,
+    )
 
-        entry = id_map[source]
-        logger.info("loading {} from {}", source, entry.source)
-        reader = entry.get_reader()
-        with get_validation_context().replace(perform_io_checks=False):
-            src = HttpUrl(entry.source)
 
+def _get_id_map_entry(
+    source: str, id_map: Mapping[str, LightHttpFileDescr], error: Exception
+) -> LightHttpFileDescr:
+    if id_map and source not in id_map:
+        close_matches = get_close_matches(source, id_map)
+        if len(close_matches) == 0:
+            raise error
+
+        if len(close_matches) == 1:
+            did_you_mean = f" Did you mean '{close_matches[0]}'?"
+        else:
+            did_you_mean = f" Did you mean any of {close_matches}?"
+
+        raise FileNotFoundError(f"'{source}' not found.{did_you_mean}")
+
+    entry = id_map[source]
+    logger.info("loading {} from {}", source, entry.source)
+    return entry
+
+
+def _open_bioimageio_yaml_reader(
+    reader: BytesReader, src: Union[FileSource, ZipPath]
+) -> OpenedBioimageioYaml:
     if reader.is_zipfile:
         return _open_bioimageio_zip(ZipFile(reader), original_source_name=str(src))
 
@@ -255,6 +270,146 @@ def open_bioimageio_yaml(
     )
 
 
+def _open_remote_zip(
+    src: Union[FileSource, ZipPath], sha256: Optional[Sha256]
+) -> Optional[BytesReader]:
+    """Open a remote zip file with http range requests (if supported by the server),
+    such that only its central directory and accessed members are downloaded.
+
+    Returns:
+        None if **src** is not a remote zip file (or cannot be opened as such).
+    """
+    if (
+        not isinstance(src, HttpUrl)
+        or src.suffix.lower() != ".zip"
+        # verifying the SHA256 value requires downloading the whole file anyway
+        or sha256 is not None
+        or get_mirrored_file(str(src)) is not None
+    ):
+        return None
+
+    try:
+        remote = RemoteFile.open(str(src))
+    except Exception as e:
+        logger.debug("Failed to open {} with range requests: {}", src, e)
+        return None
+
+    if remote is None:
+        return None
+
+    return BytesReader(
+        remote,
+        sha256=None,
+        suffix=src.suffix,
+        original_file_name=extract_file_name(src),
+        original_root=src.parent,
+        is_zipfile=None,
+    )
+
+
+def open_bioimageio_yaml(
+    source: Union[PermissiveFileSource, ZipFile, ZipPath],
+    /,
+    **kwargs: Unpack[HashKwargs],
+) -> OpenedBioimageioYaml:
+    source = _interprete_bioimageio_yaml_source(source)
+    if isinstance(source, ZipFile):
+        return _open_bioimageio_zip(source, original_source_name=str(source))
+    elif isinstance(source, ZipPath):
+        return _open_bioimageio_rdf_in_zip(
+            source, original_root=source.root, original_source_name=str(source)
+        )
+
+    try:
+        src = _get_bioimageio_yaml_file_source(source)
+        reader = _open_remote_zip(src, kwargs.get("sha256"))
+        if reader is None:
+            reader = get_reader(src, **kwargs)
+    except Exception as error:
+        # check if `source` is a collection id
+        if not _may_be_collection_id(source):
+            raise
+
+        if settings.collection_http_pattern:
+            url = _get_collection_url(source)
+            try:
+                if (mirrored := get_mirrored_file(str(url))) is None:
+                    r = settings.http_client.get(str(url))
+                    _ = r.raise_for_status()
+                    data = r.content
+                else:
+                    data = mirrored.read_bytes()
+
+                unparsed_content = data.decode(encoding="utf-8")
+                return _open_collection_bioimageio_yaml(
+                    unparsed_content, url=url, source=source
+                )
+            except Exception as e:
+                logger.warning("Failed to get bioimageio.yaml from {}: {}", url, e)
+
+        entry = _get_id_map_entry(source, get_id_map(), error)
+        reader = entry.get_reader()
+        with get_validation_context().replace(perform_io_checks=False):
+            src = HttpUrl(entry.source)
+
+    return _open_bioimageio_yaml_reader(reader, src)
+
+
+async def aopen_bioimageio_yaml(
+    source: Union[PermissiveFileSource, ZipFile, ZipPath],
+    /,
+    **kwargs: Unpack[HashKwargs],
+) -> OpenedBioimageioYaml:
+    """Async counterpart of `open_bioimageio_yaml`"""
+    source = _interprete_bioimageio_yaml_source(source)
+    if isinstance(source, ZipFile):
+        return await to_thread(
+            _open_bioimageio_zip, source, original_source_name=str(source)
+        )
+    elif isinstance(source, ZipPath):
+        return await to_thread(
+            _open_bioimageio_rdf_in_zip,
+            source,
+            original_root=source.root,
+            original_source_name=str(source),
+        )
+
+    try:
+        src = _get_bioimageio_yaml_file_source(source)
+        reader = await to_thread(_open_remote_zip, src, kwargs.get("sha256"))
+        if reader is None:
+            reader = await aget_reader(src, **kwargs)
+    except Exception as error:
+        # check if `source` is a collection id
+        if not _may_be_collection_id(source):
+            raise
+
+        if settings.collection_http_pattern:
+            url = _get_collection_url(source)
+            try:
+                if (mirrored := get_mirrored_file(str(url))) is None:
+                    r = await settings.get_async_http_client().get(str(url))
+                    _ = r.raise_for_status()
+                    data = r.content
+                else:
+                    data = await to_thread(mirrored.read_bytes)
+
+                unparsed_content = data.decode(encoding="utf-8")
+                return _open_collection_bioimageio_yaml(
+                    unparsed_content, url=url, source=source
+                )
+            except Exception as e:
+                logger.warning("Failed to get bioimageio.yaml from {}: {}", url, e)
+
+        entry = _get_id_map_entry(source, await to_thread(get_id_map), error)
+        reader = await aget_reader(entry.source, sha256=entry.sha256)
+        with get_validation_context().replace(perform_io_checks=False):
+            src = HttpUrl(entry.source)
+
+    # reading a `RemoteFile` issues (blocking) http range requests
+    return await to_thread(_open_bioimageio_yaml_reader, reader, src)
+
+
 _IdMap = RootModel[Dict[str, LightHttpFileDescr]]
 
 
@@ -262,9 +417,10 @@ def _get_id_map_impl(url: str) -> Dict[str, LightHttpFileDescr]:
     if not isinstance(url, str) or "/" not in url:
         logger.opt(depth=1).error("invalid id map url: {}", url)
     try:
-        id_map_raw: Any = httpx.get(
-            url, timeout=settings.http_timeout, follow_redirects=True
-        ).json()
+        if (mirrored := get_mirrored_file(url)) is None:
+            id_map_raw: Any = settings.http_client.get(url).json()
+        else:
+            id_map_raw = json.loads(mirrored.read_bytes())
     except Exception as e:
         logger.opt(depth=1).error("failed to get {}: {}", url, e)
         return {}
@@ -290,58 +446,536 @@ def get_id_map() -> Mapping[str, LightHttpFileDescr]:
     return MappingProxyType(ret)
 
 
+_ZIP_CHUNK_SIZE = 1024 * 1024
+"""chunk size for reading and compressing zip archive members"""
+
+_ZIP_SPOOL_MEMORY = 256 * 1024 * 1024
+"""memory for members compressed in advance (shared by all compressing threads);
+larger members are held in temporary files until they are appended to the archive"""
+
+_ZIPFILE_INTERNALS = (
+    "_allowZip64",
+    "_didModify",
+    "_lock",
+    "_seekable",
+    "_writecheck",
+    "_writing",
+    "start_dir",
+)
+"""`ZipFile` attributes used by `_append_compressed_member`"""
+
+
+ZipCompressionPolicy = Callable[[FileName, bytes], bool]
+"""Decides whether to compress a zip archive member (with the compression method
+of the archive) given its name and its first bytes (up to 64 KiB).
+Members that are not compressed are stored."""
+
+STORED_SUFFIXES = frozenset(
+    {
+        # compressed images
+        ".gif",
+        ".jpeg",
+        ".jpg",
+        ".png",
+        ".webp",
+        # compressed archives and files
+        ".7z",
+        ".bz2",
+        ".gz",
+        ".tgz",
+        ".xz",
+        ".zip",
+        ".zst",
+        # to memory-map arrays (see `load_array`)
+        ".npy",
+    }
+)
+"""file name suffixes of zip archive members stored by `default_compression_policy`"""
+
+COMPRESSION_PROBE_SIZE = 64 * 1024
+"""number of bytes a `ZipCompressionPolicy` is given to decide on compression"""
+
+COMPRESSION_PROBE_MIN_SAVING = 0.1
+"""minimal relative size reduction of a compression probe
+for `default_compression_policy` to compress a member"""
+
+
+def default_compression_policy(file_name: FileName, head: bytes) -> bool:
+    """The default `ZipCompressionPolicy` for bioimage.io packages.
+
+    Members with a suffix in `STORED_SUFFIXES` are stored
+    (already compressed content or arrays to be memory-mapped).
+    Other members are compressed only if a quick compression probe
+    of their first bytes (**head**) is promising,
+    e.g. HDF5 or TIFF files with internal compression or
+    model weights of (random looking) floating point numbers are stored.
+    """
+    if PurePosixPath(file_name).suffix.lower() in STORED_SUFFIXES:
+        return False
+
+    if len(head) < 1024:
+        return True  # small members are cheap to compress either way
+
+    probe = zlib.compress(head[:COMPRESSION_PROBE_SIZE], 1)
+    return len(probe) <= (1 - COMPRESSION_PROBE_MIN_SAVING) * len(head)
+
+
+def compress_all(file_name: FileName, head: bytes) -> bool:
+    """`ZipCompressionPolicy` to compress all members"""
+    return True
+
+
+@dataclass(frozen=True, **SLOTS)
+class _CompressedMember:
+    """a zip archive member compressed in advance (see `_compress_member`)"""
+
+    info: ZipInfo
+    data: "IO[bytes]"
+    """compressed data"""
+
+    sha256: Optional[Sha256]
+    """SHA256 value of the (uncompressed) content (if known)"""
+
+
+@dataclass(frozen=True, **SLOTS)
+class CompressedZipMember:
+    """A member of a local zip file to be copied verbatim by `write_content_to_zip`
+    (without recompressing it).
+
+    The member is decompressed once to verify its CRC and compute its SHA256 value.
+    """
+
+    path: Path
+    """zip file"""
+
+    info: ZipInfo
+    """zip archive member"""
+
+
+def _hash_zip_member(path: Path, info: ZipInfo) -> Sha256:
+    """compute the SHA256 value of a zip archive member
+    (`ZipFile` verifies its CRC while reading)"""
+    sha = hashlib.sha256()
+    with ZipFile(path) as zf, zf.open(info) as f:
+        while chunk := f.read(_ZIP_CHUNK_SIZE):
+            sha.update(chunk)
+
+    return Sha256(sha.hexdigest())
+
+
+def _open_compressed_member(
+    arc_name: FileName, member: CompressedZipMember
+) -> _CompressedMember:
+    src = member.info
+    if src.flag_bits & 0x1:
+        raise ValueError(
+            f"Cannot copy encrypted member {src.filename} of {member.path}"
+        )
+
+    sha = _hash_zip_member(member.path, src)
+
+    info = ZipInfo(arc_name, date_time=src.date_time)
+    info.compress_type = src.compress_type
+    info.external_attr = src.external_attr
+    info.CRC = src.CRC
+    info.file_size = src.file_size
+    info.compress_size = src.compress_size
+    data = member.path.open("rb")
+    try:
+        _ = data.seek(_get_zip_member_data_offset(member.path, src))
+    except BaseException:
+        data.close()
+        raise
+
+    return _CompressedMember(info, data, sha)
+
+
+def _open_member(
+    arc_name: FileName,
+    file: Union[
+        str, FilePath, ZipPath, BioimageioYamlContentView, FileDescr, BytesReader
+    ],
+    zip_filename: Optional[str],
+) -> Optional[BytesReaderP]:
+    """open the content of a zip archive member
+
+    Returns:
+        None if **file** is the member **arc_name** of the archive itself.
+    """
+    if isinstance(file, collections.abc.Mapping):
+        buf = io.StringIO()
+        write_yaml(file, buf)
+        file = buf.getvalue()
+
+    if isinstance(file, str):
+        return io.BytesIO(file.encode("utf-8"))
+
+    if isinstance(file, BytesReader):
+        reader = file
+    else:
+        reader = get_reader(file)
+
+    if (
+        isinstance(reader.original_root, ZipFile)
+        and reader.original_root.filename == zip_filename
+        and reader.original_file_name == arc_name
+    ):
+        logger.debug(
+            f"Not copying {reader.original_root}/{reader.original_file_name} to itself."
+        )
+        return None
+
+    return reader
+
+
+def _get_member_info(
+    arc_name: FileName,
+    file: Union[
+        str, FilePath, ZipPath, BioimageioYamlContentView, FileDescr, BytesReader
+    ],
+) -> ZipInfo:
+    """get the same member metadata as `ZipFile.writestr` (for text)
+    or `ZipFile.open` (for files) would use"""
+    if isinstance(file, (str, collections.abc.Mapping)):
+        info = ZipInfo(arc_name, date_time=time.localtime(time.time())[:6])
+    else:
+        info = ZipInfo(arc_name)
+
+    info.external_attr = 0o600 << 16  # permissions: ?rw-------
+    return info
+
+
+def _get_remaining_size(reader: BytesReaderP) -> Optional[int]:
+    if not reader.seekable():
+        return None
+
+    pos = reader.tell()
+    end = reader.seek(0, io.SEEK_END)
+    _ = reader.seek(pos)
+    return end - pos
+
+
+def _write_member(
+    zip: ZipFile,
+    arc_name: FileName,
+    file: Union[
+        str, FilePath, ZipPath, BioimageioYamlContentView, FileDescr, BytesReader
+    ],
+    compression_policy: ZipCompressionPolicy,
+) -> Optional[Sha256]:
+    """write a member to **zip**, compressing it on the fly
+    (followed by a data descriptor if **zip** is written to a non-seekable stream)
+
+    Returns:
+        SHA256 value of the written content
+        or None if **file** is the member **arc_name** of **zip** itself.
+    """
+    reader = _open_member(arc_name, file, zip.filename)
+    if reader is None:
+        return None
+
+    return _stream_member(
+        zip,
+        _get_member_info(arc_name, file),
+        reader,
+        _get_remaining_size(reader),
+        compression_policy,
+    )
+
+
+def _recompress_member(
+    zip: ZipFile,
+    arc_name: FileName,
+    member: CompressedZipMember,
+    compression_policy: ZipCompressionPolicy,
+) -> Sha256:
+    """copy **member** by decompressing and recompressing it
+    (fallback if it cannot be copied verbatim, see `_can_append_compressed_members`)"""
+    info = ZipInfo(arc_name, date_time=member.info.date_time)
+    info.external_attr = member.info.external_attr
+    with ZipFile(member.path) as src, src.open(member.info) as reader:
+        return _stream_member(
+            zip, info, reader, member.info.file_size, compression_policy
+        )
+
+
+def _stream_member(
+    zip: ZipFile,
+    info: ZipInfo,
+    reader: BytesReaderP,
+    size: Optional[int],
+    compression_policy: ZipCompressionPolicy,
+) -> Sha256:
+    """write **size** bytes (or all if unknown) of **reader** to **zip**
+    with `ZipFile.open`, compressing them on the fly
+
+    Returns:
+        SHA256 value of the written content
+    """
+    chunk = reader.read(COMPRESSION_PROBE_SIZE)
+    if zip.compression != zipfile.ZIP_STORED and compression_policy(
+        info.filename, chunk
+    ):
+        info.compress_type = zip.compression
+        cast(Any, info)._compresslevel = zip.compresslevel
+
+    if size is not None:
+        info.file_size = size  # (to decide on ZIP64 extensions)
+
+    sha = hashlib.sha256()
+    with zip.open(info, "w", force_zip64=size is None) as dest:
+        while chunk:
+            sha.update(chunk)
+            _ = dest.write(chunk)
+            chunk = reader.read(_ZIP_CHUNK_SIZE)
+
+    return Sha256(sha.hexdigest())
+
+
+def _compress_member(
+    arc_name: FileName,
+    file: Union[
+        str, FilePath, ZipPath, BioimageioYamlContentView, FileDescr, BytesReader
+    ],
+    zip_filename: Optional[str],
+    compress_type: int,
+    compresslevel: Optional[int],
+    compression_policy: ZipCompressionPolicy,
+    spool_size: int,
+) -> Optional[_CompressedMember]:
+    reader = _open_member(arc_name, file, zip_filename)
+    if reader is None:
+        return None
+
+    chunk = reader.read(COMPRESSION_PROBE_SIZE)
+    if not compression_policy(arc_name, chunk):
+        compress_type = zipfile.ZIP_STORED
+
+    info = _get_member_info(arc_name, file)
+    info.compress_type = compress_type
+    compressor = cast(Any, zipfile)._get_compressor(compress_type, compresslevel)
+    data = tempfile.SpooledTemporaryFile(max_size=spool_size)
+    sha = hashlib.sha256()
+    try:
+        crc = 0
+        size = 0
+        while chunk:
+            crc = zlib.crc32(chunk, crc)
+            sha.update(chunk)
+            size += len(chunk)
+            _ = data.write(chunk if compressor is None else compressor.compress(chunk))
+            chunk = reader.read(_ZIP_CHUNK_SIZE)
+
+        if compressor is not None:
+            _ = data.write(compressor.flush())
+
+        info.CRC = crc
+        info.file_size = size
+        info.compress_size = data.tell()
+        _ = data.seek(0)
+    except BaseException:
+        data.close()
+        raise
+
+    return _CompressedMember(info, cast("IO[bytes]", data), Sha256(sha.hexdigest()))
+
+
+def _can_append_compressed_members(zip: ZipFile) -> bool:
+    """whether the `ZipFile` internals used by `_append_compressed_member`
+    (and `zipfile._get_compressor` used by `_compress_member`) are available"""
+    return hasattr(zipfile, "_get_compressor") and all(
+        hasattr(zip, attr) for attr in _ZIPFILE_INTERNALS
+    )
+
+
+def _append_compressed_member(zip: ZipFile, member: _CompressedMember):
+    """append a member compressed in advance to **zip**
+
+    Mirrors `ZipFile.open(..., "w")`, except that CRC and sizes are known
+    upfront and are written to the local file header directly.
+    Requires `_can_append_compressed_members`.
+    """
+    info = member.info
+    zf = cast(Any, zip)  # (using ZipFile internals)
+    if zf.fp is None:
+        raise ValueError("Attempt to write to ZIP archive that was already closed")
+
+    if info.compress_type == zipfile.ZIP_LZMA:
+        info.flag_bits |= 0x02  # compressed data includes an end-of-stream marker
+
+    zip64 = max(info.file_size, info.compress_size) > zipfile.ZIP64_LIMIT
+    if zip64 and not zf._allowZip64:
+        raise zipfile.LargeZipFile("Filesize would require ZIP64 extensions")
+
+    with zf._lock:
+        if zf._writing:
+            raise ValueError(
+                "Can't write to ZIP archive while an open writing handle exists."
+            )
+
+        if zf._seekable:
+            zf.fp.seek(zf.start_dir)
+
+        info.header_offset = zf.fp.tell()
+        zf._writecheck(info)
+        zf._didModify = True
+        zf.fp.write(info.FileHeader(zip64))
+        remaining = info.compress_size
+        while remaining > 0:
+            chunk = member.data.read(min(remaining, _ZIP_CHUNK_SIZE))
+            if not chunk:
+                raise EOFError(f"Compressed data of {info.filename} is truncated.")
+
+            zf.fp.write(chunk)
+            remaining -= len(chunk)
+
+        zf.start_dir = zf.fp.tell()
+        zip.filelist.append(info)
+        zip.NameToInfo[info.filename] = info
+
+
+def _discard_compressed_member(future: "Future[Optional[_CompressedMember]]"):
+    if future.cancelled() or future.exception() is not None:
+        return
+
+    member = future.result()
+    if member is not None:
+        member.data.close()
+
+
 def write_content_to_zip(
     content: Mapping[
         FileName,
         Union[
-            str, FilePath, ZipPath, BioimageioYamlContentView, FileDescr, BytesReader
+            str,
+            FilePath,
+            ZipPath,
+            BioimageioYamlContentView,
+            FileDescr,
+            BytesReader,
+            CompressedZipMember,
         ],
     ],
     zip: zipfile.ZipFile,
-):
+    *,
+    compression_policy: ZipCompressionPolicy = default_compression_policy,
+    streaming: bool = False,
+) -> Dict[FileName, Sha256]:
     """write strings as text, dictionaries as yaml and files to a ZipFile
+
+    Members are compressed concurrently (see `settings.package_compression_workers`)
+    and appended to **zip** in order.
+
     Args:
         content: dict mapping archive names to local file paths,
                  strings (for text files), or dict (for yaml files).
+                 Members of other zip files (`CompressedZipMember`)
+                 are copied as they are (without recompressing them).
         zip: ZipFile
+        compression_policy: decides which members to compress
+            with the compression method of **zip** (others are stored).
+        streaming: Write one member after the other, compressing it on the fly,
+            such that only one source is open at a time and memory use is bounded
+            (e.g. to stream **zip** to a non-seekable sink).
+
+    Returns:
+        SHA256 values of the written members
+        (computed while writing, e.g. to validate the archive without rehashing)
     """
-    for arc_name, file in content.items():
-        if isinstance(file, collections.abc.Mapping):
-            buf = io.StringIO()
-            write_yaml(file, buf)
-            file = buf.getvalue()
-
-        if isinstance(file, str):
-            zip.writestr(arc_name, file.encode("utf-8"))
-        else:
-            if isinstance(file, BytesReader):
-                reader = file
+    written: Dict[FileName, Sha256] = {}
+    can_append = _can_append_compressed_members(zip)
+    if not can_append:
+        logger.debug("compressing zip members sequentially (unsupported `ZipFile`)")
+
+    if streaming or zip.compression == zipfile.ZIP_STORED or not can_append:
+        # (nothing to compress concurrently for stored archives)
+        for arc_name, file in content.items():
+            if isinstance(file, CompressedZipMember) and can_append:
+                member = _open_compressed_member(arc_name, file)
+                with member.data:
+                    _append_compressed_member(zip, member)
+
+                sha = member.sha256
+            elif isinstance(file, CompressedZipMember):
+                sha = _recompress_member(zip, arc_name, file, compression_policy)
             else:
-                reader = get_reader(file)
-
-            if (
-                isinstance(reader.original_root, ZipFile)
-                and reader.original_root.filename == zip.filename
-                and reader.original_file_name == arc_name
-            ):
-                logger.debug(
-                    f"Not copying {reader.original_root}/{reader.original_file_name} to itself."
-                )
-                continue
-
-            with zip.open(arc_name, "w") as dest:
-                shutil.copyfileobj(reader, dest, 1024 * 8)
+                sha = _write_member(zip, arc_name, file, compression_policy)
+
+            if sha is not None:
+                written[arc_name] = sha
+
+        return written
+
+    workers = settings.package_compression_workers or os.cpu_count() or 1
+    # up to 3 * workers members are held at once (compressing or pending)
+    spool_size = max(_ZIP_CHUNK_SIZE, _ZIP_SPOOL_MEMORY // (3 * workers))
+    pending: Deque["Future[Optional[_CompressedMember]]"] = deque()
+
+    def append_next():
+        member = pending.popleft().result()
+        if member is not None:
+            with member.data:
+                _append_compressed_member(zip, member)
+
+            if member.sha256 is not None:
+                written[member.info.filename] = member.sha256
+
+    with ThreadPoolExecutor(
+        max_workers=workers, thread_name_prefix="bioimageio_zip"
+    ) as executor:
+        try:
+            for arc_name, file in content.items():
+                future: "Future[Optional[_CompressedMember]]"
+                if isinstance(file, CompressedZipMember):
+                    future = executor.submit(_open_compressed_member, arc_name, file)
+                else:
+                    future = executor.submit(
+                        copy_context().run,
+                        _compress_member,
+                        arc_name,
+                        file,
+                        zip.filename,
+                        zip.compression,
+                        zip.compresslevel,
+                        compression_policy,
+                        spool_size,
+                    )
+
+                pending.append(future)
+                # bound the number of compressed members waiting to be appended
+                while len(pending) > 2 * workers:
+                    append_next()
+
+            while pending:
+                append_next()
+        finally:
+            for future in pending:
+                _ = future.cancel()
+                future.add_done_callback(_discard_compressed_member)
+
+    return written
 
 
 def write_zip(
     path: Union[FilePath, IO[bytes]],
     content: Mapping[
-        FileName, Union[str, FilePath, ZipPath, BioimageioYamlContentView, BytesReader]
+        FileName,
+        Union[
+            str,
+            FilePath,
+            ZipPath,
+            BioimageioYamlContentView,
+            FileDescr,
+            BytesReader,
+            CompressedZipMember,
+        ],
     ],
     *,
     compression: int,
     compression_level: int,
-) -> None:
+    compression_policy: ZipCompressionPolicy = default_compression_policy,
+    streaming: bool = False,
+) -> Dict[FileName, Sha256]:
     """Write a zip archive.
 
     Args:
@@ -350,7 +984,12 @@ def write_zip(
         compression: The numeric constant of compression method.
         compression_level: Compression level to use when writing files to the archive.
                            See https://docs.python.org/3/library/zipfile.html#zipfile.ZipFile
+        compression_policy: Decides which files to compress (others are stored).
+        streaming: Write one file after the other with bounded memory use
+            (see `write_content_to_zip`).
 
+    Returns:
+        SHA256 values of the written files (computed while writing).
     """
     if isinstance(path, Path):
         path.parent.mkdir(parents=True, exist_ok=True)
@@ -358,16 +997,104 @@ def write_zip(
     with ZipFile(
         path, "w", compression=compression, compresslevel=compression_level
     ) as zip:
-        write_content_to_zip(content, zip)
+        return write_content_to_zip(
+            content, zip, compression_policy=compression_policy, streaming=streaming
+        )
+
 
+def load_array(
+    source: Union[FileSource, FileDescr, ZipPath], *, mmap: bool = False
+) -> NDArray[Any]:
+    """load a numpy ndarray from a .npy file
 
-def load_array(source: Union[FileSource, FileDescr, ZipPath]) -> NDArray[Any]:
-    """load a numpy ndarray from a .npy file"""
-    reader = get_reader(source)
+    Args:
+        source: .npy file source
+        mmap: Memory-map the array (read-only) instead of reading it into memory.
+            Only local files and stored (uncompressed) zip archive members
+            (e.g. .npy files in bioimage.io packages, see `default_compression_policy`)
+            are memory-mapped; other sources are read into memory.
+            (The SHA256 value of a memory-mapped `FileDescr` is not verified.)
+    """
     if settings.allow_pickle:
         logger.warning("Loading numpy array with `allow_pickle=True`.")
 
-    return numpy.load(reader, allow_pickle=settings.allow_pickle)
+    if mmap:
+        mapped = _memmap_array(source)
+        if mapped is not None:
+            return mapped
+
+    with get_reader(source) as reader:
+        return numpy.load(reader, allow_pickle=settings.allow_pickle)
+
+
+def _memmap_array(
+    source: Union[FileSource, FileDescr, ZipPath],
+) -> Optional[NDArray[Any]]:
+    """memory-map a .npy file (if it is a local file or a stored zip member)"""
+    if isinstance(source, FileDescr):
+        source = source.source
+
+    if isinstance(source, RelativeFilePath):
+        source = source.absolute()
+
+    if isinstance(source, Path):
+        path = source
+        offset = 0
+    elif isinstance(source, ZipPath):
+        zf = source.root
+        if zf.filename is None or not Path(zf.filename).is_file():
+            return None  # zip file is not backed by a local file
+
+        info = zf.getinfo(source.at)
+        if info.compress_type != zipfile.ZIP_STORED or info.flag_bits & 0x1:
+            return None  # compressed or encrypted member
+
+        path = Path(zf.filename)
+        offset = _get_zip_member_data_offset(path, info)
+    else:
+        return None
+
+    with path.open("rb") as f:
+        _ = f.seek(offset)
+        version = numpy.lib.format.read_magic(f)
+        if version == (1, 0):
+            shape, fortran_order, dtype = numpy.lib.format.read_array_header_1_0(f)
+        elif version == (2, 0):
+            shape, fortran_order, dtype = numpy.lib.format.read_array_header_2_0(f)
+        else:
+            return None
+
+        offset = f.tell()
+
+    if dtype.hasobject or not all(shape):
+        return None  # object arrays and empty arrays cannot be memory-mapped
+
+    return numpy.memmap(
+        path,
+        dtype=dtype,
+        mode="r",
+        offset=offset,
+        shape=shape,
+        order="F" if fortran_order else "C",
+    )
+
+
+def _get_zip_member_data_offset(path: Path, info: zipfile.ZipInfo) -> int:
+    """get the offset of a zip member's data (following its local file header)"""
+    header_format = "<4s22xHH"  # signature, ..., file name length, extra field length
+    header_size = struct.calcsize(header_format)
+    with path.open("rb") as f:
+        _ = f.seek(info.header_offset)
+        header = f.read(header_size)
+
+    if len(header) != header_size:
+        raise zipfile.BadZipFile(f"Truncated local file header of {info.filename}")
+
+    signature, name_length, extra_length = struct.unpack(header_format, header)
+    if signature != b"PK\x03\x04":
+        raise zipfile.BadZipFile(f"Bad local file header of {info.filename}")
+
+    return info.header_offset + header_size + name_length + extra_length
 
 
 def save_array(path: Union[Path, ZipPath], array: NDArray[Any]) -> None:
@@ -0,0 +1,92 @@
+"""Local mirror of remote files, e.g. for compute nodes without internet access
+(see `settings.mirror` and `settings.mirror_rules`)"""
+
+import os
+from pathlib import Path, PurePosixPath
+from tempfile import NamedTemporaryFile
+from typing import Optional
+from urllib.parse import urlsplit
+from urllib.request import url2pathname
+
+from ._settings import settings
+from .io_basics import BytesReaderP
+
+
+def file_url_to_path(value: str) -> Path:
+    """convert a 'file://' URL to a local path (other values are interpreted as paths)"""
+    if value.startswith("file://"):
+        return Path(url2pathname(urlsplit(value).path))
+
+    return Path(value)
+
+
+def _join(directory: Path, relative: str) -> Optional[Path]:
+    parts = PurePosixPath(relative).parts
+    if not parts or ".." in parts or PurePosixPath(relative).is_absolute():
+        return None
+
+    return directory.joinpath(*parts)
+
+
+def get_mirror_path(url: str, mirror: Optional[Path]) -> Optional[Path]:
+    """Map **url** to its location in a mirror (irrespective of its existence).
+
+    The longest URL prefix in `settings.mirror_rules` determines the directory
+    the remainder of **url** is resolved against.
+    Other URLs are mapped to '<mirror>/<host>/<path>'.
+
+    Args:
+        url: URL to map
+        mirror: mirror directory (relative directories of `settings.mirror_rules`
+            are resolved against it)
+
+    Returns:
+        None if **url** cannot be mapped, e.g. if it has a query string.
+    """
+    for prefix in sorted(settings.mirror_rules, key=len, reverse=True):
+        if not url.startswith(prefix):
+            continue
+
+        directory = file_url_to_path(settings.mirror_rules[prefix])
+        if not directory.is_absolute():
+            if mirror is None:
+                return None
+
+            directory = mirror / directory
+
+        return _join(directory, url[len(prefix) :].split("?", 1)[0])
+
+    split = urlsplit(url)
+    if (
+        mirror is None
+        or split.scheme not in ("http", "https")
+        or split.query
+        or not split.netloc
+    ):
+        return None
+
+    return _join(mirror / split.netloc, split.path.lstrip("/"))
+
+
+def get_mirrored_file(url: str) -> Optional[Path]:
+    """get the local copy of **url** in the configured mirror (if any)"""
+    if settings.mirror is None and not settings.mirror_rules:
+        return None
+
+    path = get_mirror_path(url, settings.mirror)
+    if path is None or not path.is_file():
+        return None
+
+    return path
+
+
+def write_mirrored_file(path: Path, reader: BytesReaderP):
+    """write the content of **reader** atomically to **path**"""
+    path.parent.mkdir(parents=True, exist_ok=True)
+    with NamedTemporaryFile(
+        "wb", dir=path.parent, prefix=".", suffix=".tmp", delete=False
+    ) as f:
+        while chunk := reader.read(1024 * 1024):
+            _ = f.write(chunk)
+
+    os.replace(f.name, path)
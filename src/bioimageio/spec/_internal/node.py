@@ -12,8 +12,10 @@ from typing import (
 )
 
 import pydantic
+from pydantic import ModelWrapValidatorHandler, model_validator
 from typing_extensions import Self
 
+from .field_warning import is_collecting_warnings, validating_node
 from .type_guards import is_kwargs
 from .validation_context import ValidationContext, get_validation_context
 
@@ -42,6 +44,17 @@ class Node(
 ):
     """"""  # empty docstring to remove all pydantic docstrings from the pdoc spec docs
 
+    @model_validator(mode="wrap")
+    @classmethod
+    def _track_node_validation(
+        cls, data: Any, handler: ModelWrapValidatorHandler[Self]
+    ) -> Self:
+        if not is_collecting_warnings():
+            return handler(data)  # no need to locate or discard warnings
+
+        with validating_node(data):
+            return handler(data)
+
     @classmethod
     def model_validate(
         cls,
@@ -1,3 +1,4 @@
+from threading import Lock
 from typing import Any, Optional, Protocol
 
 from rich.progress import Progress
@@ -44,3 +45,68 @@ class RichOverallProgress:
 
     def __call__(self, description: str = "", *, total: Optional[int] = None):
         return RichTaskBar(description, parent=self.progress, total=total)
+
+
+class CombinedProgress:
+    """Combine the progress of concurrent tasks in a single progressbar.
+
+    Calling a `CombinedProgress` instance returns a new (thread-safe) progressbar
+    that adds its total and progress to the shared **progressbar**.
+    """
+
+    def __init__(self, progressbar: Progressbar, description: str = ""):
+        super().__init__()
+        self.progressbar = progressbar
+        self._lock = Lock()
+        self._total = 0
+        self.progressbar.total = 0
+        if description:
+            self.progressbar.set_description(description)
+
+    def __call__(self) -> "PartialProgressbar":
+        return PartialProgressbar(self)
+
+    def add(self, *, total: int = 0, progress: int = 0):
+        with self._lock:
+            if total:
+                self._total += total
+                self.progressbar.total = self._total
+
+            if progress:
+                _ = self.progressbar.update(progress)
+
+    def close(self):
+        self.progressbar.close()
+
+
+class PartialProgressbar:
+    """A progressbar reporting to a `CombinedProgress`"""
+
+    def __init__(self, parent: CombinedProgress):
+        super().__init__()
+        self.parent = parent
+        self.total: Optional[int] = None
+        self.n = 0
+        self._reported_total = 0
+
+    def _report_total(self):
+        total = self.total or 0
+        if total != self._reported_total:
+            self.parent.add(total=total - self._reported_total)
+            self._reported_total = total
+
+    def update(self, increment: int, /):
+        self._report_total()
+        self.n += increment
+        self.parent.add(progress=increment)
+
+    def reset(self):
+        self._report_total()
+        self.parent.add(progress=-self.n)
+        self.n = 0
+
+    def close(self):
+        self._report_total()  # the combined progressbar is closed by its owner
+
+    def set_description(self, description: str, /, refresh: bool = True):
+        pass  # the combined progressbar has a common description
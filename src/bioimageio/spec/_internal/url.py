@@ -1,6 +1,8 @@
+import time
 from contextlib import nullcontext
-from pathlib import PurePosixPath
-from typing import Any, ClassVar, Optional, Type, Union
+from dataclasses import dataclass, replace
+from pathlib import Path, PurePosixPath
+from typing import Any, ClassVar, Dict, Mapping, Optional, Type, Union
 
 import httpx
 import pydantic
@@ -10,18 +12,122 @@ from typing_extensions import Literal, assert_never
 
 from . import warning_levels
 from ._settings import settings
-from .field_warning import issue_warning
+from .disk_store import DiskStore
+from .field_warning import collect_warnings, issue_warning
+from .mirror import get_mirrored_file
 from .root_url import RootHttpUrl
+from .utils import SLOTS, cache
 from .validation_context import get_validation_context
 
 
 def _validate_url(url: Union[str, pydantic.HttpUrl]) -> pydantic.HttpUrl:
-    return _validate_url_impl(url, request_mode="head", timeout=settings.http_timeout)
+    return _validate_url_impl(url, timeout=settings.http_timeout)
+
+
+@dataclass(frozen=True, **SLOTS)
+class UrlCheck:
+    """Result of checking the availability of a URL"""
+
+    request_mode: Literal["head", "get_stream", "get"]
+    """request mode of the (final) request"""
+
+    status_code: int
+    reason: str
+    location: Optional[str] = None
+    etag: Optional[str] = None
+    last_modified: Optional[str] = None
+
+    timestamp: float = 0.0
+    """time of the check in seconds since the epoch"""
+
+    @property
+    def ok(self) -> bool:
+        return self.status_code in (200, 301, 302, 303, 308)
+
+    @property
+    def ttl(self) -> float:
+        """time in seconds for which this check result may be reused"""
+        return settings.url_check_ttl if self.ok else settings.url_check_negative_ttl
+
+
+@cache
+def _get_url_check_store(cache_path: Path) -> DiskStore[UrlCheck]:
+    return DiskStore(cache_path / "url_checks", UrlCheck)
+
+
+def _request_url_check(
+    url: str,
+    request_mode: Literal["head", "get_stream", "get"],
+    timeout: float,
+    headers: Mapping[str, str],
+) -> UrlCheck:
+    client = settings.http_client
+    if request_mode in ("head", "get"):
+        request_ctxt = nullcontext(
+            client.request(request_mode.upper(), url, timeout=timeout, headers=headers)
+        )
+    elif request_mode == "get_stream":
+        request_ctxt = client.stream("GET", url, timeout=timeout, headers=headers)
+    else:
+        assert_never(request_mode)
+
+    with request_ctxt as r:
+        return UrlCheck(
+            request_mode=request_mode,
+            status_code=r.status_code,
+            reason=r.reason_phrase,
+            location=r.headers.get("location"),
+            etag=r.headers.get("etag"),
+            last_modified=r.headers.get("last-modified"),
+            timestamp=time.time(),
+        )
+
+
+def _check_url(url: str, timeout: float) -> UrlCheck:
+    """Check **url** with a HEAD request, falling back to GET requests.
+
+    Check results are cached in `settings.cache_path`
+    (see `settings.url_check_ttl` and `settings.url_check_negative_ttl`).
+    """
+    if get_validation_context().disable_cache:
+        store = None
+        cached = None
+    else:
+        store = _get_url_check_store(settings.cache_path)
+        cached = store.get(url)
+
+    conditional_headers: Dict[str, str] = {}
+    if cached is not None:
+        if time.time() - cached.timestamp < cached.ttl:
+            return cached
+
+        if cached.ok:
+            # refresh with a conditional request
+            if cached.etag is not None:
+                conditional_headers["If-None-Match"] = cached.etag
+            if cached.last_modified is not None:
+                conditional_headers["If-Modified-Since"] = cached.last_modified
+
+    check = _request_url_check(
+        url, "head", timeout=timeout, headers=conditional_headers
+    )
+    if check.status_code == 304 and cached is not None:  # not modified
+        check = replace(cached, timestamp=check.timestamp)
+
+    for request_mode in ("get_stream", "get"):
+        if check.ok:
+            break
+
+        check = _request_url_check(url, request_mode, timeout=timeout, headers={})
+
+    if store is not None and check.ttl > 0:
+        store.set(url, check)
+
+    return check
 
 
 def _validate_url_impl(
     url: Union[str, pydantic.HttpUrl],
-    request_mode: Literal["head", "get_stream", "get"],
     timeout: float,
 ) -> pydantic.HttpUrl:
     url = str(url)
@@ -29,6 +135,10 @@ def _validate_url_impl(
     if url in context.known_files:
         return pydantic.HttpUrl(url)
 
+    if get_mirrored_file(url) is not None:
+        context.known_files[url] = None
+        return pydantic.HttpUrl(url)
+
     val_url = url
 
     if url.startswith("http://example.com") or url.startswith("https://example.com"):
@@ -49,27 +159,7 @@ def _validate_url_impl(
         )
 
     try:
-        if request_mode in ("head", "get"):
-            request_ctxt = nullcontext(
-                httpx.request(
-                    request_mode.upper(),
-                    val_url,
-                    timeout=timeout,
-                    follow_redirects=True,
-                )
-            )
-        elif request_mode == "get_stream":
-            request_ctxt = httpx.stream(
-                "GET", val_url, timeout=timeout, follow_redirects=True
-            )
-        else:
-            assert_never(request_mode)
-
-        with request_ctxt as r:
-            status_code = r.status_code
-            reason = r.reason_phrase
-            location = r.headers.get("location")
-
+        check = _check_url(val_url, timeout=timeout)
     except (
         httpx.InvalidURL,
         httpx.TooManyRedirects,
@@ -88,41 +178,35 @@ def _validate_url_impl(
             msg_context={"error": str(e)},
         )
     else:
-        if status_code == 200:  # ok
+        if check.status_code == 200:  # ok
             pass
-        elif status_code in (302, 303):  # found
+        elif check.status_code in (302, 303):  # found
             pass
-        elif status_code in (301, 308):
+        elif check.status_code in (301, 308):
             issue_warning(
                 "URL redirected ({status_code}): consider updating {value} with new"
                 + " location: {location}",
                 value=url,
                 severity=warning_levels.INFO,
                 msg_context={
-                    "status_code": status_code,
-                    "location": location,
+                    "status_code": check.status_code,
+                    "location": check.location,
                 },
             )
-        elif request_mode == "head":
-            return _validate_url_impl(url, request_mode="get_stream", timeout=timeout)
-        elif request_mode == "get_stream":
-            return _validate_url_impl(url, request_mode="get", timeout=timeout)
-        elif request_mode == "get":
+        else:
             issue_warning(
                 "{status_code}: {reason} ({value})",
                 value=url,
                 severity=(
                     warning_levels.INFO
-                    if status_code == 405  # may be returned due to a captcha
+                    if check.status_code == 405  # may be returned due to a captcha
                     else warning_levels.WARNING
                 ),
                 msg_context={
-                    "status_code": status_code,
-                    "reason": reason,
+                    "status_code": check.status_code,
+                    "reason": check.reason,
                 },
             )
-        else:
-            assert_never(request_mode)
 
     context.known_files[url] = None
     return pydantic.HttpUrl(url)
@@ -147,7 +231,10 @@ class HttpUrl(RootHttpUrl):
         if self._exists is None:
             ctxt = get_validation_context()
             try:
-                with ctxt.replace(warning_level=warning_levels.WARNING):
+                # raise warnings to determine existence (and do not record them)
+                with ctxt.replace(
+                    warning_level=warning_levels.WARNING
+                ), collect_warnings():
                     self._validated = _validate_url(self._validated)
             except Exception as e:
                 if ctxt.log_warnings:
@@ -1,6 +1,9 @@
 from __future__ import annotations
 
+import asyncio
+import contextvars
 import dataclasses
+import functools
 import re
 import sys
 from dataclasses import dataclass
@@ -112,6 +115,21 @@ def unindent(text: str, ignore_first_line: bool = False):
 T = TypeVar("T")
 P = ParamSpec("P")
 
+if sys.version_info < (3, 9):  # pragma: no cover
+
+    async def to_thread(
+        func: Callable[P, T], /, *args: P.args, **kwargs: P.kwargs
+    ) -> T:
+        """backport of `asyncio.to_thread`"""
+        loop = asyncio.get_running_loop()
+        ctx = contextvars.copy_context()
+        return await loop.run_in_executor(
+            None, functools.partial(ctx.run, func, *args, **kwargs)
+        )
+
+else:
+    from asyncio import to_thread as to_thread
+
 
 def assert_all_params_set_explicitly(fn: Callable[P, T]) -> Callable[P, T]:
     @wraps(fn)
@@ -0,0 +1,196 @@
+"""Opt-in cache of validation results (see `settings.validation_cache`)"""
+
+import hashlib
+import json
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Type, Union
+from zipfile import ZipFile
+
+from loguru import logger
+
+from .._version import VERSION
+from ..summary import ValidationSummary
+from ._settings import settings
+from .common_nodes import ResourceDescrBase
+from .disk_store import DiskStore
+from .file_hashes import get_file_sha256
+from .io import (
+    OpenedBioimageioYaml,
+    RelativeFilePath,
+    get_reader,
+    interprete_file_source,
+)
+from .io_basics import Sha256, ZipPath
+from .utils import SLOTS, cache
+from .validation_context import ValidationContext
+from .warning_levels import ERROR
+
+
+@dataclass(frozen=True, **SLOTS)
+class ValidationCacheEntry:
+    """A cached validation result"""
+
+    descr: Dict[str, Any]
+    """resource description serialized to JSON compatible values
+    (without root and validation summary)"""
+
+    descr_class: str
+    """qualified name of the class of **descr**"""
+
+    summary: ValidationSummary
+    """validation summary of **descr**"""
+
+    files: Dict[str, Sha256]
+    """SHA-256 values of all referenced files checked during validation"""
+
+
+@cache
+def _get_validation_cache_store(cache_path: Path) -> DiskStore[ValidationCacheEntry]:
+    return DiskStore(cache_path / "validation", ValidationCacheEntry)
+
+
+def get_validation_cache_key(
+    opened: OpenedBioimageioYaml,
+    format_version: str,
+    context: ValidationContext,
+) -> Optional[str]:
+    """Key to cache the validation result of **opened** in **context**.
+
+    Returns None if validation results should not be cached.
+    """
+    if (
+        not settings.validation_cache
+        or context.disable_cache
+        or context.update_hashes
+        or context.raise_errors
+    ):
+        return None
+
+    if isinstance(context.root, ZipFile):
+        if context.root.filename is None:
+            return None  # in-memory zip file
+
+        root = context.root.filename
+    else:
+        root = str(context.root)
+
+    return json.dumps(
+        dict(
+            bioimageio_spec=VERSION,
+            sha256=hashlib.sha256(opened.unparsed_content.encode("utf-8")).hexdigest(),
+            format_version=format_version.lower(),
+            perform_io_checks=context.perform_io_checks,
+            warning_level=context.warning_level,
+            root=root,
+            file_name=context.file_name,
+            original_source_name=context.original_source_name,
+            known_files=hashlib.sha256(
+                json.dumps(sorted(context.known_files.items())).encode("utf-8")
+            ).hexdigest(),
+            # settings affecting the validation outcome
+            allow_pickle=settings.allow_pickle,
+            collection_http_pattern=settings.collection_http_pattern,
+            id_map=settings.id_map,
+            id_map_draft=settings.id_map_draft,
+            resolve_draft=settings.resolve_draft,
+        ),
+        sort_keys=True,
+    )
+
+
+def _get_class_name(cls: Type[Any]) -> str:
+    return f"{cls.__module__}.{cls.__qualname__}"
+
+
+def _get_descr_class(name: str) -> Optional[Type[ResourceDescrBase]]:
+    """find a resource description class by its qualified name
+    (among the subclasses of `ResourceDescrBase`, without importing anything)"""
+    to_visit: List[Type[ResourceDescrBase]] = [ResourceDescrBase]
+    while to_visit:
+        cls = to_visit.pop()
+        if _get_class_name(cls) == name:
+            return cls
+
+        to_visit.extend(cls.__subclasses__())
+
+    return None
+
+
+def _get_sha256(src: str) -> Sha256:
+    """get the SHA256 value of a file referenced by a description"""
+    source: Union[Path, ZipPath, Any] = interprete_file_source(src)
+    if isinstance(source, RelativeFilePath):
+        source = source.absolute()
+
+    if isinstance(source, (Path, ZipPath)):
+        return get_file_sha256(source)
+
+    with get_reader(source) as reader:
+        return reader.sha256
+
+
+def get_cached_description(
+    key: str, context: ValidationContext
+) -> Optional[ResourceDescrBase]:
+    """Get a cached resource description without revalidating it.
+
+    Returns None if there is no cache entry for **key**
+    or any referenced file changed since the entry was cached.
+    """
+    entry = _get_validation_cache_store(settings.cache_path).get(key)
+    if entry is None:
+        return None
+
+    with context:
+        for src, sha in entry.files.items():
+            try:
+                actual = _get_sha256(src)
+            except Exception as e:
+                logger.debug("not using cached validation result: {}", e)
+                return None
+
+            if actual != sha:
+                logger.debug("not using cached validation result: {} changed", src)
+                return None
+
+    descr_class = _get_descr_class(entry.descr_class)
+    if descr_class is None:
+        logger.debug("ignoring validation cache entry of unknown {}", entry.descr_class)
+        return None
+
+    try:
+        # referenced files were checked above
+        with context.replace(
+            perform_io_checks=False, warning_level=ERROR, log_warnings=False
+        ):
+            descr = descr_class.model_validate(entry.descr)
+    except Exception as e:
+        logger.debug("ignoring invalid validation cache entry: {}", e)
+        return None
+
+    descr._root = context.root  # pyright: ignore[reportPrivateUsage]
+    descr._file_name = context.file_name  # pyright: ignore[reportPrivateUsage]
+    descr._validation_summary = entry.summary  # pyright: ignore[reportPrivateUsage]
+    context.known_files.update(entry.files)
+    return descr
+
+
+def cache_description(key: str, descr: ResourceDescrBase, context: ValidationContext):
+    """Cache the validated **descr** (and the hashes of files checked in **context**)."""
+    try:
+        with context:
+            data = descr.model_dump(mode="json", exclude_unset=True)
+    except Exception as e:
+        logger.debug("failed to cache validation result: {}", e)
+        return
+
+    _get_validation_cache_store(settings.cache_path).set(
+        key,
+        ValidationCacheEntry(
+            descr=data,
+            descr_class=_get_class_name(type(descr)),
+            summary=descr.validation_summary,
+            files={k: v for k, v in context.known_files.items() if v is not None},
+        ),
+    )
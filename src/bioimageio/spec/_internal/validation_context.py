@@ -171,6 +171,9 @@ class ValidationContext(ValidationContextBase):
                 if original_source_name is None
                 else original_source_name
             ),
+            cache=self.cache,
+            disable_cache=self.disable_cache,
+            progressbar=self.progressbar,
         )
 
     @property
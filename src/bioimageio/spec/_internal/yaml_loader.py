@@ -0,0 +1,142 @@
+"""Loading of YAML 1.2 content (with fast paths, see `settings.yaml_loader`)"""
+
+import json
+import re
+import threading
+from typing import Any, Callable, Dict, List, Optional, Tuple, Union
+
+import ruyaml.nodes
+from ruyaml import YAML
+from ruyaml.resolver import implicit_resolvers
+
+from ._settings import settings
+from .io import YamlValue
+
+_yaml_instances = threading.local()
+"""thread local YAML instances (ruyaml's YAML instances are not thread-safe)"""
+
+
+def _get_yaml_load() -> YAML:
+    if not hasattr(_yaml_instances, "load"):
+        _yaml_instances.load = YAML(typ="safe")
+
+    return _yaml_instances.load
+
+
+def _get_yaml_construct() -> YAML:
+    if not hasattr(_yaml_instances, "construct"):
+        _yaml_instances.construct = YAML(typ="safe")
+
+    return _yaml_instances.construct
+
+
+_YAML_1_1_DIRECTIVE = re.compile(r"^%YAML\s+1\.1", re.MULTILINE)
+
+
+def _no_duplicate_keys(pairs: List[Tuple[str, Any]]) -> Dict[str, Any]:
+    ret = dict(pairs)
+    if len(ret) != len(pairs):
+        raise ValueError("duplicate key")  # ruyaml rejects duplicate keys
+
+    return ret
+
+
+def _reject_constant(constant: str) -> Any:
+    raise ValueError(f"'{constant}' is a string in YAML")
+
+
+def _load_json(data: str) -> YamlValue:
+    return json.loads(
+        data, object_pairs_hook=_no_duplicate_keys, parse_constant=_reject_constant
+    )
+
+
+_load_with_libyaml: Optional[Callable[[str], YamlValue]] = None
+try:
+    import yaml
+    from yaml import CBaseLoader
+except ImportError:
+    pass
+else:
+
+    class _LibyamlComposer(CBaseLoader):
+        """libyaml based composer resolving plain scalars like ruyaml for YAML 1.2"""
+
+    for _versions, _tag, _regexp, _first in implicit_resolvers:
+        if (1, 2) in _versions:
+            _LibyamlComposer.add_implicit_resolver(_tag, _regexp, _first)
+
+    def _to_ruyaml_node(
+        node: yaml.Node, memo: Dict[int, ruyaml.nodes.Node]
+    ) -> ruyaml.nodes.Node:
+        if id(node) in memo:  # anchored node
+            return memo[id(node)]
+
+        ret: ruyaml.nodes.Node
+        if isinstance(node, yaml.ScalarNode):
+            ret = ruyaml.nodes.ScalarNode(node.tag, node.value, style=node.style)
+            memo[id(node)] = ret
+        elif isinstance(node, yaml.SequenceNode):
+            ret = ruyaml.nodes.SequenceNode(node.tag, [], flow_style=node.flow_style)
+            memo[id(node)] = ret
+            ret.value = [_to_ruyaml_node(n, memo) for n in node.value]
+        elif isinstance(node, yaml.MappingNode):
+            ret = ruyaml.nodes.MappingNode(node.tag, [], flow_style=node.flow_style)
+            memo[id(node)] = ret
+            ret.value = [
+                (_to_ruyaml_node(k, memo), _to_ruyaml_node(v, memo))
+                for k, v in node.value
+            ]
+        else:
+            raise TypeError(f"unexpected YAML node {node}")
+
+        return ret
+
+    def _load_with_libyaml_impl(data: str) -> YamlValue:
+        """Parse YAML with libyaml and construct the content with ruyaml."""
+        composer = _LibyamlComposer(data)
+        try:
+            node: Optional[yaml.Node] = composer.get_single_node()
+        finally:
+            composer.dispose()
+
+        if node is None:
+            return None
+
+        constructor = _get_yaml_construct().constructor
+        return constructor.construct_document(_to_ruyaml_node(node, {}))
+
+    _load_with_libyaml = _load_with_libyaml_impl
+
+
+def load_yaml(data: Union[str, bytes]) -> YamlValue:
+    """Load YAML 1.2 content.
+
+    Depending on `settings.yaml_loader` JSON content is loaded with `json`
+    and any other content is parsed with libyaml (if PyYAML is installed
+    with its C extension), falling back to the pure Python ruyaml loader.
+    All loaders yield the same content.
+    """
+    if settings.yaml_loader == "auto":
+        if isinstance(data, bytes):
+            try:
+                text = data.decode("utf-8-sig")
+            except UnicodeDecodeError:
+                text = None
+        else:
+            text = data
+
+        if text is not None:
+            if text.lstrip().startswith("{"):
+                try:
+                    return _load_json(text)
+                except ValueError:
+                    pass  # not (valid) JSON
+
+            if _load_with_libyaml is not None and not _YAML_1_1_DIRECTIVE.search(text):
+                try:
+                    return _load_with_libyaml(text)
+                except Exception:
+                    pass  # report any errors as ruyaml would
+
+    return _get_yaml_load().load(data)
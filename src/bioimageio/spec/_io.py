@@ -1,6 +1,16 @@
 import collections.abc
 from pathlib import Path
-from typing import Dict, Literal, Optional, TextIO, Union, cast, overload
+from typing import (
+    Any,
+    Dict,
+    Literal,
+    Optional,
+    Sequence,
+    TextIO,
+    Union,
+    cast,
+    overload,
+)
 from zipfile import ZipFile
 
 from loguru import logger
@@ -12,16 +22,24 @@ from ._description import (
     InvalidDescr,
     LatestResourceDescr,
     ResourceDescr,
+    abuild_description,
     build_description,
     dump_description,
     ensure_description_is_dataset,
     ensure_description_is_model,
+    peek_content,
 )
 from ._internal.common_nodes import ResourceDescrBase
 from ._internal.io import BioimageioYamlContent, YamlValue
 from ._internal.io_basics import Sha256
-from ._internal.io_utils import open_bioimageio_yaml, write_yaml
+from ._internal.io_utils import aopen_bioimageio_yaml, open_bioimageio_yaml, write_yaml
 from ._internal.types import FormatVersionPlaceholder, PermissiveFileSource
+from ._internal.utils import to_thread
+from ._internal.validation_cache import (
+    cache_description,
+    get_cached_description,
+    get_validation_cache_key,
+)
 from ._internal.validation_context import get_validation_context
 from .dataset import AnyDatasetDescr, DatasetDescr
 from .model import AnyModelDescr, ModelDescr
@@ -105,12 +123,19 @@ def load_description(
         perform_io_checks=perform_io_checks,
         known_files=known_files,
     )
+    cache_key = get_validation_cache_key(opened, format_version, context)
+    if cache_key is not None and (cached := get_cached_description(cache_key, context)):
+        return cached  # pyright: ignore[reportReturnType]
 
-    return build_description(
+    descr = build_description(
         opened.content,
         context=context,
         format_version=format_version,
     )
+    if cache_key is not None:
+        cache_description(cache_key, descr, context)
+
+    return descr
 
 
 @overload
@@ -208,6 +233,197 @@ def load_dataset_description(
     return ensure_description_is_dataset(rd)
 
 
+@overload
+async def aload_description(
+    source: Union[PermissiveFileSource, ZipFile],
+    /,
+    *,
+    format_version: Literal["latest"],
+    perform_io_checks: Optional[bool] = None,
+    known_files: Optional[Dict[str, Optional[Sha256]]] = None,
+    sha256: Optional[Sha256] = None,
+) -> Union[LatestResourceDescr, InvalidDescr]: ...
+
+
+@overload
+async def aload_description(
+    source: Union[PermissiveFileSource, ZipFile],
+    /,
+    *,
+    format_version: Union[FormatVersionPlaceholder, str] = DISCOVER,
+    perform_io_checks: Optional[bool] = None,
+    known_files: Optional[Dict[str, Optional[Sha256]]] = None,
+    sha256: Optional[Sha256] = None,
+) -> Union[ResourceDescr, InvalidDescr]: ...
+
+
+async def aload_description(
+    source: Union[PermissiveFileSource, ZipFile],
+    /,
+    *,
+    format_version: Union[FormatVersionPlaceholder, str] = DISCOVER,
+    perform_io_checks: Optional[bool] = None,
+    known_files: Optional[Dict[str, Optional[Sha256]]] = None,
+    sha256: Optional[Sha256] = None,
+) -> Union[ResourceDescr, InvalidDescr]:
+    """Async counterpart of `load_description`.
+
+    The bioimageio.yaml file and all referenced files are downloaded
+    without blocking the event loop (see `abuild_description`).
+    """
+    if isinstance(source, ResourceDescrBase):
+        name = getattr(source, "name", f"{str(source)[:10]}...")
+        logger.warning("returning already loaded description '{}' as is", name)
+        return source  # pyright: ignore[reportReturnType]
+
+    opened = await aopen_bioimageio_yaml(source, sha256=sha256)
+
+    context = get_validation_context().replace(
+        root=opened.original_root,
+        file_name=opened.original_file_name,
+        original_source_name=opened.original_source_name,
+        perform_io_checks=perform_io_checks,
+        known_files=known_files,
+    )
+    cache_key = get_validation_cache_key(opened, format_version, context)
+    if cache_key is not None and (
+        cached := await to_thread(get_cached_description, cache_key, context)
+    ):
+        return cached  # pyright: ignore[reportReturnType]
+
+    descr = await abuild_description(
+        opened.content,
+        context=context,
+        format_version=format_version,
+    )
+    if cache_key is not None:
+        await to_thread(cache_description, cache_key, descr, context)
+
+    return descr
+
+
+@overload
+async def aload_model_description(
+    source: Union[PermissiveFileSource, ZipFile],
+    /,
+    *,
+    format_version: Literal["latest"],
+    perform_io_checks: Optional[bool] = None,
+    known_files: Optional[Dict[str, Optional[Sha256]]] = None,
+    sha256: Optional[Sha256] = None,
+) -> ModelDescr: ...
+
+
+@overload
+async def aload_model_description(
+    source: Union[PermissiveFileSource, ZipFile],
+    /,
+    *,
+    format_version: Union[FormatVersionPlaceholder, str] = DISCOVER,
+    perform_io_checks: Optional[bool] = None,
+    known_files: Optional[Dict[str, Optional[Sha256]]] = None,
+    sha256: Optional[Sha256] = None,
+) -> AnyModelDescr: ...
+
+
+async def aload_model_description(
+    source: Union[PermissiveFileSource, ZipFile],
+    /,
+    *,
+    format_version: Union[FormatVersionPlaceholder, str] = DISCOVER,
+    perform_io_checks: Optional[bool] = None,
+    known_files: Optional[Dict[str, Optional[Sha256]]] = None,
+    sha256: Optional[Sha256] = None,
+) -> AnyModelDescr:
+    """Async counterpart of `load_model_description`."""
+    rd = await aload_description(
+        source,
+        format_version=format_version,
+        perform_io_checks=perform_io_checks,
+        known_files=known_files,
+        sha256=sha256,
+    )
+    return ensure_description_is_model(rd)
+
+
+@overload
+async def aload_dataset_description(
+    source: Union[PermissiveFileSource, ZipFile],
+    /,
+    *,
+    format_version: Literal["latest"],
+    perform_io_checks: Optional[bool] = None,
+    known_files: Optional[Dict[str, Optional[Sha256]]] = None,
+    sha256: Optional[Sha256] = None,
+) -> DatasetDescr: ...
+
+
+@overload
+async def aload_dataset_description(
+    source: Union[PermissiveFileSource, ZipFile],
+    /,
+    *,
+    format_version: Union[FormatVersionPlaceholder, str] = DISCOVER,
+    perform_io_checks: Optional[bool] = None,
+    known_files: Optional[Dict[str, Optional[Sha256]]] = None,
+    sha256: Optional[Sha256] = None,
+) -> AnyDatasetDescr: ...
+
+
+async def aload_dataset_description(
+    source: Union[PermissiveFileSource, ZipFile],
+    /,
+    *,
+    format_version: Union[FormatVersionPlaceholder, str] = DISCOVER,
+    perform_io_checks: Optional[bool] = None,
+    known_files: Optional[Dict[str, Optional[Sha256]]] = None,
+    sha256: Optional[Sha256] = None,
+) -> AnyDatasetDescr:
+    """Async counterpart of `load_dataset_description`."""
+    rd = await aload_description(
+        source,
+        format_version=format_version,
+        perform_io_checks=perform_io_checks,
+        known_files=known_files,
+        sha256=sha256,
+    )
+    return ensure_description_is_dataset(rd)
+
+
+def peek_description(
+    source: Union[PermissiveFileSource, ZipFile],
+    /,
+    fields: Sequence[str],
+    *,
+    sha256: Optional[Sha256] = None,
+) -> Dict[str, Any]:
+    """Get the validated values of some fields of a bioimage.io resource description
+    without loading (and validating) the whole description.
+
+    This is much faster than `load_description`, e.g. for listing resources
+    by their "type", "id", "name", "version", "format_version", "tags" and "covers".
+    See `bioimageio.spec.peek_content` for details.
+
+    Args:
+        source:
+            Path or URL to an rdf.yaml or a bioimage.io package
+            (zip-file with rdf.yaml in it).
+        fields: names of the fields to validate
+        sha256:
+            Optional SHA-256 value of **source**
+
+    Returns:
+        The validated values of the requested **fields**.
+    """
+    opened = open_bioimageio_yaml(source, sha256=sha256)
+    context = get_validation_context().replace(
+        root=opened.original_root,
+        file_name=opened.original_file_name,
+        original_source_name=opened.original_source_name,
+    )
+    return peek_content(opened.content, fields, context=context)
+
+
 def save_bioimageio_yaml_only(
     rd: Union[ResourceDescr, BioimageioYamlContent, InvalidDescr],
     /,
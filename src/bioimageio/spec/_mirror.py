@@ -0,0 +1,161 @@
+from concurrent.futures import Future, ThreadPoolExecutor, as_completed
+from contextvars import copy_context
+from io import BytesIO
+from pathlib import Path
+from typing import Dict, List, Optional, Sequence, Tuple, Union
+
+from exceptiongroup import ExceptionGroup
+from loguru import logger
+
+from ._description import InvalidDescr, build_description
+from ._internal._settings import settings
+from ._internal.io import FileDescr, get_reader
+from ._internal.io_basics import Sha256
+from ._internal.io_utils import open_bioimageio_yaml
+from ._internal.mirror import file_url_to_path, get_mirror_path, write_mirrored_file
+from ._internal.root_url import RootHttpUrl
+from ._internal.types import RelativeFilePath
+from ._internal.url import HttpUrl
+from ._internal.validation_context import ValidationContext
+from ._package import get_package_content
+
+
+def _mirror_file(url: str, sha256: Optional[Sha256], dest: Path) -> Path:
+    path = get_mirror_path(url, dest)
+    if path is None:
+        raise ValueError(f"Cannot mirror {url} (URL cannot be mapped to {dest}).")
+
+    if not path.exists():
+        write_mirrored_file(path, get_reader(url, sha256=sha256))
+
+    return path
+
+
+def _mirror_resource(
+    source: str, dest: Path
+) -> Tuple[str, Path, List[Tuple[str, Optional[Sha256]]]]:
+    """mirror the bioimageio.yaml of **source**
+
+    Returns:
+        URL and local copy of the bioimageio.yaml and
+        URLs (and SHA256 values) of all remote files it references
+    """
+    opened = open_bioimageio_yaml(source)
+    if not isinstance(opened.original_root, RootHttpUrl):
+        raise ValueError(f"'{source}' does not resolve to a remote bioimageio.yaml.")
+
+    yaml_url = f"{opened.original_root}/{opened.original_file_name}"
+    yaml_path = get_mirror_path(yaml_url, dest)
+    if yaml_path is None:
+        raise ValueError(f"Cannot mirror {yaml_url} (URL cannot be mapped to {dest}).")
+
+    descr = build_description(
+        opened.content,
+        context=ValidationContext(
+            root=opened.original_root,
+            file_name=opened.original_file_name,
+            perform_io_checks=False,
+        ),
+    )
+    if isinstance(descr, InvalidDescr):
+        raise ValueError(f"Invalid resource description '{source}'.")
+
+    # (always overwrite the bioimageio.yaml as it may have been updated)
+    write_mirrored_file(yaml_path, BytesIO(opened.unparsed_content.encode("utf-8")))
+    files: List[Tuple[str, Optional[Sha256]]] = []
+    for v in get_package_content(descr).values():
+        if not isinstance(v, FileDescr):
+            continue
+
+        src = (
+            v.source.absolute() if isinstance(v.source, RelativeFilePath) else v.source
+        )
+        if isinstance(src, HttpUrl):
+            files.append((str(src), v.sha256))
+
+    return yaml_url, yaml_path, files
+
+
+def mirror_collection(
+    ids: Sequence[str],
+    dest: Union[Path, str, None] = None,
+    *,
+    max_workers: Optional[int] = None,
+) -> Dict[str, Path]:
+    """Populate a local mirror (see `settings.mirror`) with bioimage.io resources,
+    e.g. to use them on compute nodes without internet access.
+
+    The bioimageio.yaml files of **ids** (resolved as in `load_description`),
+    all files they reference and the id maps (`settings.id_map`, and
+    `settings.id_map_draft` if `settings.resolve_draft`) are downloaded concurrently.
+    Already mirrored files are not downloaded again.
+
+    Args:
+        ids: bioimage.io resource IDs (or URLs to bioimageio.yaml files)
+        dest: mirror directory (defaults to `settings.mirror`)
+        max_workers: maximum number of concurrent downloads
+            (defaults to `settings.max_concurrent_downloads`)
+
+    Returns:
+        Mapping of the mirrored URLs to their local copies.
+
+    Raises:
+        ExceptionGroup: if any resource could not be mirrored
+            (after all other resources are mirrored).
+    """
+    if dest is None:
+        if settings.mirror is None:
+            raise ValueError("No mirror directory given (`dest` or `settings.mirror`).")
+
+        dest = settings.mirror
+    elif isinstance(dest, str):
+        dest = file_url_to_path(dest)
+
+    id_maps = [settings.id_map]
+    if settings.resolve_draft:
+        id_maps.append(settings.id_map_draft)
+
+    mirrored: Dict[str, Path] = {}
+    for url in id_maps:
+        try:
+            mirrored[url] = _mirror_file(url, None, dest)
+        except Exception as e:
+            logger.warning("Failed to mirror id map {}: {}", url, e)
+
+    errors: List[Exception] = []
+    with ThreadPoolExecutor(
+        max_workers=max_workers or settings.max_concurrent_downloads,
+        thread_name_prefix="bioimageio_mirror",
+    ) as executor:
+        resource_futures = [
+            executor.submit(copy_context().run, _mirror_resource, id_, dest)
+            for id_ in ids
+        ]
+        file_futures: Dict[str, "Future[Path]"] = {}
+        for future in as_completed(resource_futures):
+            error = future.exception()
+            if isinstance(error, Exception):
+                errors.append(error)
+                continue
+
+            yaml_url, yaml_path, files = future.result()
+            mirrored[yaml_url] = yaml_path
+            for url, sha256 in files:
+                if url not in file_futures:
+                    file_futures[url] = executor.submit(
+                        copy_context().run, _mirror_file, url, sha256, dest
+                    )
+
+        for url, future in file_futures.items():
+            error = future.exception()
+            if isinstance(error, Exception):
+                errors.append(error)
+            else:
+                mirrored[url] = future.result()
+
+    if errors:
+        raise ExceptionGroup(
+            f"Failed to mirror {len(errors)} resource(s)/file(s) to {dest}", errors
+        )
+
+    return mirrored
@@ -1,34 +1,52 @@
 import collections.abc
+import os
 import shutil
 from io import BytesIO
 from pathlib import Path
 from tempfile import NamedTemporaryFile, mkdtemp
-from typing import IO, Dict, Literal, Optional, Sequence, Union
-from zipfile import ZIP_DEFLATED
+from typing import IO, Dict, List, Literal, Mapping, Optional, Sequence, Union
+from zipfile import ZIP_DEFLATED, ZipFile, ZipInfo
 
+from exceptiongroup import ExceptionGroup
 from loguru import logger
 from pydantic import DirectoryPath, FilePath, NewPath
 
-from ._description import InvalidDescr, ResourceDescr, build_description
+from ._description import (
+    InvalidDescr,
+    ResourceDescr,
+    abuild_description,
+    build_description,
+)
 from ._internal.common_nodes import ResourceDescrBase
 from ._internal.io import (
     BioimageioYamlContent,
     BioimageioYamlSource,
     FileDescr,
     RelativeFilePath,
+    apopulate_cache,
     ensure_is_valid_bioimageio_yaml_name,
+    extract_file_descrs,
 )
 from ._internal.io_basics import (
     BIOIMAGEIO_YAML,
     AbsoluteFilePath,
     BytesReader,
     FileName,
+    Sha256,
     ZipPath,
 )
-from ._internal.io_utils import open_bioimageio_yaml, write_yaml, write_zip
+from ._internal.io_utils import (
+    CompressedZipMember,
+    ZipCompressionPolicy,
+    aopen_bioimageio_yaml,
+    default_compression_policy,
+    open_bioimageio_yaml,
+    write_yaml,
+    write_zip,
+)
 from ._internal.packaging_context import PackagingContext
 from ._internal.url import HttpUrl
-from ._internal.utils import get_os_friendly_file_name
+from ._internal.utils import get_os_friendly_file_name, to_thread
 from ._internal.validation_context import get_validation_context
 from ._internal.warning_levels import ERROR
 from ._io import load_description
@@ -112,10 +130,24 @@ def _prepare_resource_package(
 
     Args:
         source: A bioimage.io resource description (as file, raw YAML content or description class)
-        context: validation context
         weights_priority_order: If given only the first weights format present in the model is included.
                                 If none of the prioritized weights formats is found all are included.
     """
+    return {
+        k: v if isinstance(v, collections.abc.Mapping) else v.get_reader()
+        for k, v in _get_resource_package_content(
+            source, weights_priority_order=weights_priority_order
+        ).items()
+    }
+
+
+def _get_resource_package_content(
+    source: Union[BioimageioYamlSource, ResourceDescr],
+    /,
+    *,
+    weights_priority_order: Optional[Sequence[WeightsFormat]] = None,
+) -> Dict[FileName, Union[BioimageioYamlContent, FileDescr]]:
+    """Like `_prepare_resource_package`, but without opening (downloading) the files."""
     context = get_validation_context()
     bioimageio_yaml_file_name = context.file_name
     if isinstance(source, ResourceDescrBase):
@@ -135,17 +167,12 @@ def _prepare_resource_package(
         raise ValueError(f"{source} is invalid: {descr.validation_summary}")
 
     with context:
-        package_content = get_package_content(
+        return get_package_content(
             descr,
             bioimageio_yaml_file_name=bioimageio_yaml_file_name or BIOIMAGEIO_YAML,
             weights_priority_order=weights_priority_order,
         )
 
-    return {
-        k: v if isinstance(v, collections.abc.Mapping) else v.get_reader()
-        for k, v in package_content.items()
-    }
-
 
 def save_bioimageio_package_as_folder(
     source: Union[BioimageioYamlSource, ResourceDescr],
@@ -221,6 +248,7 @@ def save_bioimageio_package(
     *,
     compression: int = ZIP_DEFLATED,
     compression_level: int = 1,
+    compression_policy: ZipCompressionPolicy = default_compression_policy,
     output_path: Union[NewPath, FilePath, None] = None,
     weights_priority_order: Optional[  # model only
         Sequence[
@@ -235,6 +263,7 @@ def save_bioimageio_package(
         ]
     ] = None,
     allow_invalid: bool = False,
+    previous_package: Optional[FilePath] = None,
 ) -> FilePath:
     """Package a bioimageio resource as a zip file.
 
@@ -243,17 +272,42 @@ def save_bioimageio_package(
         compression: The numeric constant of compression method.
         compression_level: Compression level to use when writing files to the archive.
                            See https://docs.python.org/3/library/zipfile.html#zipfile.ZipFile
+        compression_policy: Decides which files to compress (others are stored).
+                            By default already compressed files (e.g. images),
+                            .npy files (to allow memory-mapping them) and files
+                            that compress poorly (e.g. most model weights) are stored.
         output_path: file path to write package to
         weights_priority_order: If given only the first weights format present in the model is included.
                                 If none of the prioritized weights formats is found all are included.
+        allow_invalid: Log an error instead of raising if the written package is invalid.
+        previous_package: A package saved from (an earlier version of) **source**,
+                          e.g. to release a metadata update of a model with large weights.
+                          Its members are copied as they are (without recompressing them)
+                          if their SHA256 declared in **previous_package** matches
+                          a file of **source** (or if they are the source of a file).
+                          Copied members are decompressed once to verify their CRC
+                          and SHA256 value.
+                          May be the same file as **output_path**.
 
     Returns:
         path to zipped bioimageio package
     """
-    package_content = _prepare_resource_package(
-        source,
-        weights_priority_order=weights_priority_order,
-    )
+    package_content: Mapping[
+        FileName, Union[BioimageioYamlContent, BytesReader, CompressedZipMember]
+    ]
+    if previous_package is None:
+        package_content = _prepare_resource_package(
+            source,
+            weights_priority_order=weights_priority_order,
+        )
+    else:
+        package_content = _reuse_package_members(
+            _get_resource_package_content(
+                source, weights_priority_order=weights_priority_order
+            ),
+            Path(previous_package),
+        )
+
     if output_path is None:
         output_path = Path(
             NamedTemporaryFile(suffix=".bioimageio.zip", delete=False).name
@@ -261,31 +315,212 @@ def save_bioimageio_package(
     else:
         output_path = Path(output_path)
 
-    write_zip(
-        output_path,
-        package_content,
-        compression=compression,
-        compression_level=compression_level,
-    )
+    if (
+        previous_package is not None
+        and output_path.exists()
+        and output_path.samefile(previous_package)
+    ):
+        # write to a temporary file first to keep the members to copy intact
+        write_path = output_path.with_name(f".{output_path.name}.tmp")
+    else:
+        write_path = output_path
+
+    try:
+        written = write_zip(
+            write_path,
+            package_content,
+            compression=compression,
+            compression_level=compression_level,
+            compression_policy=compression_policy,
+        )
+        if write_path != output_path:
+            _ = os.replace(write_path, output_path)
+    finally:
+        if write_path != output_path:
+            write_path.unlink(missing_ok=True)
+
+    # The package content was validated before writing, so we only validate the
+    # written metadata and compare the SHA256 values computed while writing
+    # (instead of reading, hashing and validating all files again).
     with get_validation_context().replace(warning_level=ERROR):
-        if isinstance((exported := load_description(output_path)), InvalidDescr):
+        exported = load_description(output_path, perform_io_checks=False)
+
+    errors = _get_sha256_mismatches(package_content, written)
+    if isinstance(exported, InvalidDescr) or errors:
+        if isinstance(exported, InvalidDescr):
             exported.validation_summary.display()
-            msg = f"Exported package at '{output_path}' is invalid."
-            if allow_invalid:
-                logger.error(msg)
-            else:
-                raise ValueError(msg)
+
+        msg = " ".join([f"Exported package at '{output_path}' is invalid.", *errors])
+        if allow_invalid:
+            logger.error(msg)
+        else:
+            raise ValueError(msg)
 
     return output_path
 
 
+def _reuse_package_members(
+    package_content: Mapping[FileName, Union[BioimageioYamlContent, FileDescr]],
+    previous_package: Path,
+) -> Dict[FileName, Union[BioimageioYamlContent, BytesReader, CompressedZipMember]]:
+    """open the files to package, except for those matching a member of
+    **previous_package** (by SHA256 value or as their source)
+
+    Members are matched by the SHA256 values declared in the bioimageio.yaml of
+    **previous_package**, which are not verified here; the content of matched members
+    is hashed while copying them (see `CompressedZipMember`),
+    such that the SHA256 values of the written package are verified nonetheless.
+    """
+    opened = open_bioimageio_yaml(previous_package)
+    previous = opened.original_root
+    if not isinstance(previous, ZipFile):
+        raise ValueError(f"{previous_package} is not a bioimage.io package (zip file).")
+
+    with previous:  # members are copied by path (see `CompressedZipMember`)
+        infos = {info.filename: info for info in previous.infolist()}
+
+    previous_path = previous_package.resolve()
+    by_sha256: Dict[Sha256, ZipInfo] = {}
+    for file_descr in extract_file_descrs({k: v for k, v in opened.content.items()}):
+        info = infos.get(str(file_descr.source))
+        if file_descr.sha256 is not None and info is not None:
+            by_sha256[file_descr.sha256] = info
+
+    ret: Dict[
+        FileName, Union[BioimageioYamlContent, BytesReader, CompressedZipMember]
+    ] = {}
+    for name, v in package_content.items():
+        if isinstance(v, collections.abc.Mapping):
+            ret[name] = v
+            continue
+
+        info = None if v.sha256 is None else by_sha256.get(v.sha256)
+        src = (
+            v.source.absolute() if isinstance(v.source, RelativeFilePath) else v.source
+        )
+        if (
+            info is None
+            and isinstance(src, ZipPath)
+            and src.root.filename is not None
+            and Path(src.root.filename).resolve() == previous_path
+        ):
+            info = infos.get(src.at)
+
+        if info is None or info.flag_bits & 0x1:  # (encrypted members are not copied)
+            ret[name] = v.get_reader()
+        else:
+            logger.debug("Copying {} from {} as is.", info.filename, previous_package)
+            ret[name] = CompressedZipMember(previous_path, info)
+
+    return ret
+
+
+def _get_sha256_mismatches(
+    package_content: Mapping[
+        FileName, Union[BioimageioYamlContent, BytesReader, CompressedZipMember]
+    ],
+    written: Mapping[FileName, Sha256],
+) -> List[str]:
+    """compare the SHA256 values specified in the packaged bioimageio.yaml
+    to the ones computed while writing the package"""
+    errors: List[str] = []
+    for rdf in package_content.values():
+        if not isinstance(rdf, collections.abc.Mapping):
+            continue
+
+        for file_descr in extract_file_descrs({k: v for k, v in rdf.items()}):
+            name = str(file_descr.source)
+            if file_descr.sha256 is None:
+                continue
+            elif name not in written:
+                errors.append(f"{name} is missing.")
+            elif file_descr.sha256 != written[name]:
+                errors.append(
+                    f"Sha256 mismatch for {name}. Expected {file_descr.sha256},"
+                    + f" got {written[name]}."
+                )
+
+    return errors
+
+
+async def asave_bioimageio_package(
+    source: Union[BioimageioYamlSource, ResourceDescr],
+    /,
+    *,
+    compression: int = ZIP_DEFLATED,
+    compression_level: int = 1,
+    compression_policy: ZipCompressionPolicy = default_compression_policy,
+    output_path: Union[NewPath, FilePath, None] = None,
+    weights_priority_order: Optional[  # model only
+        Sequence[
+            Literal[
+                "keras_hdf5",
+                "onnx",
+                "pytorch_state_dict",
+                "tensorflow_js",
+                "tensorflow_saved_model_bundle",
+                "torchscript",
+            ]
+        ]
+    ] = None,
+    allow_invalid: bool = False,
+    previous_package: Optional[FilePath] = None,
+) -> FilePath:
+    """Async counterpart of `save_bioimageio_package`.
+
+    The description is loaded and all package files are downloaded without
+    blocking the event loop; writing and validating the package runs in a worker thread.
+    """
+    context = get_validation_context()
+    if isinstance(source, ResourceDescrBase):
+        descr = source
+    elif isinstance(source, collections.abc.Mapping):
+        descr = await abuild_description(source)
+    else:
+        opened = await aopen_bioimageio_yaml(source)
+        context = context.replace(
+            root=opened.original_root, file_name=opened.original_file_name
+        )
+        descr = await abuild_description(opened.content, context=context)
+
+    if isinstance(descr, InvalidDescr):
+        raise ValueError(f"{source} is invalid: {descr.validation_summary}")
+
+    with context:
+        package_content = get_package_content(
+            descr,
+            bioimageio_yaml_file_name=context.file_name or BIOIMAGEIO_YAML,
+            weights_priority_order=weights_priority_order,
+        )
+        try:
+            await apopulate_cache(
+                [v for v in package_content.values() if isinstance(v, FileDescr)]
+            )
+        except ExceptionGroup as e:
+            logger.warning("{}", e)
+
+        return await to_thread(
+            save_bioimageio_package,
+            descr,
+            compression=compression,
+            compression_level=compression_level,
+            compression_policy=compression_policy,
+            output_path=output_path,
+            weights_priority_order=weights_priority_order,
+            allow_invalid=allow_invalid,
+            previous_package=previous_package,
+        )
+
+
 def save_bioimageio_package_to_stream(
     source: Union[BioimageioYamlSource, ResourceDescr],
     /,
     *,
     compression: int = ZIP_DEFLATED,
     compression_level: int = 1,
+    compression_policy: ZipCompressionPolicy = default_compression_policy,
     output_stream: Union[IO[bytes], None] = None,
+    streaming: Optional[bool] = None,
     weights_priority_order: Optional[  # model only
         Sequence[
             Literal[
@@ -306,7 +541,17 @@ def save_bioimageio_package_to_stream(
         compression: The numeric constant of compression method.
         compression_level: Compression level to use when writing files to the archive.
                            See https://docs.python.org/3/library/zipfile.html#zipfile.ZipFile
+        compression_policy: Decides which files to compress (others are stored).
+                            By default already compressed files (e.g. images),
+                            .npy files (to allow memory-mapping them) and files
+                            that compress poorly (e.g. most model weights) are stored.
         output_stream: stream to write package to
+        streaming: Write the package file by file, opening (downloading) each file
+                   only when it is written and compressing it on the fly,
+                   such that output starts right away and memory use is bounded,
+                   e.g. to stream a package as HTTP response body or to a pipe.
+                   Defaults to True if **output_stream** is not seekable
+                   (zip data descriptors are written to non-seekable streams).
         weights_priority_order: If given only the first weights format present in the model is included.
                                 If none of the prioritized weights formats is found all are included.
 
@@ -318,16 +563,35 @@ def save_bioimageio_package_to_stream(
     if output_stream is None:
         output_stream = BytesIO()
 
-    package_content = _prepare_resource_package(
-        source,
-        weights_priority_order=weights_priority_order,
-    )
+    if streaming is None:
+        streaming = not _is_seekable(output_stream)
 
-    write_zip(
+    package_content: Mapping[
+        FileName, Union[BioimageioYamlContent, BytesReader, FileDescr]
+    ]
+    if streaming:
+        package_content = _get_resource_package_content(
+            source, weights_priority_order=weights_priority_order
+        )
+    else:
+        package_content = _prepare_resource_package(
+            source, weights_priority_order=weights_priority_order
+        )
+
+    _ = write_zip(
         output_stream,
         package_content,
         compression=compression,
         compression_level=compression_level,
+        compression_policy=compression_policy,
+        streaming=streaming,
     )
 
     return output_stream
+
+
+def _is_seekable(stream: IO[bytes]) -> bool:
+    try:
+        return stream.seekable()
+    except (AttributeError, OSError):  # e.g. a minimal file-like object
+        return False
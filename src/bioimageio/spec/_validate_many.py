@@ -0,0 +1,215 @@
+import multiprocessing
+import os
+from concurrent.futures import (
+    FIRST_COMPLETED,
+    Executor,
+    Future,
+    ProcessPoolExecutor,
+    ThreadPoolExecutor,
+    wait,
+)
+from contextvars import copy_context
+from itertools import islice
+from typing import (
+    Any,
+    Dict,
+    Iterable,
+    Iterator,
+    Literal,
+    Optional,
+    Tuple,
+    TypeVar,
+    Union,
+)
+
+from typing_extensions import assert_never
+
+from ._description import DISCOVER
+from ._internal._settings import settings
+from ._internal.types import FormatVersionPlaceholder, PermissiveFileSource
+from ._internal.validation_context import ValidationContext, get_validation_context
+from ._internal.warning_levels import WarningLevel
+from ._io import load_description_and_validate_format_only
+from .summary import ErrorEntry, ValidationDetail, ValidationSummary
+
+SourceT = TypeVar("SourceT", bound=PermissiveFileSource)
+
+
+def _validate(
+    source: PermissiveFileSource,
+    format_version: Union[FormatVersionPlaceholder, str],
+    perform_io_checks: bool,
+) -> ValidationSummary:
+    try:
+        return load_description_and_validate_format_only(
+            source,
+            format_version=format_version,
+            perform_io_checks=perform_io_checks,
+        )
+    except Exception as e:
+        if get_validation_context().raise_errors:
+            raise
+
+        return ValidationSummary(
+            name="bioimageio format validation",
+            source_name=str(source),
+            type="unknown",
+            format_version="unknown",
+            status="failed",
+            details=[
+                ValidationDetail(
+                    name="open bioimageio.yaml",
+                    status="failed",
+                    errors=[
+                        ErrorEntry(
+                            loc=(),
+                            msg=str(e) or e.__class__.__name__ + " encountered",
+                            type=type(e).__name__,
+                            with_traceback=True,
+                        )
+                    ],
+                )
+            ],
+        )
+
+
+def _init_worker_process(settings_values: Dict[str, Any]):
+    """apply the settings of the parent process in a (spawned) worker process"""
+    for name, value in settings_values.items():
+        setattr(settings, name, value)
+
+
+def _create_process_pool(workers: int) -> ProcessPoolExecutor:
+    # spawn (instead of fork) worker processes, such that they do not share
+    # pooled http connections or (possibly held) locks with the parent process
+    return ProcessPoolExecutor(
+        max_workers=workers,
+        mp_context=multiprocessing.get_context("spawn"),
+        initializer=_init_worker_process,
+        initargs=(settings.model_dump(),),
+    )
+
+
+def _validate_in_process(
+    source: PermissiveFileSource,
+    format_version: Union[FormatVersionPlaceholder, str],
+    perform_io_checks: bool,
+    warning_level: WarningLevel,
+    log_warnings: bool,
+    disable_cache: bool,
+) -> Dict[str, Any]:
+    with ValidationContext(
+        perform_io_checks=perform_io_checks,
+        warning_level=warning_level,
+        log_warnings=log_warnings,
+        disable_cache=disable_cache,
+        progressbar=False,
+    ):
+        summary = _validate(source, format_version, perform_io_checks)
+
+    # a serialized summary avoids pickling rich tracebacks
+    return summary.model_dump(mode="json")
+
+
+def validate_many(
+    sources: Iterable[SourceT],
+    /,
+    *,
+    workers: Optional[int] = None,
+    executor: Literal["process", "thread"] = "process",
+    max_in_flight: Optional[int] = None,
+    fail_fast: bool = False,
+    format_version: Union[FormatVersionPlaceholder, str] = DISCOVER,
+    perform_io_checks: Optional[bool] = None,
+) -> Iterator[Tuple[SourceT, ValidationSummary]]:
+    """Validate many bioimage.io resource descriptions in parallel.
+
+    Validation summaries are yielded as soon as they are available
+    (not necessarily in the order of **sources**).
+    Sources that cannot be opened are reported as failed validation summaries.
+
+    Args:
+        sources: Paths or URLs to rdf.yaml files or bioimage.io packages.
+        workers: Number of worker processes/threads (default: number of CPUs).
+        executor: Validate in worker processes or threads.
+            Worker processes are spawned with the current `settings`
+            (sharing the download cache at `settings.cache_path`),
+            but only the `perform_io_checks`, `warning_level`, `log_warnings`
+            and `disable_cache` fields of the current validation context.
+        max_in_flight: Maximum number of sources submitted for validation
+            but not yet yielded (default: 2 * **workers**).
+            **sources** is consumed lazily accordingly.
+        fail_fast: Stop after the first failed validation.
+        format_version: see `load_description`
+        perform_io_checks: see `load_description`
+
+    Returns:
+        Iterator over pairs of source and its validation summary.
+    """
+    workers = workers or os.cpu_count() or 1
+    max_in_flight = max_in_flight or 2 * workers
+    if workers < 1 or max_in_flight < 1:
+        raise ValueError(
+            f"`workers` ({workers}) and `max_in_flight` ({max_in_flight}) must be"
+            + " positive."
+        )
+
+    context = get_validation_context()
+    if perform_io_checks is None:
+        perform_io_checks = context.perform_io_checks
+
+    pool: Executor
+    if executor == "process":
+        pool = _create_process_pool(workers)
+
+        def submit(source: SourceT) -> "Future[Any]":
+            return pool.submit(
+                _validate_in_process,
+                source,
+                format_version,
+                perform_io_checks,
+                context.warning_level,
+                context.log_warnings,
+                context.disable_cache,
+            )
+
+    elif executor == "thread":
+        pool = ThreadPoolExecutor(max_workers=workers)
+
+        def submit(source: SourceT) -> "Future[Any]":
+            return pool.submit(
+                copy_context().run,
+                _validate,
+                source,
+                format_version,
+                perform_io_checks,
+            )
+
+    else:
+        assert_never(executor)
+
+    remaining = iter(sources)
+    in_flight: "Dict[Future[Any], SourceT]" = {}
+    try:
+        while True:
+            for source in islice(remaining, max_in_flight - len(in_flight)):
+                in_flight[submit(source)] = source
+
+            if not in_flight:
+                break
+
+            done, _ = wait(in_flight, return_when=FIRST_COMPLETED)
+            for future in done:
+                source = in_flight.pop(future)
+                summary = future.result()
+                if not isinstance(summary, ValidationSummary):
+                    summary = ValidationSummary.model_validate(summary)
+
+                yield source, summary
+                if fail_fast and summary.status == "failed":
+                    return
+    finally:
+        for future in in_flight:
+            _ = future.cancel()
+
+        pool.shutdown(wait=False)
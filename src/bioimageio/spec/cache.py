@@ -0,0 +1,16 @@
+"""Inspect and manage the download cache in `settings.cache_path`.
+
+Limits for the download cache may be configured with the settings
+`cache_max_bytes`, `cache_max_age` and `cache_eviction_policy`.
+"""
+
+from ._internal.download_cache import CachedFile, CacheStats, pin, prune, stats, verify
+
+__all__ = [
+    "CachedFile",
+    "CacheStats",
+    "pin",
+    "prune",
+    "stats",
+    "verify",
+]
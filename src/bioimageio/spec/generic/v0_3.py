@@ -24,8 +24,9 @@ from typing_extensions import Annotated
 
 from .._internal.common_nodes import Node, ResourceDescrBase
 from .._internal.constants import TAG_CATEGORIES
-from .._internal.field_validation import validate_github_user
+from .._internal.field_validation import hotfix_github_user, validate_github_user
 from .._internal.field_warning import as_warning, issue_warning, warn
+from .._internal.github_users import verify_github_users
 from .._internal.io import (
     BioimageioYamlContent,
     FileDescr,
@@ -40,6 +41,7 @@ from .._internal.type_guards import is_dict
 from .._internal.types import FAIR, FileSource_, NotEmpty, RelativeFilePath
 from .._internal.url import HttpUrl
 from .._internal.validated_string import ValidatedString
+from .._internal.validation_context import get_validation_context
 from .._internal.validator_annotations import (
     Predicate,
     RestrictCharacters,
@@ -357,6 +359,25 @@ class GenericModelDescrBase(ResourceDescrBase):
     """Maintainers of this resource.
     If not specified, `authors` are maintainers and at least some of them has to specify their `github_user` name"""
 
+    @model_validator(mode="before")
+    @classmethod
+    def _verify_github_users(cls, data: Any) -> Any:
+        """verify all GitHub users at once (before validating them individually)"""
+        if is_dict(data) and get_validation_context().perform_io_checks:
+            github_users: List[str] = []
+            for key in ("authors", "maintainers"):
+                persons = data.get(key)
+                if not isinstance(persons, list):
+                    continue
+
+                for p in cast(List[Any], persons):
+                    if is_dict(p) and isinstance(gh := p.get("github_user"), str):
+                        github_users.append(hotfix_github_user(gh))
+
+            _ = verify_github_users(github_users)
+
+        return data
+
     @model_validator(mode="after")
     def _check_maintainers_exist(self):
         if not self.maintainers and self.authors:
@@ -3306,11 +3306,15 @@ class ModelDescr(GenericModelDescrBase):
             return self
 
         test_output_arrays = [
-            None if descr.test_tensor is None else load_array(descr.test_tensor)
+            None
+            if descr.test_tensor is None
+            else load_array(descr.test_tensor, mmap=True)
             for descr in self.outputs
         ]
         test_input_arrays = [
-            None if descr.test_tensor is None else load_array(descr.test_tensor)
+            None
+            if descr.test_tensor is None
+            else load_array(descr.test_tensor, mmap=True)
             for descr in self.inputs
         ]
 
@@ -3529,12 +3533,12 @@ class ModelDescr(GenericModelDescrBase):
         try:
             generated_covers = generate_covers(
                 [
-                    (t, load_array(t.test_tensor))
+                    (t, load_array(t.test_tensor, mmap=True))
                     for t in self.inputs
                     if t.test_tensor is not None
                 ],
                 [
-                    (t, load_array(t.test_tensor))
+                    (t, load_array(t.test_tensor, mmap=True))
                     for t in self.outputs
                     if t.test_tensor is not None
                 ],
@@ -9,6 +9,7 @@ from numpy.typing import NDArray
 from ._description import ensure_description_is_dataset as ensure_description_is_dataset
 from ._description import ensure_description_is_model as ensure_description_is_model
 from ._internal.io import FileDescr
+from ._internal.io import aget_reader as aget_reader
 from ._internal.io import download as download
 from ._internal.io import extract_file_name as extract_file_name
 from ._internal.io import get_reader as get_reader
@@ -19,6 +20,10 @@ from ._internal.io import (
 from ._internal.io import interprete_file_source as interprete_file_source
 from ._internal.io import is_valid_bioimageio_yaml_name as is_valid_bioimageio_yaml_name
 from ._internal.io_basics import ZipPath
+from ._internal.io_utils import ZipCompressionPolicy as ZipCompressionPolicy
+from ._internal.io_utils import aopen_bioimageio_yaml as aopen_bioimageio_yaml
+from ._internal.io_utils import compress_all as compress_all
+from ._internal.io_utils import default_compression_policy as default_compression_policy
 from ._internal.io_utils import load_array as load_array
 from ._internal.io_utils import open_bioimageio_yaml as open_bioimageio_yaml
 from ._internal.io_utils import read_yaml as read_yaml
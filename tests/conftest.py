@@ -61,6 +61,17 @@ def unet2d_data(unet2d_path: Path):
     return MappingProxyType(data)
 
 
+@pytest.fixture
+def isolated_cache_path(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> Path:
+    """use an empty `settings.cache_path`"""
+    from bioimageio.spec._internal._settings import settings
+
+    cache_path = tmp_path / "cache"
+    cache_path.mkdir()
+    monkeypatch.setattr(settings, "cache_path", cache_path)
+    return cache_path
+
+
 def pytest_sessionfinish(session: Any, exitstatus: Any):
     if len(KNOWN_GITHUB_USERS) > N_KNOWN_GITHUB_USERS:
         print("updated known gh users:")
@@ -0,0 +1,271 @@
+import io
+import time
+from pathlib import Path
+from typing import Iterator, List, Optional
+from zipfile import ZIP_STORED, ZipFile
+
+import httpx
+import pytest
+from respx import MockRouter
+
+URL = "https://mock_example.com/files/weights.bin"
+CONTENT = bytes(range(256)) * 64
+ETAG = '"v1"'
+
+
+@pytest.fixture(autouse=True)
+def small_chunks(isolated_cache_path: Path, monkeypatch: pytest.MonkeyPatch):
+    from bioimageio.spec._internal import download
+
+    monkeypatch.setattr(download, "CHUNK_SIZE", 1024)
+
+
+class _InterruptedStream(httpx.SyncByteStream):
+    def __init__(self, content: bytes, fail_after: Optional[int]):
+        super().__init__()
+        self.content = content
+        self.fail_after = fail_after
+
+    def __iter__(self) -> Iterator[bytes]:
+        for i in range(0, len(self.content), 1024):
+            if self.fail_after is not None and i >= self.fail_after:
+                raise httpx.ReadError("connection lost")
+
+            yield self.content[i : i + 1024]
+
+
+class _Server:
+    """mock server supporting range requests that fails after **fail_after** bytes"""
+
+    def __init__(
+        self,
+        fail_after: Optional[int] = None,
+        ranges: bool = True,
+        content: bytes = CONTENT,
+    ):
+        super().__init__()
+        self.fail_after = fail_after
+        self.ranges = ranges
+        self.content = content
+        self.range_headers: List[Optional[str]] = []
+
+    def __call__(self, request: httpx.Request) -> httpx.Response:
+        range_header = request.headers.get("range")
+        self.range_headers.append(range_header)
+        fail_after, self.fail_after = self.fail_after, None  # fail only once
+        content = self.content
+        headers = {"etag": ETAG, "content-length": str(len(content))}
+        if self.ranges:
+            headers["accept-ranges"] = "bytes"
+
+        if (
+            range_header is None
+            or not self.ranges
+            or request.headers.get("if-range", ETAG) != ETAG
+        ):
+            return httpx.Response(
+                200, headers=headers, stream=_InterruptedStream(content, fail_after)
+            )
+
+        first, last = range_header[len("bytes=") :].split("-")
+        if first == "":  # suffix range
+            start = max(0, len(content) - int(last))
+            end = len(content)
+        else:
+            start = int(first)
+            end = len(content) if last == "" else int(last) + 1
+
+        headers["content-range"] = f"bytes {start}-{end - 1}/{len(content)}"
+        headers["content-length"] = str(end - start)
+        return httpx.Response(
+            206,
+            headers=headers,
+            stream=_InterruptedStream(content[start:end], fail_after),
+        )
+
+
+def _download(keep_partial: bool = True):
+    from bioimageio.spec._internal.download import open_download
+
+    progress: List[int] = []
+    size, content = open_download(
+        URL, keep_partial=keep_partial, progress=progress.append
+    )
+    assert size == len(CONTENT)
+    data = b"".join(content)
+    assert sum(progress) == len(CONTENT)
+    return data
+
+
+def test_resume_interrupted_download(respx_mock: MockRouter):
+    server = _Server(fail_after=4096)
+    _ = respx_mock.get(URL).mock(side_effect=server)
+    assert _download(keep_partial=False) == CONTENT
+    assert server.range_headers == [None, "bytes=4096-16383"]
+
+
+def test_interrupted_download_wo_range_support(respx_mock: MockRouter):
+    server = _Server(fail_after=4096, ranges=False)
+    _ = respx_mock.get(URL).mock(side_effect=server)
+    with pytest.raises(httpx.TransportError):
+        _ = _download(keep_partial=False)
+
+    assert server.range_headers == [None, "bytes=4096-16383"]
+    assert _download(keep_partial=False) == CONTENT  # restarting works
+
+
+def test_resume_partial_download_from_disk(
+    respx_mock: MockRouter, monkeypatch: pytest.MonkeyPatch
+):
+    from bioimageio.spec._internal._settings import settings
+
+    server = _Server(fail_after=4096)
+    _ = respx_mock.get(URL).mock(side_effect=server)
+    monkeypatch.setattr(settings, "download_retries", 0)
+    with pytest.raises(httpx.ReadError):
+        _ = _download()
+
+    assert server.range_headers == [None]
+    assert _download() == CONTENT
+    assert server.range_headers == [None, "bytes=4096-16383"]
+    assert not list((settings.cache_path / "partial_downloads").iterdir())
+
+
+def test_discard_outdated_partial_download(
+    respx_mock: MockRouter, monkeypatch: pytest.MonkeyPatch
+):
+    from bioimageio.spec._internal import download
+    from bioimageio.spec._internal._settings import settings
+
+    server = _Server(fail_after=4096)
+    _ = respx_mock.get(URL).mock(side_effect=server)
+    monkeypatch.setattr(settings, "download_retries", 0)
+    with pytest.raises(httpx.ReadError):
+        _ = _download()
+
+    monkeypatch.setattr(settings, "download_retries", 5)
+    store = download._get_partial_download_store(settings.cache_path)  # pyright: ignore[reportPrivateUsage]
+    partial = store.get(URL)
+    assert partial is not None
+    store.set(URL, download.PartialDownload('"v0"', partial.size, partial.segments))
+    assert _download() == CONTENT
+    assert server.range_headers == [None, "bytes=4096-16383"]
+
+
+def test_segmented_download(respx_mock: MockRouter, monkeypatch: pytest.MonkeyPatch):
+    from bioimageio.spec._internal import download
+    from bioimageio.spec._internal._settings import settings
+
+    server = _Server(fail_after=2048)
+    _ = respx_mock.get(URL).mock(side_effect=server)
+    monkeypatch.setattr(settings, "download_segments", 4)
+    monkeypatch.setattr(download, "MIN_SEGMENT_SIZE", 4096)
+    assert _download() == CONTENT
+    assert sorted(server.range_headers, key=str) == sorted(
+        [
+            None,
+            "bytes=2048-4095",
+            "bytes=4096-8191",
+            "bytes=8192-12287",
+            "bytes=12288-16383",
+        ],
+        key=str,
+    )
+
+
+def test_move_completed_partial_download_to_dst(
+    respx_mock: MockRouter, monkeypatch: pytest.MonkeyPatch
+):
+    from bioimageio.spec._internal import download
+    from bioimageio.spec._internal._settings import settings
+
+    server = _Server(fail_after=4096)
+    _ = respx_mock.get(URL).mock(side_effect=server)
+    monkeypatch.setattr(settings, "download_retries", 0)
+    with pytest.raises(httpx.ReadError):
+        _ = _download()
+
+    store = download._get_partial_download_store(settings.cache_path)  # pyright: ignore[reportPrivateUsage]
+    part = download._get_part_paths(store.path, URL, 1)[0]  # pyright: ignore[reportPrivateUsage]
+    part_inode = part.stat().st_ino
+    dst = settings.cache_path / "downloaded.bin"
+    _, content = download.open_download(
+        URL, keep_partial=True, progress=lambda _: None, dst=dst
+    )
+    assert b"".join(content) == CONTENT
+    assert dst.read_bytes() == CONTENT
+    # the part file is moved, not copied
+    assert dst.stat().st_ino == part_inode
+    assert not part.exists()
+
+
+def _make_zip(weights: bytes) -> bytes:
+    buffer = io.BytesIO()
+    with ZipFile(buffer, "w", compression=ZIP_STORED) as zf:
+        zf.writestr("weights.bin", weights)
+        zf.writestr("rdf.yaml", "name: remote\n")
+
+    return buffer.getvalue()
+
+
+def test_remote_file(respx_mock: MockRouter, monkeypatch: pytest.MonkeyPatch):
+    from bioimageio.spec._internal import download
+
+    monkeypatch.setattr(download, "REMOTE_FILE_TAIL_SIZE", 1024)
+    weights = bytes(range(256)) * 4096
+    content = _make_zip(weights)
+    server = _Server(content=content)
+    _ = respx_mock.get(URL).mock(side_effect=server)
+
+    remote = download.RemoteFile.open(URL)
+    assert remote is not None
+    assert remote.size == len(content)
+    with ZipFile(remote) as zf:
+        assert zf.read("rdf.yaml") == b"name: remote\n"
+        assert server.range_headers == ["bytes=-1024"]  # served from tail
+        assert zf.read("weights.bin") == weights
+
+    # sequential reads request increasingly large byte ranges
+    assert len(server.range_headers) < 6
+
+
+def test_remote_file_reads_large_block_in_small_chunks(
+    respx_mock: MockRouter, monkeypatch: pytest.MonkeyPatch
+):
+    from bioimageio.spec._internal import download
+
+    content = bytes(range(256)) * (128 * 1024)  # 32 MiB
+    monkeypatch.setattr(download, "REMOTE_FILE_TAIL_SIZE", 1024)
+    monkeypatch.setattr(download, "REMOTE_FILE_MIN_READAHEAD", len(content))
+    server = _Server(content=content)
+    _ = respx_mock.get(URL).mock(side_effect=server)
+
+    remote = download.RemoteFile.open(URL)
+    assert remote is not None
+    start = time.perf_counter()
+    chunks: List[bytes] = []
+    while chunk := remote.read(4096):
+        chunks.append(chunk)
+
+    # reading a chunk does not copy the remainder of the cached block
+    assert time.perf_counter() - start < 5
+    assert b"".join(chunks) == content
+    assert server.range_headers == ["bytes=-1024", f"bytes=0-{len(content) - 1}"]
+
+
+def test_remote_file_wo_range_support(respx_mock: MockRouter):
+    from bioimageio.spec._internal.download import RemoteFile
+
+    _ = respx_mock.get(URL).mock(side_effect=_Server(ranges=False))
+    assert RemoteFile.open(URL) is None
+
+
+def test_open_remote_zip_package_lazily(respx_mock: MockRouter):
+    from bioimageio.spec._internal.io_utils import open_bioimageio_yaml
+
+    url = "https://mock_example.com/files/package.zip"
+    server = _Server(content=_make_zip(b"x" * (1024 * 1024)))
+    _ = respx_mock.get(url).mock(side_effect=server)
+    opened = open_bioimageio_yaml(url)
+    assert opened.content == {"name": "remote"}
+    assert server.range_headers == ["bytes=-65536"]
@@ -0,0 +1,328 @@
+import asyncio
+import hashlib
+import os
+import time
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from typing import Literal, Set
+
+import httpx
+import pytest
+from respx import MockRouter
+
+URL = "https://mock_example.com/files/{}.bin"
+
+
+@pytest.fixture(autouse=True)
+def disk_cache(isolated_cache_path: Path, monkeypatch: pytest.MonkeyPatch):
+    from genericache import DiskCache
+    from genericache.digest import UrlDigest
+
+    from bioimageio.spec._internal._settings import settings
+    from bioimageio.spec._internal.root_url import RootHttpUrl
+
+    monkeypatch.setattr(
+        settings,
+        "disk_cache",
+        DiskCache[RootHttpUrl].create(
+            url_type=RootHttpUrl,
+            cache_dir=isolated_cache_path,
+            url_hasher=UrlDigest.from_str,
+        ),
+    )
+
+
+def _add_entry(name: str, content: bytes, last_access: float) -> Path:
+    from bioimageio.spec._internal._settings import settings
+    from bioimageio.spec._internal.download_cache import (
+        CacheUsage,
+        _get_entry_name,  # pyright: ignore[reportPrivateUsage]
+        _get_usage_store,  # pyright: ignore[reportPrivateUsage]
+    )
+
+    url_digest = hashlib.sha256(URL.format(name).encode()).hexdigest()
+    entry_name = _get_entry_name(url_digest, hashlib.sha256(content).hexdigest())
+    path = settings.cache_path / entry_name
+    _ = path.write_bytes(content)
+    os.utime(path, (last_access, last_access))
+    _get_usage_store(settings.cache_path).set(
+        entry_name, CacheUsage(last_access=last_access, hits=len(name) - 1)
+    )
+    return path
+
+
+def test_stats_record_hits_and_downloads(respx_mock: MockRouter):
+    from bioimageio.spec import cache
+    from bioimageio.spec._internal.io import get_reader
+    from bioimageio.spec._internal.io_basics import Sha256
+    from bioimageio.spec._internal.url import HttpUrl
+
+    url = URL.format("a")
+    _ = respx_mock.get(url).respond(content=b"abc")
+    sha = Sha256(hashlib.sha256(b"abc").hexdigest())
+    for _ in range(3):
+        _ = get_reader(HttpUrl(url), sha256=sha).read()
+
+    stats = cache.stats()
+    assert len(stats.files) == 1
+    assert stats.total_bytes == 3
+    assert stats.footprint > stats.total_bytes  # includes usage records
+    assert (stats.downloads, stats.hits) == (1, 2)
+    assert stats.hit_rate == pytest.approx(2 / 3)
+
+
+@pytest.mark.parametrize(
+    "policy,expected_left", [("lru", {"b", "cc"}), ("lfu", {"cc", "ddd"})]
+)
+def test_prune(policy: Literal["lru", "lfu"], expected_left: Set[str]):
+    from bioimageio.spec import cache
+
+    now = time.time()
+    paths = {
+        # name length determines number of hits
+        name: _add_entry(name, b"x" * 10, now - age)
+        for name, age in [("a", 40), ("b", 10), ("cc", 20), ("ddd", 30)]
+    }
+    assert cache.prune(max_bytes=20, policy=policy)
+    assert {name for name, p in paths.items() if p.exists()} == expected_left
+    assert cache.stats().total_bytes == 20
+
+
+def test_prune_by_age_keeps_pinned_files():
+    from bioimageio.spec import cache
+
+    now = time.time()
+    old = _add_entry("old", b"1", now - 100)
+    pinned = _add_entry("pinned", b"2", now - 100)
+    new = _add_entry("new", b"3", now)
+    with cache.pin(URL.format("pinned")):
+        evicted = cache.prune(max_age=50)
+
+    assert [f.path for f in evicted] == [old]
+    assert not old.exists()
+    assert pinned.exists()
+    assert new.exists()
+    assert not list((pinned.parent / "pinned").iterdir())
+
+
+def test_pin_by_sha256_keeps_file_downloaded_from_other_url():
+    from bioimageio.spec import cache
+
+    served = _add_entry("mirror", b"content", time.time() - 100)
+    with cache.pin(URL.format("a"), sha256=hashlib.sha256(b"content").hexdigest()):
+        assert cache.prune(max_age=50) == []
+
+    assert served.exists()
+    assert [f.path for f in cache.prune(max_age=50)] == [served]
+
+
+def test_entry_names_match_genericache(respx_mock: MockRouter):
+    from genericache.digest import ContentDigest, UrlDigest
+
+    from bioimageio.spec._internal._settings import settings
+    from bioimageio.spec._internal.download_cache import (
+        _get_entry_name,  # pyright: ignore[reportPrivateUsage]
+        add_entry,
+    )
+    from bioimageio.spec._internal.root_url import RootHttpUrl
+
+    url = URL.format("a")
+    url_digest = hashlib.sha256(url.encode()).hexdigest()
+    _ = settings.disk_cache.fetch(RootHttpUrl(url), lambda _: iter([b"abc"]))
+    assert (
+        settings.cache_path
+        / _get_entry_name(url_digest, hashlib.sha256(b"abc").hexdigest())
+    ).exists()
+
+    other = URL.format("b")
+    src = settings.cache_path.parent / "src.bin"
+    _ = src.write_bytes(b"def")
+    _ = add_entry(
+        settings.cache_path,
+        UrlDigest.from_str(other),
+        ContentDigest.parse(hexdigest=hashlib.sha256(b"def").hexdigest()),
+        src,
+    )
+    entry = settings.disk_cache.get_by_url(url=RootHttpUrl(other))
+    assert entry is not None
+    assert entry.read() == b"def"
+
+
+def test_verify():
+    from bioimageio.spec import cache
+
+    ok = _add_entry("ok", b"ok", time.time())
+    corrupted = _add_entry("corrupted", b"original", time.time())
+    _ = corrupted.write_bytes(b"changed")
+    assert [f.path for f in cache.verify()] == [corrupted]
+    assert ok.exists()
+    assert not corrupted.exists()
+
+
+def test_download_enforces_max_bytes(
+    respx_mock: MockRouter, monkeypatch: pytest.MonkeyPatch
+):
+    from bioimageio.spec import cache
+    from bioimageio.spec._internal._settings import settings
+    from bioimageio.spec._internal.io import get_reader
+    from bioimageio.spec._internal.io_basics import Sha256
+    from bioimageio.spec._internal.url import HttpUrl
+
+    old = _add_entry("old", b"x" * 10, time.time() - 10)
+    monkeypatch.setattr(settings, "cache_max_bytes", 15)
+    url = URL.format("new")
+    _ = respx_mock.get(url).respond(content=b"y" * 10)
+    _ = get_reader(HttpUrl(url), sha256=Sha256(hashlib.sha256(b"y" * 10).hexdigest()))
+    assert not old.exists()
+    assert [f.size for f in cache.stats().files] == [10]
+
+
+def _slow_response(content: bytes):
+    def respond(request: httpx.Request) -> httpx.Response:
+        time.sleep(0.2)
+        return httpx.Response(200, content=content)
+
+    return respond
+
+
+@pytest.mark.parametrize("with_sha", [True, False])
+def test_concurrent_downloads_are_shared(respx_mock: MockRouter, with_sha: bool):
+    from bioimageio.spec._internal.io import get_reader
+    from bioimageio.spec._internal.io_basics import Sha256
+
+    content = b"shared content"
+    sha = Sha256(hashlib.sha256(content).hexdigest()) if with_sha else None
+    urls = (
+        [URL.format("a"), URL.format("mirror_of_a")] if with_sha else [URL.format("a")]
+    )
+    routes = [respx_mock.get(u).mock(side_effect=_slow_response(content)) for u in urls]
+    with ThreadPoolExecutor(max_workers=4) as executor:
+        futures = [executor.submit(get_reader, url, sha256=sha) for url in urls * 2]
+        readers = [f.result() for f in futures]
+
+    assert all(r.read() == content for r in readers)
+    assert sum(len(r.calls) for r in routes) == 1
+
+
+def test_concurrent_async_downloads_are_shared(respx_mock: MockRouter):
+    from bioimageio.spec._internal.io import aget_reader
+    from bioimageio.spec._internal.io_basics import Sha256
+
+    content = b"shared content"
+    sha = Sha256(hashlib.sha256(content).hexdigest())
+    url = URL.format("a")
+
+    async def respond(request: httpx.Request) -> httpx.Response:
+        await asyncio.sleep(0.2)
+        return httpx.Response(200, content=content)
+
+    route = respx_mock.get(url).mock(side_effect=respond)
+
+    async def main():
+        return await asyncio.gather(*(aget_reader(url, sha256=sha) for _ in range(4)))
+
+    readers = asyncio.run(main())
+    assert all(r.read() == content for r in readers)
+    assert len(route.calls) == 1
+
+
+def test_concurrent_async_downloads_exceeding_executor_workers(
+    respx_mock: MockRouter,
+):
+    from bioimageio.spec._internal.io import aget_reader
+    from bioimageio.spec._internal.io_basics import Sha256
+
+    content = b"shared content"
+    sha = Sha256(hashlib.sha256(content).hexdigest())
+    url = URL.format("a")
+
+    async def respond(request: httpx.Request) -> httpx.Response:
+        await asyncio.sleep(0.2)
+        return httpx.Response(200, content=content)
+
+    route = respx_mock.get(url).mock(side_effect=respond)
+
+    async def main():
+        # waiting tasks must not occupy the worker threads the downloading task needs
+        asyncio.get_running_loop().set_default_executor(
+            ThreadPoolExecutor(max_workers=2)
+        )
+        return await asyncio.wait_for(
+            asyncio.gather(*(aget_reader(url, sha256=sha) for _ in range(8))),
+            timeout=30,
+        )
+
+    readers = asyncio.run(main())
+    assert all(r.read() == content for r in readers)
+    assert len(route.calls) == 1
+
+
+def test_prune_removes_unused_download_locks():
+    from bioimageio.spec import cache
+    from bioimageio.spec._internal._settings import settings
+    from bioimageio.spec._internal.download_cache import DownloadLock
+
+    held = DownloadLock("held")
+    unused = DownloadLock("unused")
+    _ = held.acquire()
+    _ = unused.acquire()
+    unused.release()
+    try:
+        _ = cache.prune()
+        locks = {p.name for p in (settings.cache_path / "download_locks").iterdir()}
+    finally:
+        held.release()
+
+    assert locks == {"held.lock"}
+    # a lock whose file was removed can be acquired again
+    assert not unused.acquire()
+    unused.release()
+
+
+def test_download_locks_of_memory_cache_are_not_shared_across_processes(
+    respx_mock: MockRouter, monkeypatch: pytest.MonkeyPatch
+):
+    from genericache import MemoryCache
+    from genericache.digest import UrlDigest
+
+    from bioimageio.spec._internal._settings import settings
+    from bioimageio.spec._internal.io import get_reader
+    from bioimageio.spec._internal.io_basics import Sha256
+    from bioimageio.spec._internal.url import HttpUrl
+
+    monkeypatch.setattr(
+        settings, "disk_cache", MemoryCache(url_hasher=UrlDigest.from_str)
+    )
+    url = URL.format("in_memory")
+    _ = respx_mock.get(url).respond(content=b"abc")
+    sha = Sha256(hashlib.sha256(b"abc").hexdigest())
+    assert get_reader(HttpUrl(url), sha256=sha).read() == b"abc"
+    assert not (settings.cache_path / "download_locks").exists()
+
+
+def test_download_into_fresh_cache_dir(
+    tmp_path: Path, respx_mock: MockRouter, monkeypatch: pytest.MonkeyPatch
+):
+    from genericache import DiskCache
+    from genericache.digest import UrlDigest
+
+    from bioimageio.spec._internal._settings import settings
+    from bioimageio.spec._internal.io import get_reader
+    from bioimageio.spec._internal.io_basics import Sha256
+    from bioimageio.spec._internal.root_url import RootHttpUrl
+    from bioimageio.spec._internal.url import HttpUrl
+
+    fresh = tmp_path / "fresh_cache"
+    monkeypatch.setattr(settings, "cache_path", fresh)
+    monkeypatch.setattr(
+        settings,
+        "disk_cache",
+        DiskCache[RootHttpUrl].create(
+            url_type=RootHttpUrl, cache_dir=fresh, url_hasher=UrlDigest.from_str
+        ),
+    )
+    url = URL.format("fresh")
+    _ = respx_mock.get(url).respond(content=b"abc")
+    sha = Sha256(hashlib.sha256(b"abc").hexdigest())
+    assert not fresh.exists()
+    assert get_reader(HttpUrl(url), sha256=sha).read() == b"abc"
@@ -0,0 +1,109 @@
+from typing import ClassVar, List, Literal, Union
+
+import pytest
+from annotated_types import Ge, MinLen
+from pydantic import ValidationError, field_validator
+from typing_extensions import Annotated
+
+from bioimageio.spec._internal.common_nodes import InvalidDescr, ResourceDescrBase
+from bioimageio.spec._internal.field_warning import warn
+from bioimageio.spec._internal.io import BioimageioYamlContent
+from bioimageio.spec._internal.node import Node
+from bioimageio.spec._internal.validation_context import ValidationContext
+from bioimageio.spec._internal.warning_levels import ALERT, INFO, WARNING
+
+
+class Counted(Node):
+    n_validated: ClassVar[int] = 0
+
+    a: Annotated[int, warn(Ge(0), "smaller than zero", WARNING)] = 0
+
+    @field_validator("a", mode="before")
+    @classmethod
+    def _count(cls, value: int):
+        Counted.n_validated += 1
+        return value
+
+
+class Other(Node):
+    a: int
+    b: int
+
+
+class MyDescr(ResourceDescrBase):
+    implemented_type: ClassVar[Literal["test"]] = "test"
+    implemented_format_version: ClassVar[Literal["1.0.0"]] = "1.0.0"
+    type: Literal["test"]
+    format_version: Literal["1.0.0"]
+
+    counted: List[Counted]
+    either: Union[Counted, Other]
+    name: Annotated[str, warn(MinLen(2), "short name", INFO)] = "a"
+
+
+DATA: BioimageioYamlContent = {
+    "type": "test",
+    "format_version": "1.0.0",
+    "counted": [{"a": 1}, {"a": -1}],
+    "either": {"a": -1, "b": -1},
+}
+
+
+@pytest.mark.parametrize("warning_level", [ALERT, WARNING, INFO])
+def test_warnings_are_collected_in_a_single_pass(warning_level: Literal[20, 30, 35]):
+    Counted.n_validated = 0
+    with ValidationContext(warning_level=warning_level, log_warnings=False):
+        descr = MyDescr.load(DATA)
+
+    assert Counted.n_validated == 3  # 2 list items + 1 failed union member
+    warnings = [(w.loc, w.severity) for w in descr.validation_summary.warnings]
+    # warning in failed union member 'either' is discarded
+    assert warnings == [(("counted", 1, "a"), WARNING), (("name",), INFO)]
+    if warning_level == ALERT:
+        assert not isinstance(descr, InvalidDescr)
+    else:
+        assert isinstance(descr, InvalidDescr)
+        assert descr.validation_summary.errors[0].type == "severe_warnings"
+
+
+def test_severe_warnings_are_raised():
+    with ValidationContext(
+        warning_level=WARNING, raise_errors=True, log_warnings=False
+    ), pytest.raises(ValidationError) as e:
+        _ = MyDescr.load(DATA)
+
+    assert [err["loc"] for err in e.value.errors()] == [("counted", 1, "a")]
+
+
+class Plain(Node):
+    a: int
+
+
+class UnionDescr(ResourceDescrBase):
+    implemented_type: ClassVar[Literal["test"]] = "test"
+    implemented_format_version: ClassVar[Literal["1.0.0"]] = "1.0.0"
+    type: Literal["test"]
+    format_version: Literal["1.0.0"]
+
+    either: Union[Counted, Plain]
+
+
+@pytest.mark.parametrize("warning_level", [ALERT, WARNING])
+def test_union_member_selection_ignores_warning_level(
+    warning_level: Literal[30, 35],
+):
+    # union members are selected irrespective of their warnings,
+    # i.e. a member issuing a severe warning is not skipped for the next member
+    with ValidationContext(warning_level=warning_level, log_warnings=False):
+        descr = UnionDescr.load(
+            {"type": "test", "format_version": "1.0.0", "either": {"a": -1}}
+        )
+
+    warnings = [(w.loc, w.severity) for w in descr.validation_summary.warnings]
+    assert warnings == [(("either", "a"), WARNING)]
+    if warning_level == ALERT:
+        assert isinstance(descr, UnionDescr)
+        assert isinstance(descr.either, Counted)
+    else:
+        assert isinstance(descr, InvalidDescr)
+        assert descr.validation_summary.errors[0].type == "severe_warnings"
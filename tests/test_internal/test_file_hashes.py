@@ -0,0 +1,84 @@
+import hashlib
+import os
+import time
+from pathlib import Path
+from typing import Any, List
+from zipfile import ZipFile
+
+import pytest
+
+from bioimageio.spec._internal.io_basics import ZipPath
+
+
+@pytest.fixture(autouse=True)
+def file_hash_index(isolated_cache_path: Path, monkeypatch: pytest.MonkeyPatch):
+    from bioimageio.spec._internal._settings import settings
+
+    monkeypatch.setattr(settings, "file_hash_index", True)
+
+
+@pytest.fixture
+def hashed(monkeypatch: pytest.MonkeyPatch) -> List[Any]:
+    """sources hashed (instead of looked up in the index)"""
+    from bioimageio.spec._internal import file_hashes
+
+    hashed: List[Any] = []
+    original_hash = file_hashes._hash  # pyright: ignore[reportPrivateUsage]
+
+    def tracked_hash(source: Any):
+        hashed.append(source)
+        return original_hash(source)
+
+    monkeypatch.setattr(file_hashes, "_hash", tracked_hash)
+    return hashed
+
+
+def _make_old(path: Path):
+    old = time.time() - 60
+    os.utime(path, (old, old))
+
+
+def test_file_hash_index(tmp_path: Path, hashed: List[Any]):
+    from bioimageio.spec._internal.file_hashes import get_file_sha256
+
+    path = tmp_path / "file.txt"
+    _ = path.write_text("content")
+    _make_old(path)
+    expected = hashlib.sha256(b"content").hexdigest()
+    assert get_file_sha256(path) == expected
+    assert get_file_sha256(path) == expected
+    assert hashed == [path]
+
+    _ = path.write_text("changed")
+    _make_old(path)
+    assert get_file_sha256(path) == hashlib.sha256(b"changed").hexdigest()
+    assert hashed == [path, path]
+
+
+def test_file_hash_index_skips_recently_modified_files(
+    tmp_path: Path, hashed: List[Any]
+):
+    from bioimageio.spec._internal.file_hashes import get_file_sha256
+
+    path = tmp_path / "file.txt"
+    _ = path.write_text("content")
+    assert get_file_sha256(path) == get_file_sha256(path)
+    assert hashed == [path, path]
+
+
+def test_file_hash_index_zip_member(tmp_path: Path, hashed: List[Any]):
+    from bioimageio.spec._internal.file_hashes import get_file_sha256
+
+    path = tmp_path / "package.zip"
+    with ZipFile(path, "w") as zf:
+        zf.writestr("a.txt", "a")
+        zf.writestr("b.txt", "b")
+
+    _make_old(path)
+    with ZipFile(path) as zf:
+        for _ in range(2):
+            for name in ("a.txt", "b.txt"):
+                sha = get_file_sha256(ZipPath(zf, name))
+                assert sha == hashlib.sha256(name[0].encode()).hexdigest()
+
+    assert len(hashed) == 2
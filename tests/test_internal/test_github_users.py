@@ -0,0 +1,153 @@
+import json
+from pathlib import Path
+from typing import Set
+
+import httpx
+import pytest
+from respx import MockRouter
+
+
+@pytest.fixture(autouse=True)
+def isolated_github_users(isolated_cache_path: Path, monkeypatch: pytest.MonkeyPatch):
+    from bioimageio.spec._internal import github_users
+
+    known: Set[str] = set()
+    known_invalid: Set[str] = set()
+    monkeypatch.setattr(github_users, "KNOWN_GITHUB_USERS", known)
+    monkeypatch.setattr(github_users, "KNOWN_INVALID_GITHUB_USERS", known_invalid)
+
+
+def _forget_known_users():
+    from bioimageio.spec._internal import github_users
+
+    known: Set[str] = github_users.KNOWN_GITHUB_USERS
+    known_invalid: Set[str] = github_users.KNOWN_INVALID_GITHUB_USERS
+    known.clear()
+    known_invalid.clear()
+
+
+def test_verify_github_users_rest(
+    respx_mock: MockRouter, monkeypatch: pytest.MonkeyPatch
+):
+    from bioimageio.spec._internal._settings import settings
+    from bioimageio.spec._internal.github_users import verify_github_users
+
+    monkeypatch.setattr(settings, "github_token", None)
+    valid = respx_mock.get("https://api.github.com/users/valid").mock(
+        httpx.Response(status_code=200)
+    )
+    invalid = respx_mock.get("https://api.github.com/users/invalid").mock(
+        httpx.Response(status_code=404)
+    )
+
+    users = ["valid", "invalid", "valid"]
+    expected = {"valid": True, "invalid": False}
+    assert verify_github_users(users) == expected
+    assert len(valid.calls) == len(invalid.calls) == 1
+
+    _forget_known_users()
+    assert verify_github_users(users) == expected  # from disk cache
+    assert len(valid.calls) == len(invalid.calls) == 1
+
+
+def test_verify_github_users_graphql(
+    respx_mock: MockRouter, monkeypatch: pytest.MonkeyPatch
+):
+    from bioimageio.spec._internal._settings import settings
+    from bioimageio.spec._internal.github_users import verify_github_users
+
+    monkeypatch.setattr(settings, "github_token", "token")
+    route = respx_mock.post("https://api.github.com/graphql").mock(
+        httpx.Response(
+            status_code=200,
+            json={"data": {"u0": {"login": "valid"}, "u1": None}},
+        )
+    )
+
+    assert verify_github_users(["valid", "invalid"]) == {
+        "valid": True,
+        "invalid": False,
+    }
+    assert len(route.calls) == 1
+    query = json.loads(route.calls.last.request.content)["query"]
+    assert 'u0: repositoryOwner(login: "valid")' in query
+    assert 'u1: repositoryOwner(login: "invalid")' in query
+
+
+def test_verify_github_users_graphql_errors(
+    respx_mock: MockRouter, monkeypatch: pytest.MonkeyPatch
+):
+    from bioimageio.spec._internal._settings import settings
+    from bioimageio.spec._internal.github_users import (
+        get_known_github_user,
+        verify_github_users,
+    )
+
+    monkeypatch.setattr(settings, "github_token", "token")
+    _ = respx_mock.post("https://api.github.com/graphql").mock(
+        httpx.Response(
+            status_code=200,
+            json={
+                "data": {"u0": None, "u1": None, "u2": {"login": "valid"}},
+                "errors": [
+                    {"type": "NOT_FOUND", "path": ["u0"]},
+                    {"type": "INTERNAL", "path": ["u1"]},
+                ],
+            },
+        )
+    )
+
+    assert verify_github_users(["invalid", "flaky", "valid"]) == {
+        "invalid": False,
+        "flaky": None,
+        "valid": True,
+    }
+    assert get_known_github_user("flaky") is None
+
+
+def test_verify_github_users_graphql_without_data(
+    respx_mock: MockRouter, monkeypatch: pytest.MonkeyPatch
+):
+    from bioimageio.spec._internal._settings import settings
+    from bioimageio.spec._internal.github_users import verify_github_users
+
+    monkeypatch.setattr(settings, "github_token", "token")
+    _ = respx_mock.post("https://api.github.com/graphql").mock(
+        httpx.Response(
+            status_code=200, json={"data": None, "errors": [{"type": "INTERNAL"}]}
+        )
+    )
+    rest = respx_mock.get("https://api.github.com/users/valid").mock(
+        httpx.Response(status_code=200)
+    )
+
+    # falls back to the REST API
+    assert verify_github_users(["valid"]) == {"valid": True}
+    assert len(rest.calls) == 1
+
+
+def test_transient_errors_are_not_recorded(
+    respx_mock: MockRouter, monkeypatch: pytest.MonkeyPatch
+):
+    from bioimageio.spec import ValidationContext
+    from bioimageio.spec._internal._settings import settings
+    from bioimageio.spec._internal.field_validation import validate_github_user
+    from bioimageio.spec._internal.github_users import (
+        get_known_github_user,
+        verify_github_users,
+    )
+    from bioimageio.spec._internal.warning_levels import INFO
+
+    monkeypatch.setattr(settings, "github_token", None)
+    route = respx_mock.get("https://api.github.com/users/flaky").mock(
+        httpx.Response(status_code=503)
+    )
+
+    assert verify_github_users(["flaky"]) == {"flaky": None}
+    with ValidationContext(perform_io_checks=True, warning_level=INFO):
+        with pytest.raises(ValueError, match="Could not verify GitHub user 'flaky'"):
+            _ = validate_github_user("flaky")
+
+    assert len(route.calls) == 2
+    assert get_known_github_user("flaky") is None
+    assert not (settings.cache_path / "github_users").exists()
@@ -0,0 +1,51 @@
+import asyncio
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+import httpx
+
+
+def test_host_limited_transport():
+    from bioimageio.spec._internal.http_transport import HostLimitedTransport
+
+    lock = threading.Lock()
+    active = {"a.com": 0, "b.com": 0}
+    max_active = dict(active)
+
+    def handler(request: httpx.Request):
+        host = request.url.host
+        with lock:
+            active[host] += 1
+            max_active[host] = max(max_active[host], active[host])
+
+        time.sleep(0.05)
+        with lock:
+            active[host] -= 1
+
+        return httpx.Response(200, content=b"content")
+
+    client = httpx.Client(
+        transport=HostLimitedTransport(httpx.MockTransport(handler), max_per_host=2)
+    )
+    urls = [f"https://{host}/{i}" for i in range(6) for host in active]
+    with ThreadPoolExecutor(max_workers=len(urls)) as executor:
+        responses = list(executor.map(client.get, urls))
+
+    assert all(r.content == b"content" for r in responses)
+    assert max_active == {"a.com": 2, "b.com": 2}
+
+
+def test_async_http_client_is_closed_with_its_event_loop():
+    from bioimageio.spec._internal._settings import settings
+
+    async def get_clients():
+        return settings.get_async_http_client(), settings.get_async_http_client()
+
+    first, same = asyncio.run(get_clients())
+    assert first is same
+    assert first.is_closed
+
+    second, _ = asyncio.run(get_clients())
+    assert second is not first
+    assert second.is_closed
@@ -1,6 +1,8 @@
+import asyncio
+import hashlib
 import io
 from pathlib import Path, PurePath
-from typing import Annotated, Any, Union
+from typing import Annotated, Any, List, Optional, Union
 from zipfile import ZipFile
 
 import httpx
@@ -112,6 +114,43 @@ def test_known_files(tmp_path: Path):
         assert file_descr.sha256 == sha
 
 
+def test_populate_known_files(tmp_path: Path):
+    from bioimageio.spec._internal.io import (
+        FileDescr,
+        get_sha256,
+        populate_known_files,
+    )
+
+    contents = {"a.txt": "a", "b.txt": "b", "c.txt": "c"}
+    for name, content in contents.items():
+        _ = (tmp_path / name).write_text(content)
+
+    zip_path = tmp_path / "package.zip"
+    with ZipFile(zip_path, "w") as zf:
+        zf.writestr("member.txt", "member")
+
+    with ValidationContext(root=tmp_path, perform_io_checks=False) as context:
+        descrs = [
+            FileDescr(source=name)  # pyright: ignore[reportArgumentType]
+            for name in [*contents, "missing.txt"]
+        ]
+        populate_known_files(descrs)
+
+    assert context.known_files == {
+        name: get_sha256(tmp_path / name) for name in contents
+    }
+
+    with ZipFile(zip_path) as zf, ValidationContext(
+        root=zf, perform_io_checks=False
+    ) as context:
+        populate_known_files(
+            [FileDescr(source="member.txt")]  # pyright: ignore[reportArgumentType]
+        )
+        assert context.known_files == {
+            "member.txt": hashlib.sha256(b"member").hexdigest()
+        }
+
+
 def test_disable_cache(respx_mock: MockRouter):
     from bioimageio.spec._internal.io import get_reader
     from bioimageio.spec._internal.url import RootHttpUrl
@@ -132,6 +171,28 @@ def test_disable_cache(respx_mock: MockRouter):
     assert reader.read().decode(encoding="utf-8") == "example content"
 
 
+def test_url_reader_sha256_from_download(
+    respx_mock: MockRouter, monkeypatch: pytest.MonkeyPatch
+):
+    from bioimageio.spec._internal import io_basics
+    from bioimageio.spec._internal.io import get_reader
+
+    content = b"example content"
+    url = "https://mock_example.com/files/file.txt"
+    _ = respx_mock.get(url).mock(httpx.Response(content=content, status_code=200))
+
+    def fail_get_sha256(*args: Any, **kwargs: Any):
+        raise AssertionError("content should not be read again for hashing")
+
+    monkeypatch.setattr(io_basics, "get_sha256", fail_get_sha256)
+    with ValidationContext(disable_cache=True):
+        reader = get_reader(url)
+
+    assert reader.sha256 == hashlib.sha256(content).hexdigest()
+    assert reader.tell() == 0
+    assert reader.read() == content
+
+
 def test_download_zip_wo_cache(respx_mock: MockRouter):
     from bioimageio.spec._internal.io import get_reader
 
@@ -261,3 +322,226 @@ def test_open_url_with_wrong_sha(respx_mock: MockRouter):
 
     with pytest.raises(httpx.InvalidURL, match="Invalid URL"):
         _ = _open_url(HttpUrl(url), sha256=sha, progressbar=False)
+
+
+def test_populate_cache(respx_mock: MockRouter, monkeypatch: pytest.MonkeyPatch):
+    from exceptiongroup import ExceptionGroup
+    from genericache import MemoryCache
+    from genericache.digest import UrlDigest
+
+    from bioimageio.spec._internal._settings import settings
+    from bioimageio.spec._internal.io import (
+        LightHttpFileDescr,
+        get_reader,
+        populate_cache,
+    )
+
+    monkeypatch.setattr(
+        settings, "disk_cache", MemoryCache(url_hasher=UrlDigest.from_str)
+    )
+
+    class RecordingProgressbar:
+        total: Optional[int] = None
+        n: int = 0
+        closed: bool = False
+
+        def update(self, increment: int, /):
+            self.n += increment
+
+        def reset(self):
+            self.n = 0
+
+        def close(self):
+            self.closed = True
+
+        def set_description(self, description: str, /, refresh: bool = True):
+            pass
+
+    contents = {
+        f"https://example{i % 2}.com/file{i}.txt": f"content {i}".encode()
+        for i in range(6)
+    }
+    routes = {
+        url: respx_mock.get(url).mock(httpx.Response(content=c, status_code=200))
+        for url, c in contents.items()
+    }
+    failing_url = "https://example0.com/missing.txt"
+    _ = respx_mock.get(failing_url).mock(httpx.Response(status_code=404))
+
+    sources = [
+        LightHttpFileDescr(
+            source=url,  # pyright: ignore[reportArgumentType]
+            sha256=Sha256(hashlib.sha256(c).hexdigest()),
+        )
+        for url, c in contents.items()
+    ]
+    sources.append(
+        LightHttpFileDescr(
+            source=failing_url,  # pyright: ignore[reportArgumentType]
+            sha256=Sha256("0" * 64),
+        )
+    )
+
+    pbar = RecordingProgressbar()
+    with pytest.raises(ExceptionGroup) as e:
+        populate_cache(sources + sources[:2], progressbar=pbar)
+
+    assert len(e.value.exceptions) == 1
+    assert all(len(r.calls) == 1 for r in routes.values())
+    assert pbar.total == pbar.n == sum(map(len, contents.values()))
+    assert pbar.closed
+
+    # downloaded files are served from cache
+    for src in sources[:-1]:
+        assert (
+            get_reader(src.source, sha256=src.sha256).read()
+            == contents[str(src.source)]
+        )
+
+    assert all(len(r.calls) == 1 for r in routes.values())
+
+
+def test_populate_cache_does_not_block_on_busy_host(
+    respx_mock: MockRouter, monkeypatch: pytest.MonkeyPatch
+):
+    import time
+
+    from genericache import MemoryCache
+    from genericache.digest import UrlDigest
+
+    from bioimageio.spec._internal._settings import settings
+    from bioimageio.spec._internal.io import LightHttpFileDescr, populate_cache
+
+    monkeypatch.setattr(
+        settings, "disk_cache", MemoryCache(url_hasher=UrlDigest.from_str)
+    )
+    monkeypatch.setattr(settings, "max_concurrent_downloads", 2)
+    monkeypatch.setattr(settings, "max_concurrent_downloads_per_host", 1)
+    requested: List[str] = []
+
+    def respond(request: httpx.Request) -> httpx.Response:
+        requested.append(request.url.host)
+        time.sleep(0.1)
+        return httpx.Response(200, content=request.url.path.encode())
+
+    urls = [f"https://busy.com/file{i}.txt" for i in range(4)]
+    urls.append("https://other.com/file.txt")
+    for url in urls:
+        _ = respx_mock.get(url).mock(side_effect=respond)
+
+    populate_cache(
+        [
+            LightHttpFileDescr(
+                source=url,  # pyright: ignore[reportArgumentType]
+                sha256=Sha256(
+                    hashlib.sha256(url.split(".com")[1].encode()).hexdigest()
+                ),
+            )
+            for url in urls
+        ],
+        progressbar=False,
+    )
+    # the other host is served while the busy host is at its limit
+    assert "other.com" in requested[:2]
+
+
+def test_aget_reader(respx_mock: MockRouter, monkeypatch: pytest.MonkeyPatch):
+    from genericache import MemoryCache
+    from genericache.digest import UrlDigest
+
+    from bioimageio.spec._internal._settings import settings
+    from bioimageio.spec._internal.io import (
+        LightHttpFileDescr,
+        aget_reader,
+        apopulate_cache,
+    )
+
+    monkeypatch.setattr(
+        settings, "disk_cache", MemoryCache(url_hasher=UrlDigest.from_str)
+    )
+    content = b"example content"
+    sha = Sha256(hashlib.sha256(content).hexdigest())
+    url = "https://mock_example.com/files/file.txt"
+    route = respx_mock.get(url).mock(httpx.Response(content=content, status_code=200))
+
+    asyncio.run(
+        apopulate_cache(
+            [LightHttpFileDescr(source=url, sha256=sha)],  # pyright: ignore[reportArgumentType]
+            progressbar=False,
+        )
+    )
+    assert len(route.calls) == 1
+
+    reader = asyncio.run(aget_reader(url, sha256=sha))
+    assert reader.read() == content
+    assert reader.original_file_name == "file.txt"
+    assert len(route.calls) == 1  # served from cache
+
+
+def test_async_download_writes_in_worker_threads(
+    respx_mock: MockRouter, monkeypatch: pytest.MonkeyPatch
+):
+    import tempfile
+    import threading
+
+    from bioimageio.spec._internal import io as io_module
+    from bioimageio.spec._internal.root_url import RootHttpUrl
+
+    monkeypatch.setattr(io_module, "CHUNK_SIZE", 256)
+    monkeypatch.setattr(io_module, "ASYNC_DOWNLOAD_BUFFER_SIZE", 1024)
+    writing_threads: List[int] = []
+    write_chunks = io_module._write_chunks  # pyright: ignore[reportPrivateUsage]
+
+    def record_write_chunks(*args: Any):
+        writing_threads.append(threading.get_ident())
+        write_chunks(*args)
+
+    monkeypatch.setattr(io_module, "_write_chunks", record_write_chunks)
+    content = bytes(range(256)) * 32
+    url = "https://mock_example.com/files/large.bin"
+    _ = respx_mock.get(url).mock(httpx.Response(content=content, status_code=200))
+
+    async def download(f: Any):
+        sha = await io_module._afetch_url(  # pyright: ignore[reportPrivateUsage]
+            RootHttpUrl(url), f, progressbar=False
+        )
+        return sha, threading.get_ident()
+
+    with tempfile.TemporaryFile() as f:
+        sha, loop_thread = asyncio.run(download(f))
+        _ = f.seek(0)
+        assert f.read() == content
+
+    assert sha == hashlib.sha256(content).hexdigest()
+    assert len(writing_threads) >= len(content) // 1024
+    assert loop_thread not in writing_threads
+
+
+def test_get_reader_reuses_content_from_other_url(
+    respx_mock: MockRouter, monkeypatch: pytest.MonkeyPatch
+):
+    from genericache import MemoryCache
+    from genericache.digest import UrlDigest
+
+    from bioimageio.spec._internal._settings import settings
+    from bioimageio.spec._internal.io import get_reader
+    from bioimageio.spec._internal.url import RootHttpUrl
+
+    monkeypatch.setattr(
+        settings, "disk_cache", MemoryCache(url_hasher=UrlDigest.from_str)
+    )
+    content = b"weights"
+    sha = Sha256(hashlib.sha256(content).hexdigest())
+    url = "https://mock_example.com/v1/weights.pt"
+    mirror_url = "https://mock_mirror.com/v2/weights.pt"
+    route = respx_mock.get(url).mock(httpx.Response(content=content, status_code=200))
+    mirror_route = respx_mock.get(mirror_url).mock(
+        httpx.Response(content=content, status_code=200)
+    )
+
+    assert get_reader(url, sha256=sha).read() == content
+    reader = get_reader(mirror_url, sha256=sha)
+    assert reader.read() == content
+    assert reader.original_root == RootHttpUrl("https://mock_mirror.com/v2")
+    assert len(route.calls) == 1
+    assert len(mirror_route.calls) == 0
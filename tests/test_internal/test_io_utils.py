@@ -0,0 +1,209 @@
+import io
+import os
+from pathlib import Path
+from typing import Any, Dict, List
+from zipfile import ZIP_BZIP2, ZIP_DEFLATED, ZIP_LZMA, ZIP_STORED, ZipFile
+
+import numpy as np
+import pytest
+from numpy.typing import NDArray
+
+from bioimageio.spec._internal.io_basics import ZipPath
+from bioimageio.spec._internal.io_utils import load_array
+
+ARRAYS: List[NDArray[Any]] = [
+    np.arange(24, dtype="float32").reshape(2, 3, 4),
+    np.asfortranarray(np.arange(24, dtype="uint16").reshape(2, 3, 4)),
+]
+
+
+@pytest.fixture(params=ARRAYS)
+def array(request: pytest.FixtureRequest) -> NDArray[Any]:
+    return request.param
+
+
+def _to_npy(array: NDArray[Any]) -> bytes:
+    buffer = io.BytesIO()
+    np.save(buffer, array)
+    return buffer.getvalue()
+
+
+def test_load_array_mmap_local_file(tmp_path: Path, array: NDArray[Any]):
+    path = tmp_path / "array.npy"
+    np.save(path, array)
+    loaded = load_array(path, mmap=True)
+    assert isinstance(loaded, np.memmap)
+    np.testing.assert_array_equal(loaded, array)
+
+
+def test_load_array_mmap_does_not_read_file(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+):
+    from bioimageio.spec._internal import io_utils
+
+    def fail(*args: Any, **kwargs: Any):
+        raise AssertionError("unexpected read")
+
+    path = tmp_path / "array.npy"
+    np.save(path, ARRAYS[0])
+    monkeypatch.setattr(io_utils, "get_reader", fail)
+    assert isinstance(load_array(path, mmap=True), np.memmap)
+
+
+def test_load_array_mmap_stored_zip_member(tmp_path: Path, array: NDArray[Any]):
+    path = tmp_path / "package.zip"
+    with ZipFile(path, "w", compression=ZIP_STORED) as zf:
+        zf.writestr("rdf.yaml", "a: 1")
+        zf.writestr("tensors/array.npy", _to_npy(array))
+
+    with ZipFile(path) as zf:
+        loaded = load_array(ZipPath(zf, "tensors/array.npy"), mmap=True)
+
+    assert isinstance(loaded, np.memmap)
+    np.testing.assert_array_equal(loaded, array)
+
+
+def test_load_array_mmap_falls_back_for_compressed_zip_member(
+    tmp_path: Path, array: NDArray[Any]
+):
+    path = tmp_path / "package.zip"
+    with ZipFile(path, "w", compression=ZIP_DEFLATED) as zf:
+        zf.writestr("array.npy", _to_npy(array))
+
+    with ZipFile(path) as zf:
+        loaded = load_array(ZipPath(zf, "array.npy"), mmap=True)
+
+    assert not isinstance(loaded, np.memmap)
+    np.testing.assert_array_equal(loaded, array)
+
+
+@pytest.mark.parametrize("compression", [ZIP_STORED, ZIP_DEFLATED, ZIP_BZIP2, ZIP_LZMA])
+@pytest.mark.parametrize("seekable", [True, False])
+@pytest.mark.parametrize("streaming", [False, True])
+def test_write_zip(
+    tmp_path: Path,
+    compression: int,
+    seekable: bool,
+    streaming: bool,
+    monkeypatch: pytest.MonkeyPatch,
+):
+    from bioimageio.spec._internal._settings import settings
+    from bioimageio.spec._internal.io_utils import compress_all, write_zip
+
+    monkeypatch.setattr(settings, "package_compression_workers", 2)
+    file = tmp_path / "weights.bin"
+    _ = file.write_bytes(os.urandom(1024 * 1024) + b"\0" * 512 * 1024)
+    content: Dict[str, Any] = {
+        "rdf.yaml": {"name": "näme", "nested": {"a": [1, 2]}},
+        "README.md": "# Readme",
+        "empty.txt": "",
+        **{f"weights{i}.bin": file for i in range(3)},
+    }
+
+    buffer = io.BytesIO() if seekable else _NonSeekable()
+    _ = write_zip(
+        buffer,
+        content,
+        compression=compression,
+        compression_level=1,
+        compression_policy=compress_all,
+        streaming=streaming,
+    )
+    with ZipFile(io.BytesIO(buffer.getvalue())) as zf:
+        assert zf.testzip() is None
+        assert zf.namelist() == list(content)
+        assert all(info.compress_type == compression for info in zf.infolist())
+        assert zf.read("README.md") == b"# Readme"
+        assert zf.read("empty.txt") == b""
+        assert b"n\xc3\xa4me" in zf.read("rdf.yaml")
+        for i in range(3):
+            assert zf.read(f"weights{i}.bin") == file.read_bytes()
+
+
+def test_write_zip_with_default_compression_policy(tmp_path: Path):
+    from bioimageio.spec._internal.io_utils import write_zip
+
+    random = tmp_path / "weights.pt"
+    _ = random.write_bytes(os.urandom(128 * 1024))
+    zeros = tmp_path / "zeros.bin"
+    _ = zeros.write_bytes(b"\0" * 128 * 1024)
+    npy = tmp_path / "test_input.npy"
+    np.save(npy, np.zeros((256, 256), dtype="float32"))
+    content: Dict[str, Any] = {
+        "rdf.yaml": {"name": "packaged"},
+        "cover.png": zeros,
+        "test_input.npy": npy,
+        "weights.pt": random,
+        "zeros.bin": zeros,
+    }
+    path = tmp_path / "package.zip"
+    _ = write_zip(path, content, compression=ZIP_DEFLATED, compression_level=1)
+    with ZipFile(path) as zf:
+        assert zf.testzip() is None
+        assert {i.filename: i.compress_type for i in zf.infolist()} == {
+            "rdf.yaml": ZIP_DEFLATED,
+            "cover.png": ZIP_STORED,
+            "test_input.npy": ZIP_STORED,
+            "weights.pt": ZIP_STORED,
+            "zeros.bin": ZIP_DEFLATED,
+        }
+        assert zf.read("weights.pt") == random.read_bytes()
+        assert isinstance(
+            load_array(ZipPath(zf, "test_input.npy"), mmap=True), np.memmap
+        )
+
+
+def test_zipfile_internals_to_append_compressed_members():
+    from bioimageio.spec._internal.io_utils import (
+        _can_append_compressed_members,  # pyright: ignore[reportPrivateUsage]
+    )
+
+    # members compressed in advance are appended with `ZipFile` internals
+    # (falling back to sequential compression without them)
+    with ZipFile(io.BytesIO(), "w") as zf:
+        assert _can_append_compressed_members(zf)
+
+
+@pytest.mark.parametrize("can_append", [True, False])
+def test_write_zip_copies_members(
+    tmp_path: Path, can_append: bool, monkeypatch: pytest.MonkeyPatch
+):
+    import hashlib
+
+    from bioimageio.spec._internal import io_utils
+    from bioimageio.spec._internal.io_utils import (
+        CompressedZipMember,
+        compress_all,
+        write_zip,
+    )
+
+    def cannot_append(zip: ZipFile) -> bool:
+        return False
+
+    if not can_append:
+        monkeypatch.setattr(io_utils, "_can_append_compressed_members", cannot_append)
+
+    data = b"data" * 1024
+    src = tmp_path / "previous.zip"
+    with ZipFile(src, "w", compression=ZIP_DEFLATED) as zf:
+        zf.writestr("data.bin", data)
+        info = zf.getinfo("data.bin")
+
+    path = tmp_path / "package.zip"
+    written = write_zip(
+        path,
+        {"rdf.yaml": "a: 1", "data.bin": CompressedZipMember(src, info)},
+        compression=ZIP_DEFLATED,
+        compression_level=1,
+        compression_policy=compress_all,
+    )
+    assert written["data.bin"] == hashlib.sha256(data).hexdigest()
+    with ZipFile(path) as zf:
+        assert zf.testzip() is None
+        assert zf.read("data.bin") == data
+        assert zf.read("rdf.yaml") == b"a: 1"
+
+
+class _NonSeekable(io.BytesIO):
+    def seek(self, *args: Any, **kwargs: Any) -> int:
+        raise io.UnsupportedOperation("seek")
@@ -0,0 +1,124 @@
+from pathlib import Path
+from typing import Dict, Optional
+
+import httpx
+import pytest
+from respx import MockRouter
+
+BASE = "https://mock_example.com/artifacts"
+
+
+@pytest.fixture(autouse=True)
+def memory_cache(isolated_cache_path: Path, monkeypatch: pytest.MonkeyPatch):
+    from genericache import MemoryCache
+    from genericache.digest import UrlDigest
+
+    from bioimageio.spec._internal._settings import settings
+
+    monkeypatch.setattr(
+        settings, "disk_cache", MemoryCache(url_hasher=UrlDigest.from_str)
+    )
+
+
+@pytest.mark.parametrize(
+    "url,rules,expected",
+    [
+        (
+            "https://zenodo.org/records/1/files/a.pt",
+            {},
+            "m/zenodo.org/records/1/files/a.pt",
+        ),
+        ("https://zenodo.org/records/1/files/a.pt?download=1", {}, None),
+        ("https://zenodo.org/records/../../a.pt", {}, None),
+        (
+            "https://zenodo.org/records/1/files/a.pt",
+            {"https://zenodo.org/records/": "zenodo"},
+            "m/zenodo/1/files/a.pt",
+        ),
+        (
+            "https://zenodo.org/records/1/files/a.pt",
+            {"https://zenodo.org/": "file:///data/z"},
+            "/data/z/records/1/files/a.pt",
+        ),
+    ],
+)
+def test_get_mirror_path(
+    url: str,
+    rules: Dict[str, str],
+    expected: Optional[str],
+    monkeypatch: pytest.MonkeyPatch,
+):
+    from bioimageio.spec._internal._settings import settings
+    from bioimageio.spec._internal.mirror import get_mirror_path
+
+    monkeypatch.setattr(settings, "mirror_rules", rules)
+    actual = get_mirror_path(url, Path("m"))
+    assert actual == (None if expected is None else Path(expected))
+
+
+def test_get_reader_from_mirror(
+    tmp_path: Path, respx_mock: MockRouter, monkeypatch: pytest.MonkeyPatch
+):
+    from bioimageio.spec._internal._settings import settings
+    from bioimageio.spec._internal.io import get_reader
+    from bioimageio.spec._internal.url import RootHttpUrl
+
+    mirrored = tmp_path / "mirror" / "mock_example.com" / "files" / "a.txt"
+    mirrored.parent.mkdir(parents=True)
+    _ = mirrored.write_bytes(b"mirrored")
+    monkeypatch.setattr(settings, "mirror", tmp_path / "mirror")
+
+    # no routes are mocked, so any request would fail
+    reader = get_reader("https://mock_example.com/files/a.txt")
+    assert reader.read() == b"mirrored"
+    assert reader.original_root == RootHttpUrl("https://mock_example.com/files")
+    assert len(respx_mock.calls) == 0
+
+
+def test_mirror_collection(
+    tmp_path: Path, respx_mock: MockRouter, monkeypatch: pytest.MonkeyPatch
+):
+    from bioimageio.spec import InvalidDescr, load_description, mirror_collection
+    from bioimageio.spec._internal._settings import settings
+    from bioimageio.spec._internal.io_utils import get_id_map
+
+    rdf = (
+        "format_version: 0.3.0\n"
+        "type: generic\n"
+        "name: mirrored\n"
+        "description: a mirrored resource\n"
+        "authors: [{name: Me}]\n"
+        "cite: [{text: lala, url: 'https://example.com/'}]\n"
+        "license: MIT\n"
+        "documentation: README.md\n"
+    )
+    id_map_url = "https://mock_example.com/id_map.json"
+    monkeypatch.setattr(settings, "id_map", id_map_url)
+    monkeypatch.setattr(settings, "resolve_draft", False)
+    monkeypatch.setattr(
+        settings, "collection_http_pattern", BASE + "/{bioimageio_id}/files/rdf.yaml"
+    )
+    routes = [
+        respx_mock.get(id_map_url).mock(httpx.Response(200, content=b"{}")),
+        respx_mock.get(f"{BASE}/my-id/files/rdf.yaml").mock(
+            httpx.Response(200, content=rdf.encode())
+        ),
+        respx_mock.get(f"{BASE}/my-id/files/README.md").mock(
+            httpx.Response(200, content=b"# Mirrored")
+        ),
+    ]
+
+    mirror = tmp_path / "mirror"
+    mirrored = mirror_collection(["my-id"], mirror)
+    assert mirrored[f"{BASE}/my-id/files/README.md"] == (
+        mirror / "mock_example.com" / "artifacts" / "my-id" / "files" / "README.md"
+    )
+    assert (mirror / "mock_example.com" / "id_map.json").read_bytes() == b"{}"
+    assert [len(r.calls) for r in routes] == [1, 1, 1]
+
+    monkeypatch.setattr(settings, "mirror", mirror)
+    get_id_map.cache_clear()
+    descr = load_description("my-id", perform_io_checks=True)
+    assert not isinstance(descr, InvalidDescr), descr.validation_summary.format()
+    assert descr.name == "mirrored"
+    assert [len(r.calls) for r in routes] == [1, 1, 1]
@@ -6,6 +6,8 @@ from respx import MockRouter
 
 from bioimageio.spec._internal.validation_context import ValidationContext
 
+pytestmark = pytest.mark.usefixtures("isolated_cache_path")
+
 
 @pytest.mark.parametrize(
     "url",
@@ -98,3 +100,44 @@ def test_httpurl_invalid(url: str):
 
     with pytest.raises(ValueError), ValidationContext(perform_io_checks=False):
         _ = HttpUrl(url)
+
+
+def test_url_check_is_cached(respx_mock: MockRouter):
+    from bioimageio.spec._internal.url import HttpUrl
+
+    url = "https://mock_example.com/cached"
+    route = respx_mock.head(url).mock(httpx.Response(status_code=200))
+    for _ in range(2):
+        with ValidationContext(perform_io_checks=True):
+            assert HttpUrl(url).exists()
+
+    assert len(route.calls) == 1
+
+    with ValidationContext(perform_io_checks=True, disable_cache=True):
+        assert HttpUrl(url).exists()
+
+    assert len(route.calls) == 2
+
+
+def test_expired_url_check_is_refreshed_conditionally(respx_mock: MockRouter):
+    from bioimageio.spec._internal._settings import settings
+    from bioimageio.spec._internal.url import (
+        UrlCheck,
+        _check_url,  # pyright: ignore[reportPrivateUsage]
+        _get_url_check_store,  # pyright: ignore[reportPrivateUsage]
+    )
+
+    url = "https://mock_example.com/expired"
+    expired = UrlCheck(
+        request_mode="head", status_code=200, reason="OK", etag='"v1"', timestamp=0
+    )
+    _get_url_check_store(settings.cache_path).set(url, expired)
+    route = respx_mock.head(url, headers={"If-None-Match": '"v1"'}).mock(
+        httpx.Response(status_code=304)
+    )
+
+    check = _check_url(url, timeout=settings.http_timeout)
+    assert len(route.calls) == 1
+    assert check.status_code == 200
+    assert check.etag == '"v1"'
+    assert check.timestamp > 0
@@ -0,0 +1,90 @@
+import json
+from pathlib import Path
+from typing import Any, List
+
+import pytest
+
+from bioimageio.spec._internal._settings import settings
+
+RDF = """type: dataset
+format_version: 0.3.0
+name: test dataset
+description: a test dataset
+cite:
+  - text: test
+    doi: 10.1234/test
+license: MIT
+attachments:
+  - source: data.txt
+"""
+
+
+def test_validation_cache(tmp_path: Path, monkeypatch: pytest.MonkeyPatch):
+    from bioimageio.spec import load_description
+    from bioimageio.spec.dataset import DatasetDescr
+
+    monkeypatch.setattr(settings, "validation_cache", True)
+    monkeypatch.setattr(settings, "cache_path", tmp_path / "cache")
+    rdf = tmp_path / "rdf" / "rdf.yaml"
+    rdf.parent.mkdir()
+    _ = rdf.write_text(RDF, encoding="utf-8")
+    _ = (rdf.parent / "data.txt").write_text("hello", encoding="utf-8")
+
+    descr = load_description(rdf, perform_io_checks=True)
+    assert isinstance(descr, DatasetDescr)
+
+    def fail(*args: Any, **kwargs: Any):
+        raise AssertionError("unexpected validation")
+
+    monkeypatch.setattr("bioimageio.spec._io.build_description", fail)
+    cached = load_description(rdf, perform_io_checks=True)
+    assert isinstance(cached, DatasetDescr)
+    assert cached == descr
+    assert cached.root == rdf.parent
+    assert cached.validation_summary.status == descr.validation_summary.status
+
+    # a changed referenced file invalidates the cached result
+    _ = (rdf.parent / "data.txt").write_text("changed", encoding="utf-8")
+    with pytest.raises(AssertionError, match="unexpected validation"):
+        _ = load_description(rdf, perform_io_checks=True)
+
+
+def test_validation_cache_entries_are_json(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+):
+    from bioimageio.spec import build_description, load_description
+
+    monkeypatch.setattr(settings, "validation_cache", True)
+    monkeypatch.setattr(settings, "cache_path", tmp_path / "cache")
+    rdf = tmp_path / "rdf" / "rdf.yaml"
+    rdf.parent.mkdir()
+    _ = rdf.write_text(RDF, encoding="utf-8")
+    _ = (rdf.parent / "data.txt").write_text("hello", encoding="utf-8")
+    _ = load_description(rdf, perform_io_checks=True)
+
+    (entry_file,) = (settings.cache_path / "validation").glob("*.json")
+    entry = json.loads(entry_file.read_text(encoding="utf-8"))
+    assert entry["descr_class"] == "bioimageio.spec.dataset.v0_3.DatasetDescr"
+    assert entry["descr"]["name"] == "test dataset"
+
+    # an entry of a class that is not a resource description is ignored
+    entry["descr_class"] = "builtins.object"
+    _ = entry_file.write_text(json.dumps(entry), encoding="utf-8")
+    calls: List[Any] = []
+
+    def record_build_description(*args: Any, **kwargs: Any):
+        calls.append(args)
+        return build_description(*args, **kwargs)
+
+    monkeypatch.setattr(
+        "bioimageio.spec._io.build_description", record_build_description
+    )
+    _ = load_description(rdf, perform_io_checks=True)
+    assert len(calls) == 1
+
+    # settings affecting validation are part of the cache key
+    _ = load_description(rdf, perform_io_checks=True)
+    assert len(calls) == 1
+    monkeypatch.setattr(settings, "allow_pickle", not settings.allow_pickle)
+    _ = load_description(rdf, perform_io_checks=True)
+    assert len(calls) == 2
@@ -0,0 +1,73 @@
+import json
+from pathlib import Path
+
+import pytest
+
+from bioimageio.spec._internal._settings import settings
+from bioimageio.spec._internal.yaml_loader import load_yaml
+from tests.conftest import EXAMPLE_DESCRIPTIONS
+
+
+def _load_with_ruyaml(data: str, monkeypatch: pytest.MonkeyPatch):
+    with monkeypatch.context() as m:
+        m.setattr(settings, "yaml_loader", "ruyaml")
+        return load_yaml(data)
+
+
+@pytest.mark.parametrize(
+    "path",
+    sorted(EXAMPLE_DESCRIPTIONS.glob("**/*.yaml")),
+    ids=lambda p: p.relative_to(EXAMPLE_DESCRIPTIONS).as_posix(),
+)
+def test_yaml_loader_parity(path: Path, monkeypatch: pytest.MonkeyPatch):
+    data = path.read_text(encoding="utf-8")
+    expected = _load_with_ruyaml(data, monkeypatch)
+    assert load_yaml(data) == expected
+    assert load_yaml(data.encode("utf-8")) == expected
+    json_data = json.dumps(expected, default=str)
+    assert load_yaml(json_data) == _load_with_ruyaml(json_data, monkeypatch)
+
+
+@pytest.mark.parametrize(
+    "value",
+    [
+        "yes",
+        "on",
+        "True",
+        "017",
+        "0o17",
+        "0x1F",
+        "1_000",
+        "1e3",
+        "+.5",
+        "-.inf",
+        ".NaN",
+        "1:20",
+        "~",
+        "",
+        "2019-12-11",
+        "2019-12-11T12:22:32+01:00",
+        "'quoted'",
+        "[1, a]",
+        "{a: 1}",
+    ],
+)
+def test_yaml_loader_scalar_parity(value: str, monkeypatch: pytest.MonkeyPatch):
+    data = f"a: {value}\nb: &anchor {{c: {value}}}\nd: *anchor\n"
+    assert repr(load_yaml(data)) == repr(_load_with_ruyaml(data, monkeypatch))
+
+
+@pytest.mark.parametrize(
+    "data", ["a: 1\na: 2\n", '{"a": 1, "a": 2}', "%YAML 1.1\n---\na: [\n"]
+)
+def test_yaml_loader_errors(data: str, monkeypatch: pytest.MonkeyPatch):
+    with pytest.raises(Exception) as expected:
+        _ = _load_with_ruyaml(data, monkeypatch)
+
+    with pytest.raises(type(expected.value)):
+        _ = load_yaml(data)
+
+
+def test_yaml_1_1_directive(monkeypatch: pytest.MonkeyPatch):
+    data = "%YAML 1.1\n---\na: yes\n"
+    assert load_yaml(data) == _load_with_ruyaml(data, monkeypatch) == {"a": True}
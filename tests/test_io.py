@@ -1,3 +1,4 @@
+import asyncio
 from pathlib import Path
 
 import pytest
@@ -58,3 +59,25 @@ def test_load_dataset_description(covid_if_dataset_path: Path, tmp_path: Path):
     dataset_descr2 = load_dataset_description(tmp_path / "dataset.yaml")
     assert isinstance(dataset_descr2, DatasetDescr)  # we cannot expect
     assert dataset_descr.model_dump() == dataset_descr2.model_dump()
+
+
+def test_aload_dataset_description(covid_if_dataset_path: Path):
+    from bioimageio.spec import aload_dataset_description, load_dataset_description
+
+    dataset_descr = asyncio.run(aload_dataset_description(covid_if_dataset_path))
+    expected = load_dataset_description(covid_if_dataset_path)
+    assert dataset_descr.model_dump() == expected.model_dump()
+
+
+def test_peek_description(unet2d_path: Path):
+    from bioimageio.spec import load_description, peek_description
+    from bioimageio.spec.model import ModelDescr
+
+    fields = ["type", "id", "name", "version", "format_version", "tags", "covers"]
+    peeked = peek_description(unet2d_path, fields)
+    descr = load_description(unet2d_path, perform_io_checks=False)
+    assert isinstance(descr, ModelDescr)
+    assert peeked == {f: getattr(descr, f) for f in fields}
+
+    with pytest.raises(ValueError, match="'inputs_' is not a field of ModelDescr"):
+        _ = peek_description(unet2d_path, ["inputs_"])
@@ -1,7 +1,11 @@
 import io
+import os
 import shutil
+import zipfile
 from pathlib import Path
+from typing import IO, Any, Dict, List, Optional, cast
 
+import pytest
 from deepdiff.diff import DeepDiff
 
 from bioimageio.spec.model import v0_5
@@ -84,3 +88,215 @@ def test_save_bioimageio_package_as_folder(unet2d_path: Path, tmp_path: Path):
     reloaded_model = load_description(altered_package)
     assert isinstance(reloaded_model, v0_5.ModelDescr)
     assert str(reloaded_model.documentation).startswith("copy_")
+
+
+def _write_generic_rdf(folder: Path) -> Path:
+    """write a generic resource with a 1 MiB attachment 'data.bin'"""
+    from bioimageio.spec.utils import get_sha256
+
+    data = folder / "data.bin"
+    _ = data.write_bytes(os.urandom(1024 * 1024))
+    _ = (folder / "README.md").write_text("# Packaged")
+    rdf = folder / "rdf.yaml"
+    rdf_lines = [
+        "format_version: 0.3.0",
+        "type: generic",
+        "name: packaged",
+        "description: a packaged resource",
+        "authors: [{name: Me}]",
+        "cite: [{text: lala, url: 'https://example.com/'}]",
+        "license: MIT",
+        "documentation: README.md",
+        f"attachments: [{{source: data.bin, sha256: {get_sha256(data)}}}]",
+    ]
+    _ = rdf.write_text("\n".join(rdf_lines))
+    return rdf
+
+
+def test_save_bioimageio_package_validates_without_rereading(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+):
+    from bioimageio.spec import (
+        InvalidDescr,
+        _package,  # pyright: ignore[reportPrivateUsage]
+        load_description,
+        save_bioimageio_package,
+    )
+
+    rdf = _write_generic_rdf(tmp_path)
+    read_after_writing: List[int] = []
+    write_zip = _package.write_zip
+    read = zipfile.ZipExtFile.read
+
+    def write_zip_and_count_reads(*args: Any, **kwargs: Any):
+        ret = write_zip(*args, **kwargs)
+
+        def counting_read(self: zipfile.ZipExtFile, n: Optional[int] = -1) -> bytes:
+            chunk = read(self, n)
+            read_after_writing.append(len(chunk))
+            return chunk
+
+        monkeypatch.setattr(zipfile.ZipExtFile, "read", counting_read)
+        return ret
+
+    monkeypatch.setattr(_package, "write_zip", write_zip_and_count_reads)
+    package_path = save_bioimageio_package(rdf, output_path=tmp_path / "package.zip")
+    assert sum(read_after_writing) < 1024  # only the bioimageio.yaml was read
+    monkeypatch.undo()
+
+    descr = load_description(package_path)
+    assert not isinstance(descr, InvalidDescr), descr.validation_summary.format()
+
+
+def test_save_bioimageio_package_detects_sha256_mismatch():
+    from bioimageio.spec._internal.io_basics import Sha256
+    from bioimageio.spec._package import (
+        _get_sha256_mismatches,  # pyright: ignore[reportPrivateUsage]
+    )
+
+    expected = Sha256("0" * 64)
+    actual = Sha256("1" * 64)
+    content: Dict[str, Any] = {
+        "rdf.yaml": {"attachments": [{"source": "data.bin", "sha256": str(expected)}]}
+    }
+    assert _get_sha256_mismatches(content, {"data.bin": expected}) == []
+    assert _get_sha256_mismatches(content, {"data.bin": actual}) == [
+        f"Sha256 mismatch for data.bin. Expected {expected}, got {actual}."
+    ]
+    assert _get_sha256_mismatches(content, {}) == ["data.bin is missing."]
+
+
+class _WriteOnlyStream:
+    """a minimal non-seekable sink, e.g. an HTTP response body"""
+
+    def __init__(self):
+        super().__init__()
+        self.data = bytearray()
+
+    def write(self, b: bytes) -> int:
+        self.data.extend(b)
+        return len(b)
+
+    def flush(self):
+        pass
+
+
+def test_save_bioimageio_package_to_non_seekable_stream(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+):
+    from bioimageio.spec import save_bioimageio_package_to_stream
+    from bioimageio.spec._internal import io_utils
+
+    rdf = _write_generic_rdf(tmp_path)
+    stream = _WriteOnlyStream()
+    written_when_opened: Dict[str, int] = {}
+    get_reader = io_utils.get_reader
+
+    def recording_get_reader(source: Any, **kwargs: Any):
+        reader = get_reader(source, **kwargs)
+        written_when_opened[reader.original_file_name] = len(stream.data)
+        return reader
+
+    monkeypatch.setattr(io_utils, "get_reader", recording_get_reader)
+    _ = save_bioimageio_package_to_stream(rdf, output_stream=cast(IO[bytes], stream))
+
+    # files are opened one after the other while writing the package
+    assert list(written_when_opened) == ["rdf.yaml", "data.bin", "README.md"]
+    assert written_when_opened["data.bin"] == 0
+    assert written_when_opened["README.md"] > 1024 * 1024  # after data.bin
+
+    with zipfile.ZipFile(io.BytesIO(stream.data)) as zf:
+        assert zf.testzip() is None
+        assert all(info.flag_bits & 0x08 for info in zf.infolist())  # data descriptors
+        assert zf.read("data.bin") == (tmp_path / "data.bin").read_bytes()
+
+
+@pytest.mark.parametrize("overwrite", [False, True])
+def test_save_bioimageio_package_reuses_previous_package(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch, overwrite: bool
+):
+    from bioimageio.spec import InvalidDescr, load_description, save_bioimageio_package
+    from bioimageio.spec._internal import io_utils
+    from bioimageio.spec._internal.io_utils import compress_all
+
+    rdf = _write_generic_rdf(tmp_path)
+    previous = save_bioimageio_package(
+        rdf, output_path=tmp_path / "v1.zip", compression_policy=compress_all
+    )
+    with zipfile.ZipFile(previous) as zf:
+        previous_data = zf.getinfo("data.bin")
+
+    descr = load_description(previous)
+    assert not isinstance(descr, InvalidDescr)
+    descr.name = "updated"
+
+    compress_member = io_utils._compress_member  # pyright: ignore[reportPrivateUsage]
+
+    def compress_member_except_data(arc_name: str, *args: Any):
+        assert arc_name != "data.bin", "data.bin should not be recompressed"
+        return compress_member(arc_name, *args)
+
+    monkeypatch.setattr(io_utils, "_compress_member", compress_member_except_data)
+    updated = save_bioimageio_package(
+        descr,
+        output_path=previous if overwrite else tmp_path / "v2.zip",
+        previous_package=previous,
+    )
+    monkeypatch.undo()
+
+    with zipfile.ZipFile(updated) as zf:
+        assert zf.testzip() is None
+        data = zf.getinfo("data.bin")
+        # copied as is (the default compression policy would store random data)
+        assert data.compress_type == zipfile.ZIP_DEFLATED
+        assert (data.CRC, data.compress_size) == (
+            previous_data.CRC,
+            previous_data.compress_size,
+        )
+
+    reloaded = load_description(updated)
+    assert not isinstance(reloaded, InvalidDescr), reloaded.validation_summary.format()
+    assert reloaded.name == "updated"
+
+
+def test_save_bioimageio_package_removes_temporary_file_on_failure(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+):
+    from bioimageio.spec import save_bioimageio_package
+
+    rdf = _write_generic_rdf(tmp_path)
+    previous = save_bioimageio_package(rdf, output_path=tmp_path / "v1.zip")
+    previous_content = previous.read_bytes()
+
+    def failing_write_zip(path: Path, *args: Any, **kwargs: Any):
+        _ = path.write_bytes(b"incomplete")
+        raise RuntimeError("write failed")
+
+    monkeypatch.setattr("bioimageio.spec._package.write_zip", failing_write_zip)
+    with pytest.raises(RuntimeError, match="write failed"):
+        _ = save_bioimageio_package(
+            rdf, output_path=previous, previous_package=previous
+        )
+
+    assert not (tmp_path / f".{previous.name}.tmp").exists()
+    assert previous.read_bytes() == previous_content
+
+
+def test_save_bioimageio_package_verifies_copied_members(tmp_path: Path):
+    from bioimageio.spec import save_bioimageio_package
+
+    rdf = _write_generic_rdf(tmp_path)
+    previous = save_bioimageio_package(rdf, output_path=tmp_path / "v1.zip")
+    # a previous package with a mislabeled (e.g. corrupted) member
+    mislabeled = tmp_path / "mislabeled.zip"
+    with zipfile.ZipFile(previous) as src, zipfile.ZipFile(mislabeled, "w") as dst:
+        for info in src.infolist():
+            if info.filename == "data.bin":
+                dst.writestr(info.filename, os.urandom(info.file_size))
+            else:
+                dst.writestr(info.filename, src.read(info))
+
+    with pytest.raises(ValueError, match="Sha256 mismatch for data.bin"):
+        _ = save_bioimageio_package(
+            rdf, output_path=tmp_path / "v2.zip", previous_package=mislabeled
+        )
@@ -36,6 +36,7 @@ IGNORE_MEMBERS = {
     "GenericModelDescrBase",
     "get_args",
     "get_validation_context",
+    "hotfix_github_user",
     "httpx",
     "include_in_package_serializer",
     "include_in_package",
@@ -85,6 +86,7 @@ IGNORE_MEMBERS = {
     "validate_suffix",
     "ValidatedString",
     "ValidationInfo",
+    "verify_github_users",
     "warn",
     "WithSuffix",
     "wo_special_file_name",
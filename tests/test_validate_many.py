@@ -0,0 +1,79 @@
+import multiprocessing
+from pathlib import Path
+from typing import Iterator, List, Literal
+
+import pytest
+
+
+@pytest.mark.parametrize("executor", ["process", "thread"])
+def test_validate_many(
+    unet2d_path: Path,
+    covid_if_dataset_path: Path,
+    executor: Literal["process", "thread"],
+):
+    from bioimageio.spec import validate_many
+
+    missing = Path("some/none/existing/path/to/rdf.yaml")
+    sources = [unet2d_path, covid_if_dataset_path, missing]
+    results = dict(
+        validate_many(sources, workers=2, executor=executor, perform_io_checks=False)
+    )
+
+    assert set(results) == set(sources)
+    assert results[unet2d_path].status == "valid-format"
+    assert results[covid_if_dataset_path].status == "valid-format"
+    assert results[missing].status == "failed"
+    assert results[missing].errors[0].type == "FileNotFoundError"
+
+
+def test_validate_many_fail_fast(unet2d_path: Path):
+    from bioimageio.spec import validate_many
+
+    consumed: List[Path] = []
+
+    def sources() -> Iterator[Path]:
+        for i in range(10):
+            consumed.append(p := Path(f"missing{i}/rdf.yaml"))
+            yield p
+
+        yield unet2d_path
+
+    results = list(
+        validate_many(
+            sources(),
+            workers=1,
+            executor="thread",
+            max_in_flight=2,
+            fail_fast=True,
+            perform_io_checks=False,
+        )
+    )
+
+    assert [s for s, _ in results] == [Path("missing0/rdf.yaml")]
+    assert len(consumed) == 2
+
+
+def _get_worker_state():
+    from bioimageio.spec._internal._settings import settings
+
+    return (
+        multiprocessing.get_start_method(),
+        settings.http_timeout,
+        "http_client" in vars(settings),
+    )
+
+
+def test_worker_processes_are_spawned_with_current_settings(
+    monkeypatch: pytest.MonkeyPatch,
+):
+    from bioimageio.spec._internal._settings import settings
+    from bioimageio.spec._validate_many import (
+        _create_process_pool,  # pyright: ignore[reportPrivateUsage]
+    )
+
+    monkeypatch.setattr(settings, "http_timeout", 123.0)
+    _ = settings.http_client  # not to be inherited by worker processes
+    with _create_process_pool(1) as pool:
+        state = pool.submit(_get_worker_state).result()
+
+    assert state == ("spawn", 123.0, False)